@@ -1,23 +1,87 @@
 # app/__init__.py
+import os
 from flask import Flask, render_template
-from flask_login import LoginManager, current_user, login_required
+from flask_login import LoginManager, current_user
+from flask_migrate import Migrate
 from config import Config
 
 login_manager = LoginManager()
+migrate = Migrate()
 
 @login_manager.user_loader
 def load_user(user_id):
     # 함수 내부에서 import하여 순환 import 방지
-    from app.models import User
-    return User.query.get(int(user_id))
+    from app.identity import identity_cache
+    return identity_cache.load(int(user_id))
 
 def create_app():
     app = Flask(__name__)
     app.config.from_object(Config)
     
     # DB 초기화 (늦은 import)
+    from app import engine
     from app.models import db
+    engine.configure(app)
     db.init_app(app)
+    engine.init_app(app)
+    
+    # 스키마 마이그레이션 (flask db upgrade, flask check-query-plans)
+    from app import schema
+    migrate.init_app(app, db, directory=os.path.join(os.path.dirname(app.root_path), 'migrations'),
+                     render_as_batch=True)
+    schema.init_app(app)
+    
+    # 멤버/사용자 전문 검색 색인 (flask search-rebuild)
+    from app import search
+    search.init_app(app)
+    
+    # 그룹 멤버 수 비정규화 컬럼 (flask verify-member-counts)
+    from app import member_counts
+    member_counts.init_app(app)
+    
+    # 비밀번호 해싱 워커 풀
+    from app import hashing
+    hashing.init_app(app)
+    
+    # 요청별 처리 시간 / SQL / 템플릿 계측
+    from app import metrics
+    metrics.init_app(app)
+    
+    # 개발/CI용 N+1 감지와 쿼리 예산 (QUERY_WATCH)
+    from app import querywatch
+    querywatch.init_app(app)
+    
+    # 관리자가 켜는 요청 프로파일러
+    from app import profiler
+    profiler.init_app(app)
+    
+    # 템플릿 바이트코드 캐시 (flask warm-templates)
+    from app import startup
+    startup.init_app(app)
+    
+    # 빌드된 정적 파일 (flask build-assets)
+    from app import assets
+    assets.init_app(app)
+    
+    # 데이터 버전 기반 페이지 캐시
+    from app import pagecache
+    pagecache.init_app(app)
+    
+    # 읽기 전용 화면용 명단 스냅샷 (커밋 후 백그라운드에서 다시 만듦)
+    from app import snapshot
+    snapshot.init_app(app)
+    
+    # 하위 시스템용 변경 피드 (/admin/changes)
+    from app import changefeed
+    changefeed.init_app(app)
+    
+    # 오래 걸리는 관리자 작업용 백그라운드 작업 (flask run-jobs)
+    from app import jobs
+    jobs.init_app(app)
+    
+    # 로그인/회원가입 요청 제한
+    from app import ratelimit
+    ratelimit.init_app(app)
     
     # 로그인 매니저 초기화
     login_manager.init_app(app)
@@ -25,6 +89,18 @@ def create_app():
     login_manager.login_message = '로그인이 필요합니다.'
     login_manager.login_message_category = 'info'
     
+    # 사용자 캐시 설정 (사용자/멤버 커밋마다 모든 워커에서 무효화)
+    from app import identity
+    identity.init_app(app)
+    
+    # 권한 인덱스 초기화 (멤버/그룹 변경 시 세션 이벤트로 갱신)
+    from app import acl
+    acl.init_app(app)
+    
+    # 대시보드 통계 카운터 (세션 이벤트로 증분 갱신)
+    from app import stats
+    stats.init_app(app)
+    
     @app.context_processor
     def inject_user():
         return {
@@ -35,27 +111,14 @@ def create_app():
     # 블루프린트 등록 (늦은 import)
     from app.routes.auth import auth_bp
     from app.routes.admin import admin_bp
+    from app.routes.api import api_bp
     
     app.register_blueprint(auth_bp, url_prefix='/auth')
     app.register_blueprint(admin_bp, url_prefix='/admin')
+    app.register_blueprint(api_bp, url_prefix='/api/v1')
     
-    # 메인 라우트
-    from flask import Blueprint
-    main_bp = Blueprint('main', __name__)
-    
-    @main_bp.route('/')
-    def index():
-        return render_template('index0.html', title='동아리 홈페이지')
-    
-    @main_bp.route('/dashboard')
-    @login_required
-    def dashboard():
-        user_teams = current_user.get_teams()
-        return render_template('index.html',
-                             title='대시보드',
-                             teams=user_teams)
-    
-    
+    # 메인 라우트 (app/routes/main.py)
+    from app.routes.main import main_bp
     app.register_blueprint(main_bp)
     
     # 에러 핸들러
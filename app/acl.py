@@ -0,0 +1,181 @@
+# app/acl.py
+"""접근 권한 확인용 메모리 인덱스 (user_id → group_ids, member_id → group_id)"""
+import os
+from collections import Counter
+from threading import Lock
+
+from flask import current_app
+
+from app.pagecache import DataVersion
+
+# 이 테이블이 바뀌면 인덱스를 갱신함
+ACL_TABLES = ('group', 'member')
+
+# ACL_TABLES 커밋마다 올라가는 버전 (모든 워커가 instance 폴더의 같은 파일을 봄)
+acl_version = DataVersion()
+
+
+class AccessIndex:
+    """멤버/그룹 변경을 커밋 시점에 반영하는 권한 인덱스
+
+    다른 프로세스의 커밋은 acl_version이 인덱스를 만든 버전과 달라지는 것으로 알고 다시 만든다.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._version = None
+        self._groups = set()
+        self._members = {}      # member_id -> (user_id, group_id)
+        self._user_groups = {}  # user_id -> Counter(group_id)
+
+    # 조회 -----------------------------------------------------------
+
+    def has_group(self, group_id):
+        self._ensure_loaded()
+        return group_id in self._groups
+
+    def member_group(self, member_id):
+        """멤버의 그룹 id (없는 멤버면 None)"""
+        self._ensure_loaded()
+        record = self._members.get(member_id)
+        return record[1] if record else None
+
+    def user_groups(self, user_id):
+        """사용자가 속한 그룹 id 집합"""
+        self._ensure_loaded()
+        counter = self._user_groups.get(user_id)
+        return frozenset(counter) if counter else frozenset()
+
+    def can_access_group(self, user_id, group_id):
+        self._ensure_loaded()
+        counter = self._user_groups.get(user_id)
+        return bool(counter) and group_id in counter
+
+    # 갱신 -----------------------------------------------------------
+
+    def rebuild(self):
+        """DB에서 인덱스를 새로 만든다"""
+        from app.models import db, Group, Member
+        # 만드는 도중의 커밋은 다음 조회에서 잡히도록 버전을 먼저 읽음
+        version = acl_version.current()
+        groups = {group_id for (group_id,) in db.session.query(Group.id)}
+        members = {}
+        user_groups = {}
+        for member_id, user_id, group_id in db.session.query(Member.id, Member.user_id, Member.group_id):
+            members[member_id] = (user_id, group_id)
+            if user_id is not None:
+                user_groups.setdefault(user_id, Counter())[group_id] += 1
+        with self._lock:
+            self._groups = groups
+            self._members = members
+            self._user_groups = user_groups
+            self._version = version
+
+    def invalidate(self):
+        """다음 조회 때 다시 만들도록 표시"""
+        with self._lock:
+            self._version = None
+
+    def apply(self, changes, before, after):
+        """커밋된 변경 내역 반영 ((kind, op, values) 목록)
+
+        before/after는 이 커밋이 올리기 전후의 acl_version. 인덱스가 before 버전이 아니면
+        다른 워커의 변경을 놓친 것이므로 반영하지 않고 다음 조회 때 다시 만든다.
+        """
+        with self._lock:
+            if self._version is None or self._version != before:
+                self._version = None
+                return
+            self._version = after
+            for kind, op, values in changes:
+                if kind == 'group':
+                    if op == 'delete':
+                        self._groups.discard(values[0])
+                    else:
+                        self._groups.add(values[0])
+                else:
+                    self._remove_member(values[0])
+                    if op != 'delete':
+                        self._add_member(*values)
+
+    def _add_member(self, member_id, user_id, group_id):
+        self._members[member_id] = (user_id, group_id)
+        if user_id is not None:
+            self._user_groups.setdefault(user_id, Counter())[group_id] += 1
+
+    def _remove_member(self, member_id):
+        record = self._members.pop(member_id, None)
+        if record is None or record[0] is None:
+            return
+        counter = self._user_groups.get(record[0])
+        if counter is None:
+            return
+        counter[record[1]] -= 1
+        if counter[record[1]] <= 0:
+            del counter[record[1]]
+        if not counter:
+            del self._user_groups[record[0]]
+
+    def _ensure_loaded(self):
+        version = self._version
+        if version is None or version != acl_version.current():
+            self.rebuild()
+
+    def check_consistency(self):
+        """현재 인덱스와 DB를 비교해 차이를 반환"""
+        self._ensure_loaded()
+        with self._lock:
+            current = (set(self._groups), dict(self._members))
+        fresh = AccessIndex()
+        fresh.rebuild()
+        drift = {}
+        if current[0] != fresh._groups:
+            drift['groups'] = sorted(current[0] ^ fresh._groups)
+        if current[1] != fresh._members:
+            drift['members'] = sorted(k for k in current[1].keys() | fresh._members.keys()
+                                      if current[1].get(k) != fresh._members.get(k))
+        return drift
+
+
+access_index = AccessIndex()
+
+
+def _collect_changes(session):
+    """flush된 Member/Group 변경 (after_flush 시점에는 새 객체의 id도 정해져 있음)"""
+    from app.models import Group, Member
+    changes = []
+    for op, objects in (('upsert', session.new), ('upsert', session.dirty), ('delete', session.deleted)):
+        for obj in objects:
+            if isinstance(obj, Member):
+                changes.append(('member', op, (obj.id, obj.user_id, obj.group_id)))
+            elif isinstance(obj, Group):
+                changes.append(('group', op, (obj.id,)))
+    return changes
+
+
+def _after_commit(changes):
+    before = acl_version.current()
+    after = acl_version.bump()
+    if changes is None:
+        # 일괄 작업처럼 무엇이 바뀌었는지 모르면 다음 조회 때 다시 만듦
+        access_index.invalidate()
+    else:
+        access_index.apply(changes, before, after)
+
+
+def init_app(app):
+    """버전 파일 설정 및 커밋 알림 구독"""
+    from app import txevents
+    acl_version.configure(os.path.join(app.instance_path, 'acl_version'))
+    access_index.invalidate()
+    txevents.subscribe(ACL_TABLES, _after_commit, collect=_collect_changes)
+
+
+def acl_mode():
+    """'index' (인덱스 사용), 'db' (기존 방식), 'shadow' (둘 다 확인하고 기존 결과 사용)"""
+    return current_app.config.get('ACL_INDEX_MODE', 'index')
+
+
+def report_mismatch(check, key, indexed, expected):
+    current_app.logger.warning('ACL index mismatch on %s %s: index=%s db=%s',
+                               check, key, indexed, expected)
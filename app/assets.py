@@ -0,0 +1,147 @@
+# app/assets.py
+"""정적 파일 빌드 (내용 해시 파일명, 최소화, gzip/brotli 사전 압축, manifest) 및 서빙"""
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import re
+
+import click
+from flask import current_app, request, send_file
+from werkzeug.exceptions import NotFound
+from werkzeug.security import safe_join
+
+try:
+    import brotli
+except ImportError:  # brotli는 선택 사항
+    brotli = None
+
+DIST_DIR = 'dist'
+MANIFEST_NAME = 'manifest.json'
+
+# 빌드 대상 확장자
+ASSET_EXTENSIONS = ('.css', '.js', '.csv')
+
+# 해시된 파일은 내용이 바뀌면 이름도 바뀌므로 1년 동안 캐시
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+
+# 압축된 변형 (선호 순서)
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+
+def minify_css(source):
+    """주석과 불필요한 공백 제거"""
+    source = re.sub(r'/\*.*?\*/', '', source, flags=re.S)
+    source = re.sub(r'\s+', ' ', source)
+    source = re.sub(r'\s*([{};,>])\s*', r'\1', source)
+    source = re.sub(r':\s+', ':', source)
+    return source.replace(';}', '}').strip()
+
+
+def _read_asset(path):
+    with open(path, 'rb') as f:
+        data = f.read()
+    if path.endswith('.css'):
+        data = minify_css(data.decode('utf-8')).encode('utf-8')
+    return data
+
+
+def build_assets(static_dir):
+    """static_dir의 자산을 dist/ 아래에 빌드하고 manifest를 반환"""
+    dist_dir = os.path.join(static_dir, DIST_DIR)
+    os.makedirs(dist_dir, exist_ok=True)
+    manifest = {}
+
+    for root, dirs, files in os.walk(static_dir):
+        dirs[:] = [d for d in dirs if os.path.join(root, d) != dist_dir]
+        for filename in sorted(files):
+            if not filename.endswith(ASSET_EXTENSIONS):
+                continue
+            source = os.path.join(root, filename)
+            logical = os.path.relpath(source, static_dir).replace(os.sep, '/')
+            data = _read_asset(source)
+
+            digest = hashlib.sha256(data).hexdigest()[:12]
+            base, ext = os.path.splitext(logical)
+            hashed = f'{base}.{digest}{ext}'
+            target = os.path.join(dist_dir, hashed)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+
+            with open(target, 'wb') as f:
+                f.write(data)
+            with open(target + '.gz', 'wb') as f:
+                f.write(gzip.compress(data, compresslevel=9, mtime=0))
+            if brotli is not None:
+                with open(target + '.br', 'wb') as f:
+                    f.write(brotli.compress(data))
+
+            manifest[logical] = f'{DIST_DIR}/{hashed}'
+
+    with open(os.path.join(dist_dir, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+    return manifest
+
+
+def load_manifest(static_dir):
+    path = os.path.join(static_dir, DIST_DIR, MANIFEST_NAME)
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def serve_static(filename):
+    """dist/ 파일은 사전 압축본을 그대로 보내고 immutable 헤더를 붙임"""
+    app = current_app
+    if not filename.startswith(DIST_DIR + '/'):
+        return app.send_static_file(filename)
+
+    path = safe_join(app.static_folder, filename)
+    if path is None or not os.path.isfile(path):
+        raise NotFound()
+
+    mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    accepted = request.accept_encodings
+    encoding = None
+    for name, suffix in ENCODINGS:
+        if accepted[name] and os.path.isfile(path + suffix):
+            path, encoding = path + suffix, name
+            break
+
+    # send_file은 wsgi.file_wrapper를 사용하므로 서버가 지원하면 sendfile로 전송됨
+    response = send_file(path, mimetype=mimetype, conditional=True, max_age=IMMUTABLE_MAX_AGE)
+    if encoding:
+        response.content_encoding = encoding
+    response.vary.add('Accept-Encoding')
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
+
+
+@click.command('build-assets')
+def build_assets_command():
+    """app/static 자산을 해시 파일명 + 사전 압축본으로 빌드"""
+    manifest = build_assets(current_app.static_folder)
+    current_app.extensions['asset_manifest'] = manifest
+    for logical, hashed in sorted(manifest.items()):
+        click.echo(f'{logical} -> {hashed}')
+    if brotli is None:
+        click.echo('brotli 모듈이 없어 .br 파일은 만들지 않았습니다.')
+
+
+def init_app(app):
+    """manifest가 있으면 url_for('static')을 해시 파일명으로 바꾸고 서빙 함수를 교체"""
+    app.extensions['asset_manifest'] = load_manifest(app.static_folder) if app.config['ASSET_PIPELINE'] else {}
+    app.cli.add_command(build_assets_command)
+
+    @app.url_defaults
+    def hashed_static_url(endpoint, values):
+        if endpoint == 'static':
+            manifest = app.extensions['asset_manifest']
+            filename = values.get('filename')
+            if filename in manifest:
+                values['filename'] = manifest[filename]
+
+    app.view_functions['static'] = serve_static
@@ -0,0 +1,172 @@
+# app/bulk.py
+"""관리자 일괄 작업 (사용자 삭제/권한 토글, 멤버 이동, 그룹 삭제)
+
+id 목록을 UPDATE/DELETE 한두 번으로 처리하고 한 트랜잭션으로 커밋한다.
+ORM 세션 이벤트를 거치지 않으므로 커밋 후 메모리 캐시들을 직접 무효화한다.
+"""
+from collections import Counter
+
+from flask import current_app
+from sqlalchemy import delete, not_, select, update
+
+
+class BatchTooLarge(ValueError):
+    """요청한 id 수가 BULK_MAX_BATCH_SIZE (또는 parse_ids의 limit)를 넘음"""
+
+
+def parse_ids(req, limit=None):
+    """JSON {"ids": [...]} 또는 폼 ids (여러 값 또는 쉼표 구분)에서 중복 없는 id 목록
+
+    limit을 주지 않으면 BULK_MAX_BATCH_SIZE (app.jobs는 더 큰 JOBS_MAX_IDS를 씀)
+    """
+    payload = req.get_json(silent=True)
+    if isinstance(payload, dict):
+        raw = payload.get('ids') or []
+        if not isinstance(raw, list):
+            raise ValueError('ids는 목록이어야 합니다.')
+    else:
+        raw = [part for value in req.form.getlist('ids') for part in value.split(',') if part.strip()]
+
+    try:
+        ids = list(dict.fromkeys(int(value) for value in raw))
+    except (TypeError, ValueError):
+        raise ValueError('ids는 정수여야 합니다.') from None
+    if not ids:
+        raise ValueError('ids가 비어 있습니다.')
+
+    if limit is None:
+        limit = current_app.config['BULK_MAX_BATCH_SIZE']
+    if len(ids) > limit:
+        raise BatchTooLarge(f'한 번에 최대 {limit}개까지 처리할 수 있습니다.')
+    return ids
+
+
+def _results(ids, done, skipped=None):
+    """id별 처리 결과 (done/skipped: id -> 상태, 둘 다 없으면 not_found)"""
+    statuses = {**done, **(skipped or {})}
+    return {id_: statuses.get(id_, 'not_found') for id_ in ids}
+
+
+def summarize(results):
+    return {'results': {str(id_): status for id_, status in results.items()},
+            'counts': dict(Counter(results.values()))}
+
+
+def invalidate_caches(tables, user_ids=None):
+    """일괄 작업 커밋 후 세션 이벤트 대신 커밋 알림 구독자(캐시/인덱스/데이터 버전)를 직접 호출
+
+    ORM을 거치지 않고 쓰는 다른 모듈(app.loader)도 커밋 후 이 함수를 부른다.
+    """
+    from app import txevents
+    from app.identity import identity_cache
+
+    if user_ids is None:
+        identity_cache.clear()
+    else:
+        for user_id in user_ids:
+            identity_cache.invalidate(user_id)
+    txevents.committed(tables)
+
+
+def delete_users(ids, acting_user_id):
+    """사용자 일괄 삭제 (연결된 멤버는 남기고 user_id만 비움)"""
+    from app.models import db, User, Member
+    from app import changefeed, search
+
+    skipped = {acting_user_id: 'skipped_self'} if acting_user_id in ids else {}
+    targets = [id_ for id_ in ids if id_ not in skipped]
+    try:
+        unlinked = db.session.execute(
+            update(Member).where(Member.user_id.in_(targets)).values(user_id=None).returning(Member.id),
+            execution_options={'synchronize_session': False}).scalars().all()
+        deleted = set(db.session.execute(
+            delete(User).where(User.id.in_(targets)).returning(User.id),
+            execution_options={'synchronize_session': False}).scalars())
+        search.discard(db.session, 'user', deleted)
+        changefeed.record_upserts(db.session, 'member', unlinked)
+        changefeed.record_deletes(db.session, 'user', deleted)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    if deleted:
+        # 멤버의 user_id가 바뀌었으므로 사용자 캐시 전체 무효화
+        invalidate_caches(('user', 'member'))
+    return _results(ids, dict.fromkeys(deleted, 'deleted'), skipped)
+
+
+def toggle_admin(ids, acting_user_id, value=None):
+    """관리자 권한 일괄 변경 (value가 None이면 각자 반전)"""
+    from app.models import db, User
+    from app import changefeed
+
+    skipped = {acting_user_id: 'skipped_self'} if acting_user_id in ids else {}
+    targets = [id_ for id_ in ids if id_ not in skipped]
+    new_value = not_(User.is_admin) if value is None else bool(value)
+    try:
+        changed = {user_id: 'admin' if is_admin else 'user'
+                   for user_id, is_admin in db.session.execute(
+                       update(User).where(User.id.in_(targets)).values(is_admin=new_value)
+                       .returning(User.id, User.is_admin),
+                       execution_options={'synchronize_session': False})}
+        changefeed.record_upserts(db.session, 'user', changed)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    if changed:
+        invalidate_caches(('user',), changed.keys())
+    return _results(ids, changed, skipped)
+
+
+def move_members(ids, group_id):
+    """멤버들을 다른 그룹으로 일괄 이동 (그룹이 없으면 LookupError)"""
+    from app.models import db, Group, Member
+    from app import changefeed, member_counts
+
+    if db.session.execute(select(Group.id).where(Group.id == group_id)).first() is None:
+        raise LookupError(f'{group_id} 그룹이 없습니다.')
+    try:
+        sources = set(db.session.execute(
+            select(Member.group_id).where(Member.id.in_(ids)).distinct()).scalars())
+        moved = set(db.session.execute(
+            update(Member).where(Member.id.in_(ids)).values(group_id=group_id).returning(Member.id),
+            execution_options={'synchronize_session': False}).scalars())
+        if moved:
+            member_counts.recount(db.session, sources | {group_id})
+        changefeed.record_upserts(db.session, 'member', moved)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    if moved:
+        invalidate_caches(('group', 'member'))
+    return _results(ids, dict.fromkeys(moved, 'moved'))
+
+
+def delete_groups(ids):
+    """그룹과 소속 멤버를 일괄 삭제"""
+    from app.models import db, Group, Member
+    from app import changefeed, search
+
+    try:
+        deleted_members = list(db.session.execute(
+            delete(Member).where(Member.group_id.in_(ids)).returning(Member.id),
+            execution_options={'synchronize_session': False}).scalars())
+        deleted = set(db.session.execute(
+            delete(Group).where(Group.id.in_(ids)).returning(Group.id),
+            execution_options={'synchronize_session': False}).scalars())
+        search.discard(db.session, 'member', deleted_members)
+        changefeed.record_deletes(db.session, 'member', deleted_members)
+        changefeed.record_deletes(db.session, 'group', deleted)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    if deleted:
+        invalidate_caches(('group', 'member'))
+    return _results(ids, dict.fromkeys(deleted, 'deleted')), len(deleted_members)
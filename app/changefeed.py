@@ -0,0 +1,217 @@
+# app/changefeed.py
+"""하위 시스템(메일링 리스트, 출석 도구)용 증분 변경 피드
+
+카테고리/그룹/멤버/사용자 변경을 같은 트랜잭션 안에서 change_log에 추가하므로
+커밋된 변경만 피드에 나타나고, 삭제는 data 없는 삭제 표시로 남는다. 소비자는
+마지막으로 받은 커서 이후만 가져오고, 새 변경이 없으면 wait초까지 기다린다.
+
+CHANGES_RETENTION_DAYS보다 오래된 기록은 flask prune-changes (cron 등으로 주기 실행)가
+지운다. 지워진 구간 앞의 커서로 요청하면 전체를 다시 읽어야 한다고 알려 준다.
+"""
+import json
+import time
+from datetime import date, datetime, timedelta
+from threading import Condition
+
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import delete, event, func, inspect, insert, select
+from sqlalchemy.orm import Session
+
+FEED_TABLES = ('category', 'group', 'member', 'user')
+
+
+class InvalidSince(ValueError):
+    """since=가 커서 형식이 아님"""
+
+
+def feed_fields():
+    """테이블 이름 -> 피드에 싣는 컬럼 (첫 번째는 기본 키, 비밀번호 해시는 싣지 않음)"""
+    from app.models import User, Category, Group, Member
+    return {
+        'category': [Category.id, Category.name],
+        'group': [Group.id, Group.name, Group.category_id, Group.created_at],
+        'member': [Member.id, Member.name, Member.department, Member.blog_url,
+                   Member.group_id, Member.user_id],
+        'user': [User.id, User.name, User.email, User.is_admin, User.created_at],
+    }
+
+
+def _encode(values):
+    return json.dumps({name: value.isoformat() if isinstance(value, (date, datetime)) else value
+                       for name, value in values.items()}, ensure_ascii=False)
+
+
+def _entry(table_name, row_id, data=None):
+    return {
+        'table_name': table_name,
+        'row_id': row_id,
+        'op': 'delete' if data is None else 'upsert',
+        'data': None if data is None else _encode(data),
+        'changed_at': datetime.utcnow(),
+    }
+
+
+def _append(session, entries):
+    from app.models import ChangeLog
+    if entries:
+        session.connection().execute(insert(ChangeLog.__table__), entries)
+
+
+def record_upserts(session, table_name, ids):
+    """ORM을 거치지 않은 변경 (app.bulk, app.loader): 현재 행을 읽어 같은 트랜잭션에 기록"""
+    ids = list(ids)
+    if not ids:
+        return
+    columns = feed_fields()[table_name]
+    rows = session.execute(select(*columns).where(columns[0].in_(ids)).order_by(columns[0]))
+    _append(session, [_entry(table_name, row.id, row._asdict()) for row in rows])
+
+
+def record_deletes(session, table_name, ids):
+    """ORM을 거치지 않은 삭제의 삭제 표시 기록"""
+    _append(session, [_entry(table_name, row_id) for row_id in ids])
+
+
+def _changed(obj, columns):
+    state = inspect(obj)
+    return any(state.attrs[column.key].history.has_changes() for column in columns)
+
+
+def _record_flush(session, flush_context):
+    """flush된 ORM 변경을 같은 연결로 change_log에 추가"""
+    fields = feed_fields()
+    entries = []
+    for obj in (*session.new, *session.dirty):
+        columns = fields.get(getattr(obj, '__tablename__', None))
+        # 피드에 없는 컬럼만 바뀐 경우 (비밀번호 재해싱 등)는 건너뜀
+        if columns and (obj in session.new or _changed(obj, columns)):
+            entries.append(_entry(obj.__tablename__, obj.id,
+                                  {column.key: getattr(obj, column.key) for column in columns}))
+    for obj in session.deleted:
+        if getattr(obj, '__tablename__', None) in FEED_TABLES:
+            entries.append(_entry(obj.__tablename__, obj.id))
+    _append(session, entries)
+
+
+class ChangeFeed:
+    """change_log 조회와 long-poll 대기
+
+    같은 프로세스의 커밋은 Condition으로 바로 깨우고, 다른 워커의 커밋은
+    pagecache의 data_version을 poll_interval마다 확인해 감지한다.
+    """
+
+    def __init__(self, poll_interval=1.0):
+        self.poll_interval = poll_interval
+        self._condition = Condition()
+
+    def notify(self):
+        with self._condition:
+            self._condition.notify_all()
+
+    def fetch(self, since, limit):
+        """since 이후 변경 최대 limit개와 더 남았는지 여부"""
+        from app.models import db, ChangeLog
+        table = ChangeLog.__table__
+        # 요청 세션의 읽기 트랜잭션(스냅샷)과 무관하게 매번 새 연결로 최신 커밋을 읽음
+        with db.engine.connect() as conn:
+            rows = conn.execute(select(table).where(table.c.id > since)
+                                .order_by(table.c.id).limit(limit + 1)).all()
+        return rows[:limit], len(rows) > limit
+
+    def oldest_cursor(self):
+        """남아 있는 가장 오래된 기록 바로 앞의 커서 (이보다 작은 since는 지워진 변경을 건너뜀)"""
+        from app.models import db, ChangeLog
+        with db.engine.connect() as conn:
+            oldest = conn.execute(select(func.min(ChangeLog.id))).scalar()
+        return oldest - 1 if oldest is not None else 0
+
+    def latest_cursor(self):
+        from app.models import db, ChangeLog
+        with db.engine.connect() as conn:
+            return conn.execute(select(func.max(ChangeLog.id))).scalar() or 0
+
+    def prune(self, days):
+        """days일보다 오래된 기록 삭제 (가장 최근 기록은 남겨 id가 다시 1부터 시작하지 않게 함)"""
+        from app.models import db, ChangeLog
+        cutoff = datetime.utcnow() - timedelta(days=days)
+        latest = self.latest_cursor()
+        first_kept = (select(func.min(ChangeLog.id)).where(ChangeLog.changed_at >= cutoff)
+                      .scalar_subquery())
+        deleted = db.session.execute(
+            delete(ChangeLog).where(ChangeLog.id < func.coalesce(first_kept, latest),
+                                    ChangeLog.id < latest)).rowcount
+        db.session.commit()
+        return deleted
+
+    def poll(self, since, limit, wait=0):
+        """변경이 생기거나 wait초가 지날 때까지 기다렸다가 fetch 결과 반환"""
+        from app.pagecache import data_version
+        deadline = time.monotonic() + wait
+        while True:
+            version = data_version.current()
+            rows, has_more = self.fetch(since, limit)
+            remaining = deadline - time.monotonic()
+            if rows or remaining <= 0:
+                return rows, has_more
+            while remaining > 0 and data_version.current() == version:
+                with self._condition:
+                    self._condition.wait(min(self.poll_interval, remaining))
+                remaining = deadline - time.monotonic()
+
+
+change_feed = ChangeFeed()
+
+
+def parse_since(value):
+    """since= 커서 (비어 있으면 처음부터)"""
+    if not value:
+        return 0
+    try:
+        since = int(value)
+    except ValueError:
+        raise InvalidSince(value) from None
+    if since < 0:
+        raise InvalidSince(value)
+    return since
+
+
+def serialize(row):
+    return {
+        'cursor': str(row.id),
+        'table': row.table_name,
+        'id': row.row_id,
+        'op': row.op,
+        'data': json.loads(row.data) if row.data is not None else None,
+        'changed_at': row.changed_at.isoformat(),
+    }
+
+
+@click.command('prune-changes')
+@click.option('--days', type=int, default=None, help='보관 일수 (기본값 CHANGES_RETENTION_DAYS)')
+@with_appcontext
+def prune_changes_command(days):
+    """보관 기간이 지난 change_log 기록 삭제"""
+    from flask import current_app
+    days = current_app.config['CHANGES_RETENTION_DAYS'] if days is None else days
+    if days <= 0:
+        click.echo('CHANGES_RETENTION_DAYS가 0이면 기록을 지우지 않습니다.')
+        return
+    deleted = change_feed.prune(days)
+    click.echo(f'{days}일보다 오래된 변경 기록 {deleted}개를 지웠습니다. '
+               f'(남은 가장 오래된 커서 {change_feed.oldest_cursor()})')
+
+
+def _after_commit(changes):
+    change_feed.notify()
+
+
+def init_app(app):
+    """설정값 적용, change_log 기록용 flush 이벤트와 커밋 알림 구독
+    (pagecache.init_app 다음: 깨어난 대기자가 새 데이터 버전을 봄)"""
+    from app import txevents
+    change_feed.poll_interval = app.config['CHANGES_POLL_INTERVAL']
+    app.cli.add_command(prune_changes_command)
+    if not event.contains(Session, 'after_flush', _record_flush):
+        event.listen(Session, 'after_flush', _record_flush)
+    txevents.subscribe(FEED_TABLES, _after_commit)
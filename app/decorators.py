@@ -1,7 +1,15 @@
 # app/decorators.py
+import gzip
+import math
+from datetime import datetime, timezone
 from functools import wraps
-from flask import abort, redirect, url_for, request, flash
+from flask import (abort, redirect, url_for, request, flash, session, current_app, make_response, g,
+                   stream_with_context)
 from flask_login import current_user, login_required
+from werkzeug.exceptions import TooManyRequests
+
+# gzip으로 압축한 표현의 ETag에 붙이는 접미사 (원래 본문과 다른 표현이므로 강한 ETag를 따로 씀)
+GZIP_ETAG_SUFFIX = '-gzip'
 
 def admin_required(f):
     """관리자 권한이 필요한 페이지에 사용하는 데코레이터"""
@@ -20,20 +28,30 @@ def group_access_required(f):
     @login_required
     def decorated_function(*args, **kwargs):
         # 함수 호출 시점에 import하여 순환 import 방지
-        from app.models import Group
+        from app.acl import access_index, acl_mode, report_mismatch
         
         group_id = kwargs.get('group_id') or request.view_args.get('group_id')
         if not group_id:
             abort(404)
+        group_id = int(group_id)
         
-        group = Group.query.get_or_404(group_id)
-        
-        # 관리자는 모든 그룹에 접근 가능
-        if current_user.is_admin_user():
-            return f(*args, **kwargs)
+        mode = acl_mode()
+        if mode == 'index':
+            # 메모리 인덱스로 DB 접근 없이 확인
+            if not access_index.has_group(group_id):
+                abort(404)
+            allowed = current_user.is_admin_user() or access_index.can_access_group(current_user.id, group_id)
+        else:
+            from app.models import Group
+            group = Group.query.get_or_404(group_id)
+            allowed = current_user.is_admin_user() or group.has_member(current_user.id)
+            if mode == 'shadow':
+                indexed = current_user.is_admin_user() or access_index.can_access_group(current_user.id, group_id)
+                if indexed != allowed:
+                    report_mismatch('group', group_id, indexed, allowed)
         
-        # 해당 그룹의 멤버인지 확인
-        if not group.has_member(current_user.id):
+        # 관리자이거나 해당 그룹의 멤버인지 확인
+        if not allowed:
             flash('해당 그룹의 정보에 접근할 권한이 없습니다.', 'error')
             abort(403)
         
@@ -45,21 +63,36 @@ def member_access_required(f):
     @wraps(f)
     @login_required
     def decorated_function(*args, **kwargs):
-        from app.models import Member
+        from app.acl import access_index, acl_mode, report_mismatch
         
         member_id = kwargs.get('member_id') or request.view_args.get('member_id')
         if not member_id:
             abort(404)
+        member_id = int(member_id)
         
-        member = Member.query.get_or_404(member_id)
-        
-        # 관리자는 모든 멤버 정보에 접근 가능
-        if current_user.is_admin_user():
-            return f(*args, **kwargs)
+        mode = acl_mode()
+        if mode == 'index':
+            # 메모리 인덱스로 DB 접근 없이 확인
+            group_id = access_index.member_group(member_id)
+            if group_id is None:
+                abort(404)
+            allowed = current_user.is_admin_user() or access_index.can_access_group(current_user.id, group_id)
+        else:
+            from app.models import Member
+            member = Member.query.get_or_404(member_id)
+            if current_user.is_admin_user():
+                allowed = True
+            else:
+                user_member = current_user.get_member_info()
+                allowed = bool(user_member) and user_member.group_id == member.group_id
+            if mode == 'shadow':
+                indexed = (current_user.is_admin_user() or
+                           access_index.can_access_group(current_user.id, access_index.member_group(member_id)))
+                if indexed != allowed:
+                    report_mismatch('member', member_id, indexed, allowed)
         
-        # 같은 그룹 멤버인지 확인
-        user_member = current_user.get_member_info()
-        if not user_member or user_member.group_id != member.group_id:
+        # 관리자이거나 같은 그룹 멤버인지 확인
+        if not allowed:
             flash('해당 멤버의 정보에 접근할 권한이 없습니다.', 'error')
             abort(403)
         
@@ -81,4 +114,140 @@ def own_profile_or_admin_required(f):
         
         flash('접근 권한이 없습니다.', 'error')
         abort(403)
-    return decorated_function
\ No newline at end of file
+    return decorated_function
+
+def auth_rate_limited(f):
+    """로그인/회원가입 POST 요청을 클라이언트 주소와 사용자명별로 제한하는 데코레이터 (DB 조회 전에 429 반환)"""
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        from app.ratelimit import limiters
+        
+        if request.method == 'POST' and limiters:
+            keys = [('address', request.remote_addr or '')]
+            username = request.form.get('username')
+            if username:
+                keys.append(('username', username.strip().lower()))
+            
+            for scope, key in keys:
+                allowed, retry_after = limiters[scope].consume((request.endpoint, key))
+                if not allowed:
+                    raise TooManyRequests(retry_after=math.ceil(retry_after))
+        
+        return f(*args, **kwargs)
+    return decorated_function
+
+def page_cached(f):
+    """데이터 버전이 그대로면 렌더링 결과를 재사용하고, If-None-Match가 맞으면 304로 응답하는 데코레이터"""
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        from app.pagecache import data_version, page_cache, make_etag
+        from app.snapshot import roster_snapshot
+        
+        # flash 메시지가 있는 페이지는 한 번만 보여야 하므로 캐시하지 않음
+        # 명단 스냅샷을 다시 만드는 중이면 옛 내용이 새 버전으로 캐시되지 않도록 그대로 렌더링
+        if (not current_app.config['PAGE_CACHE_ENABLED'] or request.method not in ('GET', 'HEAD')
+                or session.get('_flashes') or not roster_snapshot.is_current()):
+            return f(*args, **kwargs)
+        
+        user_key = current_user.get_id() if current_user.is_authenticated else None
+        key = (request.endpoint, request.full_path, user_key)
+        version = data_version.current()
+        etag = make_etag(key, version)
+        
+        def finish(response):
+            response.set_etag(etag)
+            response.last_modified = datetime.fromtimestamp(version / 1e9, tz=timezone.utc)
+            response.cache_control.private = True
+            response.cache_control.no_cache = True
+            response.vary.add('Cookie')
+            return response
+        
+        # 렌더링 없이 304 응답 (gzip_compressed가 압축한 표현의 ETag도 같은 버전)
+        if etag in request.if_none_match or etag + GZIP_ETAG_SUFFIX in request.if_none_match:
+            return finish(current_app.response_class(status=304))
+        
+        cached = page_cache.get(key, version)
+        if cached is not None:
+            body, status, mimetype = cached
+            return finish(current_app.response_class(body, status, mimetype=mimetype))
+        
+        response = make_response(f(*args, **kwargs))
+        if response.status_code == 200 and not response.is_streamed and roster_snapshot.is_current():
+            page_cache.put(key, version, (response.get_data(), response.status_code, response.mimetype))
+            return finish(response)
+        return response
+    return decorated_function
+
+
+def gzip_compressed(f):
+    """클라이언트가 gzip을 받으면 API_GZIP_MIN_SIZE 이상인 200 응답 본문을 압축하는 데코레이터"""
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        response = make_response(f(*args, **kwargs))
+        response.vary.add('Accept-Encoding')
+        etag, _ = response.get_etag()
+        
+        # 304에는 클라이언트가 가진 표현(압축/원본)의 ETag를 그대로 돌려줌
+        if response.status_code == 304:
+            if etag and etag + GZIP_ETAG_SUFFIX in request.if_none_match:
+                response.set_etag(etag + GZIP_ETAG_SUFFIX)
+            return response
+        
+        if (response.status_code != 200 or response.is_streamed or response.content_encoding
+                or not request.accept_encodings['gzip']):
+            return response
+        body = response.get_data()
+        if len(body) < current_app.config['API_GZIP_MIN_SIZE']:
+            return response
+        
+        response.set_data(gzip.compress(body, compresslevel=6))
+        response.content_encoding = 'gzip'
+        if etag:
+            response.set_etag(etag + GZIP_ETAG_SUFFIX)
+        return response
+    return decorated_function
+
+def query_budget(limit):
+    """뷰 함수가 실행할 수 있는 SQL 수 상한 (QUERY_WATCH가 켜져 있을 때만 검사, 넘으면 보고)
+
+    스트리밍 응답(stream_template 등)은 본문을 다 보낼 때까지 실행된 쿼리를 센다.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            from app.querywatch import query_watch
+            state = query_watch.current()
+            if state is None:
+                return f(*args, **kwargs)
+            before = state['queries']
+            origins_before = state['origins'].copy()
+            endpoint = request.endpoint
+
+            def check():
+                used = state['queries'] - before
+                if used > limit:
+                    origins = state['origins'] - origins_before
+                    query_watch.report('budget', f'{endpoint}: 쿼리 {used}개 실행 (예산 {limit}개)',
+                                       [{'count': count, 'code': code, 'template': template}
+                                        for (code, template), count in origins.most_common(5)])
+
+            response = f(*args, **kwargs)
+            if isinstance(response, current_app.response_class) and response.is_streamed:
+                body = response.response
+
+                def counted():
+                    # 요청이 끝난 뒤 스트리밍하는 동안에도 같은 기록에 쿼리를 셈
+                    g.query_watch = state
+                    try:
+                        yield from body
+                        check()
+                    finally:
+                        g.pop('query_watch', None)
+
+                response.response = stream_with_context(counted())
+                return response
+            check()
+            return response
+        decorated_function.query_budget = limit
+        return decorated_function
+    return decorator
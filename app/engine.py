@@ -0,0 +1,99 @@
+# app/engine.py
+"""SQLite 엔진 프로필 (WAL, pragma, 연결 풀, 읽기 전용 풀 라우팅)"""
+from flask import has_request_context, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+READONLY_BIND = 'readonly'
+
+# 읽기 전용 풀로 보낼 HTTP 메서드
+READONLY_METHODS = ('GET', 'HEAD')
+
+
+class RoutingSession(Session):
+    """GET/HEAD 요청의 조회를 읽기 전용 연결 풀로 보내는 세션 (flush는 항상 쓰기 엔진)"""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if (bind is None and not self._flushing and has_request_context()
+                and request.method in READONLY_METHODS):
+            engine = self._db.engines.get(READONLY_BIND)
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def _is_sqlite(uri):
+    url = make_url(uri)
+    return url.get_backend_name() == 'sqlite' and url.database not in (None, '', ':memory:')
+
+
+def _readonly_uri(uri):
+    """같은 DB 파일을 mode=ro로 여는 URI"""
+    url = make_url(uri)
+    database = url.database
+    if url.query.get('uri'):
+        database = database[len('file:'):]
+    return url.set(database=f'file:{database}',
+                   query={'mode': 'ro', 'uri': 'true'}).render_as_string(hide_password=False)
+
+
+def configure(app):
+    """db.init_app 전에 호출: 프로필에 맞게 엔진 옵션과 읽기 전용 bind를 설정"""
+    config = app.config
+    uri = config['SQLALCHEMY_DATABASE_URI']
+    if config['SQLITE_PROFILE'] != 'production' or not _is_sqlite(uri):
+        return
+
+    options = config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', {})
+    options.setdefault('pool_size', config['SQLITE_POOL_SIZE'])
+    options.setdefault('max_overflow', config['SQLITE_MAX_OVERFLOW'])
+    options.setdefault('pool_timeout', config['SQLITE_POOL_TIMEOUT'])
+    connect_args = options.setdefault('connect_args', {})
+    # busy 상태면 바로 실패하지 않고 기다림
+    connect_args.setdefault('timeout', config['SQLITE_BUSY_TIMEOUT'] / 1000)
+    connect_args.setdefault('check_same_thread', False)
+
+    if config['SQLITE_READONLY_POOL']:
+        binds = config.setdefault('SQLALCHEMY_BINDS', {})
+        binds.setdefault(READONLY_BIND, {
+            'url': _readonly_uri(uri),
+            'pool_size': config['SQLITE_READONLY_POOL_SIZE'],
+            'max_overflow': config['SQLITE_MAX_OVERFLOW'],
+            'pool_timeout': config['SQLITE_POOL_TIMEOUT'],
+            'connect_args': {'timeout': config['SQLITE_BUSY_TIMEOUT'] / 1000,
+                             'check_same_thread': False},
+        })
+
+
+def install_pragmas(engine, pragmas, readonly=False):
+    """새 연결마다 PRAGMA를 실행하도록 등록"""
+    if readonly:
+        # 읽기 전용 연결에서는 journal_mode를 바꿀 수 없음
+        pragmas = {name: value for name, value in pragmas.items() if name != 'journal_mode'}
+        pragmas['query_only'] = 'ON'
+
+    @event.listens_for(engine, 'connect')
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name}={value}')
+        cursor.close()
+
+
+def init_app(app):
+    """db.init_app 후에 호출: 만들어진 SQLite 엔진에 pragma 등록"""
+    from app.models import db
+    if app.config['SQLITE_PROFILE'] != 'production':
+        return
+
+    pragmas = dict(app.config['SQLITE_PRAGMAS'])
+    pragmas.setdefault('busy_timeout', app.config['SQLITE_BUSY_TIMEOUT'])
+    with app.app_context():
+        for key, engine in db.engines.items():
+            if engine.dialect.name == 'sqlite' and _is_sqlite(str(engine.url)):
+                install_pragmas(engine, pragmas, readonly=(key == READONLY_BIND))
+
+        # WAL은 DB 파일에 저장되므로 읽기 전용 연결보다 먼저 쓰기 엔진으로 한 번 연결
+        with db.engine.connect():
+            pass
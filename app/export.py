@@ -0,0 +1,204 @@
+# app/export.py
+"""사용자/멤버/그룹/카테고리를 CSV, JSONL, XLSX로 스트리밍 내보내기
+
+컬럼은 app/static/data의 CSV와 같은 순서를 따르므로 내보낸 CSV를 그대로
+seed.py (app.loader)에 넣을 수 있다. 비밀번호 해시는 내보내지 않으므로 users의
+password는 비워 두며 (다시 적재하면 기존 사용자의 해시를 유지), 파일에 없던 모델 컬럼은 뒤에 붙인다.
+"""
+import csv
+import io
+import json
+import zipfile
+from datetime import date, datetime
+from xml.sax.saxutils import escape
+
+from app.models import db, User, Category, Group, Member
+
+# 서버 측 커서에서 한 번에 가져올 행 수
+EXPORT_CHUNK_SIZE = 1000
+
+FORMATS = {
+    'csv': 'text/csv',
+    'jsonl': 'application/x-ndjson',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+
+
+def layouts():
+    """테이블 이름 (CSV 파일 이름) -> [(헤더, 컬럼 또는 None)]"""
+    return {
+        'categories': [('id', Category.id), ('name', Category.name)],
+        'groups': [('id', Group.id), ('name', Group.name), ('category_id', Group.category_id),
+                   ('created_at', Group.created_at)],
+        'members': [('id', Member.id), ('name', Member.name), ('department', Member.department),
+                    ('group_id', Member.group_id), ('student number', None),
+                    ('blog_url', Member.blog_url), ('user_id', Member.user_id)],
+        'users': [('id', User.id), ('name', User.name), ('password', None),
+                  ('is_admin', User.is_admin), ('email', User.email),
+                  ('birthdate', User.birthdate), ('created_at', User.created_at)],
+    }
+
+
+def iter_rows(table, chunk_size=EXPORT_CHUNK_SIZE):
+    """(헤더 목록, 행 튜플 생성기) - 기본 키 순서, chunk_size 행씩 읽음"""
+    layout = layouts()[table]
+    headers = [header for header, _ in layout]
+    columns = [column for _, column in layout if column is not None]
+    positions = [column is not None for _, column in layout]
+
+    query = (db.session.query(*columns)
+             .order_by(columns[0])
+             .execution_options(stream_results=True, yield_per=chunk_size))
+
+    def rows():
+        for row in query:
+            values = iter(row)
+            yield tuple(next(values) if present else None for present in positions)
+
+    return headers, rows()
+
+
+# CSV / JSONL --------------------------------------------------------------
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def stream_csv(table, chunk_size=EXPORT_CHUNK_SIZE):
+    """BOM이 붙은 UTF-8 CSV (data 폴더 파일과 같은 형식)"""
+    headers, rows = iter_rows(table, chunk_size)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write('\ufeff')
+    writer.writerow(headers)
+
+    for count, row in enumerate(rows, 1):
+        writer.writerow([_csv_value(value) for value in row])
+        if count % chunk_size == 0:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate(0)
+    yield buffer.getvalue().encode('utf-8')
+
+
+def _json_value(value):
+    return value.isoformat() if isinstance(value, (date, datetime)) else value
+
+
+def stream_jsonl(table, chunk_size=EXPORT_CHUNK_SIZE):
+    """한 행당 JSON 객체 한 줄"""
+    headers, rows = iter_rows(table, chunk_size)
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(dict(zip(headers, map(_json_value, row))), ensure_ascii=False))
+        if len(lines) >= chunk_size:
+            yield ('\n'.join(lines) + '\n').encode('utf-8')
+            lines = []
+    if lines:
+        yield ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+# XLSX ---------------------------------------------------------------------
+
+class _ChunkSink(io.RawIOBase):
+    """ZipFile이 쓴 바이트를 모아 두었다가 꺼내 가는 쓰기 전용 스트림 (seek 불가)"""
+
+    def __init__(self):
+        self._chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+_XLSX_STATIC = {
+    '[Content_Types].xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'),
+    '_rels/.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Target="xl/workbook.xml" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+        '</Relationships>'),
+    'xl/_rels/workbook.xml.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Target="worksheets/sheet1.xml" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet"/>'
+        '</Relationships>'),
+}
+
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets></workbook>')
+
+# XML 1.0에서 허용되지 않는 제어 문자
+_XML_ILLEGAL = dict.fromkeys(c for c in range(32) if c not in (9, 10, 13))
+
+
+def _xlsx_cell(value):
+    if value is None:
+        return '<c/>'
+    if isinstance(value, bool):
+        return f'<c t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, int):
+        return f'<c><v>{value}</v></c>'
+    if isinstance(value, (date, datetime)):
+        value = value.isoformat()
+    text = escape(str(value).translate(_XML_ILLEGAL))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def _xlsx_row(values):
+    return '<row>' + ''.join(map(_xlsx_cell, values)) + '</row>'
+
+
+def stream_xlsx(table, chunk_size=EXPORT_CHUNK_SIZE):
+    """시트 하나짜리 XLSX (공유 문자열 없이 inline 문자열, zip은 seek 없이 순차 기록)"""
+    headers, rows = iter_rows(table, chunk_size)
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in _XLSX_STATIC.items():
+            archive.writestr(name, content)
+        archive.writestr('xl/workbook.xml', _XLSX_WORKBOOK.format(name=escape(table)))
+
+        with archive.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as sheet:
+            sheet.write(('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                         '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                         '<sheetData>' + _xlsx_row(headers)).encode('utf-8'))
+            batch = []
+            for row in rows:
+                batch.append(_xlsx_row(row))
+                if len(batch) >= chunk_size:
+                    sheet.write(''.join(batch).encode('utf-8'))
+                    batch = []
+                    yield sink.drain()
+            sheet.write((''.join(batch) + '</sheetData></worksheet>').encode('utf-8'))
+    yield sink.drain()
+
+
+STREAMS = {'csv': stream_csv, 'jsonl': stream_jsonl, 'xlsx': stream_xlsx}
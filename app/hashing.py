@@ -0,0 +1,148 @@
+# app/hashing.py
+"""비밀번호 해싱/검증을 제한된 워커 풀에서 실행하는 서비스"""
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from threading import BoundedSemaphore, Lock
+
+from werkzeug.exceptions import ServiceUnavailable
+from werkzeug.security import check_password_hash, generate_password_hash
+
+# 해싱 지연 시간 히스토그램 구간 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, float('inf'))
+
+
+class HashingBusy(ServiceUnavailable):
+    """대기열이 가득 차서 해싱 요청을 받을 수 없음 (503)"""
+    description = '잠시 후 다시 시도해주세요.'
+
+
+class HashingTimeout(ServiceUnavailable):
+    """해싱이 timeout초 안에 끝나지 않음 (503, 작업은 풀에서 계속 돌고 끝나야 자리를 돌려줌)"""
+    description = '잠시 후 다시 시도해주세요.'
+
+
+def method_prefix(method):
+    """werkzeug가 실제로 해시에 적는 method 부분 ('scrypt' -> 'scrypt:32768:8:1' 처럼 기본값을 채움)"""
+    return generate_password_hash('', method).split('$', 1)[0]
+
+
+class PasswordHasher:
+    """werkzeug 해시 함수를 스레드 풀에서 실행 (hashlib은 GIL을 놓고 계산함)
+
+    method는 werkzeug 형식 문자열 (예: 'pbkdf2:sha256:600000', 'scrypt'). 생략한 비용 인자는
+    설정할 때 한 번 해싱해 본 결과로 채워 needs_rehash 비교에 쓴다.
+    """
+
+    def __init__(self, method='pbkdf2:sha256:600000', workers=4, queue_size=32, timeout=10):
+        self._executor = None
+        self._lock = Lock()
+        self._metrics_lock = Lock()
+        self.configure(method, workers, queue_size, timeout)
+
+    def configure(self, method, workers, queue_size, timeout):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            self.method = method
+            self.method_prefix = method_prefix(method)
+            self.workers = workers
+            self.queue_size = queue_size
+            self.timeout = timeout
+            self._executor = ThreadPoolExecutor(max_workers=workers,
+                                                thread_name_prefix='password-hasher')
+            # 실행 중 + 대기 중인 작업 수 제한
+            self._slots = BoundedSemaphore(workers + queue_size)
+            self._in_flight = 0
+            self.reset_metrics()
+
+    def reset_metrics(self):
+        with self._metrics_lock:
+            self._metrics = {
+                op: {'count': 0, 'sum': 0.0, 'max': 0.0, 'buckets': [0] * len(LATENCY_BUCKETS)}
+                for op in ('hash', 'verify')
+            }
+            self._rejected = 0
+
+    def _observe(self, op, seconds):
+        with self._metrics_lock:
+            metric = self._metrics[op]
+            metric['count'] += 1
+            metric['sum'] += seconds
+            metric['max'] = max(metric['max'], seconds)
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    metric['buckets'][i] += 1
+                    break
+
+    def _run(self, op, func, *args):
+        slots = self._slots
+        if not slots.acquire(blocking=False):
+            with self._metrics_lock:
+                self._rejected += 1
+            raise HashingBusy()
+        with self._metrics_lock:
+            self._in_flight += 1
+
+        def timed():
+            started = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                self._observe(op, time.perf_counter() - started)
+
+        try:
+            future = self._executor.submit(timed)
+        except BaseException:
+            self._release(slots)
+            raise
+        # 요청이 시간 초과로 먼저 끝나도 해싱이 실제로 끝날 때까지 자리를 차지함
+        future.add_done_callback(lambda _: self._release(slots))
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeout:
+            raise HashingTimeout() from None
+
+    def _release(self, slots):
+        with self._metrics_lock:
+            self._in_flight -= 1
+        slots.release()
+
+    def hash(self, password):
+        return self._run('hash', generate_password_hash, password, self.method)
+
+    def verify(self, password_hash, password):
+        return self._run('verify', check_password_hash, password_hash, password)
+
+    def needs_rehash(self, password_hash):
+        """저장된 해시의 알고리즘/비용이 현재 설정과 다른지 확인"""
+        return password_hash.split('$', 1)[0] != self.method_prefix
+
+    def stats(self):
+        """해싱 지연 시간 통계와 대기열 상태"""
+        with self._metrics_lock:
+            result = {
+                'method': self.method_prefix,
+                'workers': self.workers,
+                'queue_size': self.queue_size,
+                'in_flight': self._in_flight,
+                'rejected': self._rejected,
+            }
+            for op, metric in self._metrics.items():
+                result[op] = {
+                    'count': metric['count'],
+                    'avg': metric['sum'] / metric['count'] if metric['count'] else 0.0,
+                    'max': metric['max'],
+                    'buckets': dict(zip([str(b) for b in LATENCY_BUCKETS], metric['buckets'])),
+                }
+            return result
+
+
+password_hasher = PasswordHasher()
+
+
+def init_app(app):
+    config = app.config
+    password_hasher.configure(config['PASSWORD_HASH_METHOD'],
+                              config['PASSWORD_HASH_WORKERS'],
+                              config['PASSWORD_HASH_QUEUE_SIZE'],
+                              config['PASSWORD_HASH_TIMEOUT'])
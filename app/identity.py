@@ -0,0 +1,161 @@
+# app/identity.py
+"""login_manager.user_loader 앞단의 LRU + TTL 사용자 캐시
+
+사용자/멤버 커밋마다 올라가는 identity_version을 항목마다 함께 저장해 두고,
+다른 워커에서 관리자 해제나 삭제가 커밋되어 버전이 바뀌면 TTL과 관계없이 다시 읽는다.
+"""
+import os
+import time
+from collections import OrderedDict
+from threading import Lock
+
+from flask_login import UserMixin
+
+from app.pagecache import DataVersion
+
+# 이 테이블이 바뀌면 캐시된 사용자 스냅샷을 버림
+IDENTITY_TABLES = ('user', 'member')
+
+# IDENTITY_TABLES 커밋마다 올라가는 버전 (모든 워커가 instance 폴더의 같은 파일을 봄)
+identity_version = DataVersion()
+
+
+class UserSnapshot(UserMixin):
+    """세션에 묶이지 않는 사용자 요약 정보 (current_user로 사용)"""
+    __slots__ = ('id', 'name', 'is_admin', 'member_id', 'group_id')
+
+    def __init__(self, id, name, is_admin, member_id=None, group_id=None):
+        self.id = id
+        self.name = name
+        self.is_admin = bool(is_admin)
+        self.member_id = member_id
+        self.group_id = group_id
+
+    def is_admin_user(self):
+        """관리자인지 확인"""
+        return self.is_admin
+
+    def get_member_info(self):
+        """해당 사용자의 Member 정보 반환"""
+        from app.models import db, Member
+        if self.member_id is None:
+            return None
+        return db.session.get(Member, self.member_id)
+
+    def get_accessible_groups(self):
+        """접근 가능한 그룹들 반환 (DB 대신 명단 스냅샷에서)"""
+        from app.snapshot import roster_snapshot
+        snapshot = roster_snapshot.get()
+        if self.is_admin:
+            return snapshot.groups
+        group = snapshot.groups_by_id.get(self.group_id)
+        return [group] if group else []
+
+    def get_teams(self):
+        """사용자가 속한 팀들 반환"""
+        return self.get_accessible_groups()
+
+    def __repr__(self):
+        return f'<UserSnapshot {self.id}>'
+
+
+def fetch_snapshot(user_id):
+    """User와 Member를 조인해 한 번의 쿼리로 스냅샷 생성"""
+    from app.models import db, User, Member
+    row = (db.session.query(User.id, User.name, User.is_admin, Member.id, Member.group_id)
+           .outerjoin(Member, Member.user_id == User.id)
+           .filter(User.id == user_id)
+           .first())
+    if row is None:
+        return None
+    return UserSnapshot(*row)
+
+
+class IdentityCache:
+    """크기 제한(LRU)과 만료 시간(TTL)이 있는 사용자 스냅샷 캐시"""
+
+    def __init__(self, maxsize=1024, ttl=300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def configure(self, maxsize, ttl):
+        with self._lock:
+            self.maxsize = maxsize
+            self.ttl = ttl
+            self._entries.clear()
+
+    def get(self, user_id):
+        """캐시된 스냅샷 반환 (없거나 만료되었거나 그 뒤에 사용자/멤버가 바뀌었으면 None)"""
+        now = time.monotonic()
+        version = identity_version.current()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[0] > now and entry[2] == version:
+                self._entries.move_to_end(user_id)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[user_id]
+            self.misses += 1
+            return None
+
+    def put(self, user_id, snapshot, version):
+        """version: 스냅샷을 읽기 전에 본 identity_version"""
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + self.ttl, snapshot, version)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def load(self, user_id):
+        """캐시에 없으면 DB에서 읽어 채움"""
+        if self.maxsize <= 0:
+            return fetch_snapshot(user_id)
+        snapshot = self.get(user_id)
+        if snapshot is None:
+            # 읽는 도중의 커밋은 다음 조회에서 잡히도록 버전을 먼저 읽음
+            version = identity_version.current()
+            snapshot = fetch_snapshot(user_id)
+            if snapshot is not None:
+                self.put(user_id, snapshot, version)
+        return snapshot
+
+    def invalidate(self, user_id):
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """적중/실패 횟수와 현재 크기"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0
+            }
+
+
+identity_cache = IdentityCache()
+
+
+def _after_commit(changes):
+    identity_version.bump()
+
+
+def init_app(app):
+    """캐시 설정, 버전 파일 설정과 커밋 알림 구독"""
+    from app import txevents
+    identity_cache.configure(app.config['IDENTITY_CACHE_SIZE'], app.config['IDENTITY_CACHE_TTL'])
+    identity_version.configure(os.path.join(app.instance_path, 'identity_version'))
+    txevents.subscribe(IDENTITY_TABLES, _after_commit)
@@ -0,0 +1,415 @@
+# app/jobs.py
+"""오래 걸리는 관리자 작업(일괄 삭제/이동, 명단 적재)을 요청 밖에서 실행하는 백그라운드 작업
+
+작업은 job 테이블에 저장되고 프로세스마다 JOBS_WORKERS개의 스레드가 대기열에서
+하나씩 가져가 실행한다. 가져가기는 UPDATE ... RETURNING 한 문장이라 여러 gunicorn
+워커가 같은 DB를 봐도 한 작업은 한 곳에서만 돈다. 진행률은 묶음마다 커밋하고,
+실행 중인 작업의 하트비트는 묶음이 길어도 끊기지 않게 프로세스마다 별도 스레드가 올린다.
+프로세스가 죽으면 하트비트가 끊긴 작업을 다시 대기열로 돌려 남은 부분부터 이어 간다.
+"""
+import json
+import os
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from threading import Condition, Lock
+
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import func, select, update
+
+QUEUED = 'queued'
+RUNNING = 'running'
+SUCCEEDED = 'succeeded'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+
+class JobCancelled(Exception):
+    """실행 중인 작업에 취소가 요청됨 (묶음 사이에서 확인)"""
+
+
+class JobKind:
+    __slots__ = ('name', 'run', 'parse')
+
+    def __init__(self, name, run, parse):
+        self.name = name
+        self.run = run
+        self.parse = parse
+
+
+# 작업 이름 -> JobKind
+KINDS = {}
+
+
+def job_kind(name, parse):
+    """작업 종류 등록: run(ctx, params), parse(request, user_id) -> params (잘못된 입력은 ValueError)"""
+    def decorator(run):
+        KINDS[name] = JobKind(name, run, parse)
+        return run
+    return decorator
+
+
+class JobContext:
+    """실행 중인 작업 하나의 진행률/결과 기록과 취소 확인"""
+
+    def __init__(self, job_id, progress, total, result):
+        self.job_id = job_id
+        self.progress = progress
+        self.total = total
+        self.result = result
+
+    def _save(self):
+        """진행률과 결과를 커밋하고 취소 요청 여부 반환 (하트비트 겸용)"""
+        from app.models import db, Job
+        cancel_requested = db.session.execute(
+            update(Job).where(Job.id == self.job_id)
+            .values(progress=self.progress, total=self.total,
+                    result=json.dumps(self.result, ensure_ascii=False),
+                    heartbeat_at=datetime.utcnow())
+            .returning(Job.cancel_requested)).scalar()
+        db.session.commit()
+        return cancel_requested
+
+    def start(self, total, restart=False):
+        """전체 작업량 기록 (restart면 이전 시도의 진행률을 버리고 처음부터)"""
+        self.total = total
+        if restart:
+            self.progress = 0
+            self.result = {}
+        self.check()
+
+    def advance(self, count=1, **result):
+        """count만큼 끝났음을 기록 (result는 결과에 합침)"""
+        self.progress += count
+        self.result.update(result)
+        self.check()
+
+    def check(self):
+        if self._save():
+            raise JobCancelled()
+
+    def run_chunks(self, ids, handle, chunk_size):
+        """ids를 chunk_size씩 handle(chunk) -> {id: 상태}로 처리 (이미 끝난 progress 이후부터)"""
+        counts = Counter(self.result.get('counts', {}))
+        self.start(len(ids))
+        while self.progress < len(ids):
+            chunk = ids[self.progress:self.progress + chunk_size]
+            counts.update(handle(chunk).values())
+            self.advance(len(chunk), counts=dict(counts))
+
+
+def to_dict(job):
+    return {
+        'id': job.id,
+        'kind': job.kind,
+        'status': job.status,
+        'progress': job.progress,
+        'total': job.total,
+        'result': json.loads(job.result) if job.result else None,
+        'error': job.error,
+        'attempts': job.attempts,
+        'cancel_requested': job.cancel_requested,
+        'created_by': job.created_by,
+        'created_at': job.created_at.isoformat() if job.created_at else None,
+        'started_at': job.started_at.isoformat() if job.started_at else None,
+        'finished_at': job.finished_at.isoformat() if job.finished_at else None,
+    }
+
+
+def enqueue(kind, params, user_id=None):
+    """작업을 대기열에 넣고 (커밋) 작업 스레드를 깨움"""
+    from app.models import db, Job
+    if kind not in KINDS:
+        raise KeyError(kind)
+    job = Job(kind=kind, params=json.dumps(params), created_by=user_id)
+    db.session.add(job)
+    db.session.commit()
+    job_runner.notify()
+    return job
+
+
+def cancel(job):
+    """대기 중이면 바로 취소, 실행 중이면 다음 묶음 전에 멈추도록 표시 (끝난 작업은 False)"""
+    from app.models import db, Job
+    if job.status == QUEUED:
+        done = db.session.execute(
+            update(Job).where(Job.id == job.id, Job.status == QUEUED)
+            .values(status=CANCELLED, finished_at=datetime.utcnow())).rowcount
+        if done:
+            db.session.commit()
+            db.session.refresh(job)
+            return True
+    if job.status == RUNNING:
+        job.cancel_requested = True
+        db.session.commit()
+        return True
+    db.session.rollback()
+    return False
+
+
+def retry(job):
+    """실패/취소된 작업을 다시 대기열로 (진행률은 유지해서 남은 부분부터)"""
+    from app.models import db
+    if job.status not in (FAILED, CANCELLED):
+        return False
+    job.status = QUEUED
+    job.error = None
+    job.attempts = 0
+    job.cancel_requested = False
+    job.run_after = datetime.utcnow()
+    job.finished_at = None
+    db.session.commit()
+    job_runner.notify()
+    return True
+
+
+class JobRunner:
+    """프로세스 안의 작업 스레드들 (fork 후에는 자식 프로세스에서 새로 시작)"""
+
+    def __init__(self):
+        self.app = None
+        self.workers = 1
+        self.poll_interval = 2.0
+        self.max_attempts = 3
+        self.retry_delay = 30
+        self.stale_after = 300
+        self._pid = None
+        self._heartbeat_pid = None
+        self._running = set()
+        self._lock = Lock()
+        self._wakeup = Condition()
+
+    def start(self):
+        """이 프로세스에서 아직 돌지 않으면 작업 스레드 시작"""
+        if self.app is None or self.workers <= 0 or self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            for number in range(self.workers):
+                threading.Thread(target=self._loop, name=f'job-worker-{number}', daemon=True).start()
+
+    def notify(self):
+        with self._wakeup:
+            self._wakeup.notify()
+
+    def _start_heartbeat(self):
+        """이 프로세스에서 실행 중인 작업의 하트비트를 올리는 스레드 시작 (fork 후에는 새로)"""
+        with self._lock:
+            if self._heartbeat_pid == os.getpid():
+                return
+            self._heartbeat_pid = os.getpid()
+            self._running = set()
+        threading.Thread(target=self._heartbeat_loop, name='job-heartbeat', daemon=True).start()
+
+    def _heartbeat_loop(self):
+        from app.models import db, Job
+        while True:
+            time.sleep(self.stale_after / 3)
+            with self._lock:
+                running = list(self._running)
+            if not running:
+                continue
+            try:
+                with self.app.app_context():
+                    db.session.execute(update(Job).where(Job.id.in_(running), Job.status == RUNNING)
+                                       .values(heartbeat_at=datetime.utcnow()))
+                    db.session.commit()
+                    db.session.remove()
+            except Exception:
+                self.app.logger.exception('작업 하트비트를 기록하지 못했습니다.')
+
+    def _loop(self):
+        while True:
+            try:
+                with self.app.app_context():
+                    ran = self.run_next()
+            except Exception:
+                self.app.logger.exception('백그라운드 작업 대기열을 처리하지 못했습니다.')
+                ran = False
+            if not ran:
+                with self._wakeup:
+                    self._wakeup.wait(self.poll_interval)
+
+    def _claim(self):
+        """하트비트가 끊긴 작업을 되돌리고 실행할 작업 하나를 가져감 (없으면 None)
+
+        대기열이 비어 있으면 SELECT 한 번으로 끝내 폴링마다 쓰기 잠금을 잡지 않는다.
+        """
+        from app.models import db, Job
+        now = datetime.utcnow()
+        stale_before = now - timedelta(seconds=self.stale_after)
+        runnable = (Job.status == QUEUED) & (Job.run_after <= now)
+        stale = (Job.status == RUNNING) & (Job.heartbeat_at < stale_before)
+        if db.session.execute(select(Job.id).where(runnable | stale).limit(1)).first() is None:
+            db.session.rollback()
+            return None
+
+        db.session.execute(update(Job).where(stale).values(status=QUEUED))
+        next_id = (select(Job.id)
+                   .where(runnable)
+                   .order_by(Job.id).limit(1).scalar_subquery())
+        job_id = db.session.execute(
+            update(Job).where(Job.id == next_id, Job.status == QUEUED)
+            .values(status=RUNNING, attempts=Job.attempts + 1, heartbeat_at=now,
+                    started_at=func.coalesce(Job.started_at, now))
+            .returning(Job.id)).scalar()
+        db.session.commit()
+        return job_id
+
+    def _finish(self, job_id, **values):
+        from app.models import db, Job
+        db.session.rollback()
+        db.session.execute(update(Job).where(Job.id == job_id).values(**values))
+        db.session.commit()
+
+    def run_next(self):
+        """대기열에서 작업 하나를 실행 (실행했으면 True)"""
+        from app.models import db, Job
+        job_id = self._claim()
+        if job_id is None:
+            return False
+
+        self._start_heartbeat()
+        with self._lock:
+            self._running.add(job_id)
+        job = db.session.get(Job, job_id)
+        ctx = JobContext(job.id, job.progress, job.total, json.loads(job.result) if job.result else {})
+        attempts = job.attempts
+        try:
+            kind = KINDS[job.kind]
+            kind.run(ctx, json.loads(job.params))
+        except JobCancelled:
+            self._finish(job_id, status=CANCELLED, finished_at=datetime.utcnow())
+        except Exception as e:
+            self.app.logger.exception('백그라운드 작업 %s 실패 (%d번째 시도)', job_id, attempts)
+            if attempts < self.max_attempts:
+                delay = timedelta(seconds=self.retry_delay * attempts)
+                self._finish(job_id, status=QUEUED, error=repr(e), run_after=datetime.utcnow() + delay)
+            else:
+                self._finish(job_id, status=FAILED, error=repr(e), finished_at=datetime.utcnow())
+        else:
+            # CSV 파일이 없어 건너뛴 테이블 등은 끝난 것으로 봄
+            self._finish(job_id, status=SUCCEEDED, error=None,
+                         progress=ctx.total if ctx.total is not None else ctx.progress,
+                         finished_at=datetime.utcnow())
+        finally:
+            with self._lock:
+                self._running.discard(job_id)
+            db.session.remove()
+        return True
+
+
+job_runner = JobRunner()
+
+
+# 작업 종류 -------------------------------------------------------------------
+
+def _chunk_size():
+    from flask import current_app
+    return current_app.config['BULK_MAX_BATCH_SIZE']
+
+
+def _job_ids(req):
+    from flask import current_app
+    from app.bulk import parse_ids
+    return parse_ids(req, limit=current_app.config['JOBS_MAX_IDS'])
+
+
+def _parse_delete_users(req, user_id):
+    return {'ids': _job_ids(req), 'acting_user_id': user_id}
+
+
+@job_kind('delete-users', parse=_parse_delete_users)
+def _delete_users(ctx, params):
+    """사용자 일괄 삭제 (BULK_MAX_BATCH_SIZE씩 나눠 커밋)"""
+    from app.bulk import delete_users
+    ctx.run_chunks(params['ids'], lambda chunk: delete_users(chunk, params['acting_user_id']),
+                   _chunk_size())
+
+
+def _parse_delete_groups(req, user_id):
+    return {'ids': _job_ids(req)}
+
+
+@job_kind('delete-groups', parse=_parse_delete_groups)
+def _delete_groups(ctx, params):
+    """그룹과 소속 멤버 일괄 삭제"""
+    from app.bulk import delete_groups
+
+    def handle(chunk):
+        results, deleted_members = delete_groups(chunk)
+        ctx.result['deleted_members'] = ctx.result.get('deleted_members', 0) + deleted_members
+        return results
+
+    ctx.run_chunks(params['ids'], handle, _chunk_size())
+
+
+def _parse_move_members(req, user_id):
+    from app.models import db, Group
+    payload = req.get_json(silent=True)
+    group_id = payload.get('group_id') if isinstance(payload, dict) else req.form.get('group_id')
+    try:
+        group_id = int(group_id)
+    except (TypeError, ValueError):
+        raise ValueError('group_id는 정수여야 합니다.') from None
+    if db.session.get(Group, group_id) is None:
+        raise LookupError(f'{group_id} 그룹이 없습니다.')
+    return {'ids': _job_ids(req), 'group_id': group_id}
+
+
+@job_kind('move-members', parse=_parse_move_members)
+def _move_members(ctx, params):
+    """멤버 일괄 이동"""
+    from app.bulk import move_members
+    ctx.run_chunks(params['ids'], lambda chunk: move_members(chunk, params['group_id']),
+                   _chunk_size())
+
+
+def _parse_import_roster(req, user_id):
+    return {}
+
+
+@job_kind('import-roster', parse=_parse_import_roster)
+def _import_roster(ctx, params):
+    """app/static/data의 CSV 명단 적재 (upsert라 재시도하면 처음부터 다시)
+
+    웹 워커 안의 스레드에서 돌 수 있으므로 프로세스를 fork하지 않고 스레드 풀에서 해싱한다.
+    """
+    from app.loader import CSV_DIR, load_all, load_order
+    ctx.start(len(load_order()), restart=True)
+    load_all(CSV_DIR, use_threads=True, on_table=lambda stats: ctx.advance(
+        1, **{stats.table: {'rows': stats.rows, 'changed': stats.changed, 'skipped': len(stats.skipped),
+                         'seconds': round(stats.seconds, 3)}}))
+
+
+@click.command('run-jobs')
+@click.option('--once', is_flag=True, help='대기 중인 작업을 모두 처리하면 종료')
+@with_appcontext
+def run_jobs_command(once):
+    """백그라운드 작업을 이 프로세스에서 실행 (웹 워커에서 JOBS_WORKERS=0일 때)"""
+    executed = 0
+    while True:
+        if job_runner.run_next():
+            executed += 1
+        elif once:
+            break
+        else:
+            with job_runner._wakeup:
+                job_runner._wakeup.wait(job_runner.poll_interval)
+    click.echo(f'작업 {executed}개를 실행했습니다.')
+
+
+def init_app(app):
+    """설정값 적용, 요청이 들어오는 프로세스에서 작업 스레드 시작 (gunicorn은 post_fork에서도)"""
+    job_runner.app = app
+    job_runner.workers = app.config['JOBS_WORKERS']
+    job_runner.poll_interval = app.config['JOBS_POLL_INTERVAL']
+    job_runner.max_attempts = app.config['JOBS_MAX_ATTEMPTS']
+    job_runner.retry_delay = app.config['JOBS_RETRY_DELAY']
+    job_runner.stale_after = app.config['JOBS_STALE_AFTER']
+    app.before_request(job_runner.start)
+    app.cli.add_command(run_jobs_command)
@@ -0,0 +1,330 @@
+# app/loader.py
+"""CSV 파일을 청크 단위로 읽어 대량 upsert 하는 로더"""
+import csv
+import hashlib
+import hmac
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date, datetime
+from functools import partial
+from itertools import islice
+
+from flask import current_app
+from sqlalchemy import Boolean, Date, DateTime, Integer, case, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from werkzeug.security import generate_password_hash
+
+from app.models import db
+
+# CSV 파일 기본 경로
+CSV_DIR = os.path.join('app', 'static', 'data')
+
+# 테이블 이름 → CSV 파일 이름
+CSV_FILES = {
+    'category': 'categories.csv',
+    'group': 'groups.csv',
+    'member': 'members.csv',
+    'user': 'users.csv',
+}
+
+# 한 번의 executemany로 넣을 행 수
+CHUNK_SIZE = 5000
+
+# users.csv에는 생년월일이 없으므로 기본값 사용
+DEFAULT_BIRTHDATE = date(2000, 1, 1)
+
+TRUE_VALUES = ('1', 'true', 'yes')
+
+# password가 빈 행의 password_hash: 이미 있는 사용자는 기존 해시를 유지하고, 새 사용자는 로그인할 수 없음
+NO_PASSWORD = '!'
+
+
+class LoadStats:
+    """테이블 하나의 적재 결과
+
+    rows: 받아들인 행 수, changed: 그중 DB와 달라 실제로 쓴 행 수,
+    skipped: 유일 컬럼 값이 겹쳐 건너뛴 행의 id
+    """
+
+    def __init__(self, table, rows, seconds, skipped=(), changed=None):
+        self.table = table
+        self.rows = rows
+        self.seconds = seconds
+        self.skipped = list(skipped)
+        self.changed = rows if changed is None else changed
+
+    @property
+    def rows_per_sec(self):
+        return self.rows / self.seconds if self.seconds else float(self.rows)
+
+    def __repr__(self):
+        return (f'<LoadStats {self.table}: {self.rows} rows ({self.changed} changed), '
+                f'{len(self.skipped)} skipped, '
+                f'{self.rows_per_sec:,.0f} rows/s>')
+
+
+def load_order(tables=None):
+    """외래 키 의존성에 따라 적재 순서를 결정"""
+    names = set(tables or CSV_FILES)
+    return [table for table in db.metadata.sorted_tables if table.name in names]
+
+
+def _convert(column, value):
+    """CSV 문자열을 컬럼 타입에 맞게 변환"""
+    if value is None:
+        return None
+    value = value.strip()
+    if value == '':
+        return None
+    if isinstance(column.type, Boolean):
+        return value.lower() in TRUE_VALUES
+    if isinstance(column.type, Integer):
+        return int(value)
+    if isinstance(column.type, DateTime):
+        return datetime.fromisoformat(value)
+    if isinstance(column.type, Date):
+        return date.fromisoformat(value)
+    return value
+
+
+def _read_chunks(path, chunk_size):
+    """CSV를 chunk_size 행씩 읽어 리스트로 반환"""
+    # 데이터 파일은 BOM이 포함된 UTF-8
+    with open(path, encoding='utf-8-sig', newline='') as f:
+        reader = csv.DictReader(f)
+        while True:
+            chunk = list(islice(reader, chunk_size))
+            if not chunk:
+                break
+            yield chunk
+
+
+def _to_params(table, chunk):
+    """CSV 행들을 executemany 파라미터로 변환
+
+    password 컬럼은 그대로 'password'에 두었다가 _hash_passwords에서 password_hash로 바꾼다.
+    """
+    columns = list(table.columns)
+    params = [{column.name: _convert(column, row[column.name])
+               for column in columns if column.name in row}
+              for row in chunk]
+
+    if 'password_hash' in table.columns and chunk and 'password' in chunk[0]:
+        for param, row in zip(params, chunk):
+            param['password'] = row['password']
+
+    if 'birthdate' in table.columns:
+        for param in params:
+            param.setdefault('birthdate', DEFAULT_BIRTHDATE)
+            if param['birthdate'] is None:
+                param['birthdate'] = DEFAULT_BIRTHDATE
+
+    return params
+
+
+class PasswordFingerprints:
+    """지난 적재 때 각 사용자 행에 쓴 비밀번호의 HMAC (instance/loader_passwords.json)
+
+    CSV의 비밀번호가 그대로면 다시 해싱하지 않고 저장된 해시를 쓰기 위한 비교용이다.
+    SECRET_KEY와 해시 방식을 키에 넣으므로 파일만으로는 비밀번호를 대조할 수 없고,
+    PASSWORD_HASH_METHOD를 바꾸면 모두 다시 해싱한다.
+    """
+
+    def __init__(self, table_name):
+        self.table_name = table_name
+        self.path = os.path.join(current_app.instance_path, 'loader_passwords.json')
+        self._key = '{}\0{}'.format(current_app.config['SECRET_KEY'],
+                                     current_app.config['PASSWORD_HASH_METHOD']).encode('utf-8')
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                self._all = json.load(f)
+        except (OSError, ValueError):
+            self._all = {}
+        self.entries = self._all.setdefault(table_name, {})
+
+    def digest(self, row_id, password):
+        return hmac.new(self._key, f'{row_id}\0{password}'.encode('utf-8'), hashlib.sha256).hexdigest()
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp = f'{self.path}.{os.getpid()}.tmp'
+        with open(temp, 'w', encoding='utf-8') as f:
+            json.dump(self._all, f)
+        os.replace(temp, self.path)
+
+
+def _hash_passwords(params, pool, existing, fingerprints):
+    """password 컬럼을 password_hash로 바꿈 (프로세스/스레드 풀에서 해싱)
+
+    password가 비어 있으면 (app.export로 내보낸 파일) 기존 해시를 유지하고, 새 사용자는
+    NO_PASSWORD로 둔다. 지난 적재와 같은 비밀번호인 기존 사용자도 해싱 없이 저장된 해시를 쓴다.
+    """
+    targets = []
+    for param in params:
+        current = existing.get(param.get('id'))
+        kept = current['password_hash'] if current is not None else NO_PASSWORD
+        param['password_hash'] = kept
+        password = param.pop('password')
+        if not password:
+            continue
+        digest = fingerprints.digest(param.get('id'), password)
+        if kept == NO_PASSWORD or fingerprints.entries.get(str(param.get('id'))) != digest:
+            targets.append((param, password))
+        fingerprints.entries[str(param.get('id'))] = digest
+
+    passwords = [password for _, password in targets]
+    hash_password = partial(generate_password_hash,
+                            method=current_app.config['PASSWORD_HASH_METHOD'])
+    if pool is not None and passwords:
+        # 워커당 여러 묶음이 돌아가도록 나눠서 전달
+        per_task = max(1, len(passwords) // ((os.cpu_count() or 1) * 4))
+        hashes = pool.map(hash_password, passwords, chunksize=per_task)
+    else:
+        hashes = map(hash_password, passwords)
+    for (param, _), password_hash in zip(targets, hashes):
+        param['password_hash'] = password_hash
+
+
+def _existing_rows(table, params):
+    """청크의 id에 해당하는 DB의 현재 행 {id: {컬럼: 값}} (id 컬럼이 없으면 빈 dict)"""
+    if 'id' not in table.c or not params or 'id' not in params[0]:
+        return {}
+    ids = [param['id'] for param in params if param['id'] is not None]
+    rows = db.session.execute(select(table).where(table.c.id.in_(ids)))
+    return {row.id: row._asdict() for row in rows}
+
+
+def _changed(param, current):
+    """DB에 없거나 CSV 값이 현재 행과 다른지"""
+    return current is None or any(current[name] != value for name, value in param.items())
+
+
+def _upsert_statement(table, columns):
+    """기본 키 충돌 시 나머지 컬럼을 덮어쓰는 INSERT 문"""
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'sqlite':
+        stmt = sqlite.insert(table)
+    elif dialect == 'postgresql':
+        stmt = postgresql.insert(table)
+    else:
+        return insert(table)
+
+    key = [column.name for column in table.primary_key.columns]
+    updates = {name: stmt.excluded[name] for name in columns if name not in key}
+    if 'password_hash' in updates:
+        # 비밀번호 없이 내보낸 행은 기존 해시를 유지
+        updates['password_hash'] = case((stmt.excluded.password_hash == NO_PASSWORD, table.c.password_hash),
+                                        else_=stmt.excluded.password_hash)
+    if not updates:
+        return stmt.on_conflict_do_nothing(index_elements=key)
+    return stmt.on_conflict_do_update(index_elements=key, set_=updates)
+
+
+def _drop_conflicts(table, params, seen):
+    """기본 키가 아닌 유일 컬럼 값이 파일의 앞선 행이나 DB의 다른 행과 겹치는 행을 뺌
+
+    seen은 컬럼 이름 -> {값: id}로 파일 전체에 걸쳐 유지한다. (남길 행, 건너뛴 행) 반환
+    """
+    columns = [column for column in table.columns
+               if column.unique and not column.primary_key and column.name in params[0]]
+    if not columns:
+        return params, []
+
+    owners = {}
+    for column in columns:
+        values = {param[column.name] for param in params if param[column.name] is not None}
+        existing = dict(db.session.execute(select(column, table.c.id).where(column.in_(values))).all()) \
+            if 'id' in table.c and values else {}
+        owners[column.name] = {**existing, **seen.setdefault(column.name, {})}
+
+    kept, skipped = [], []
+    for param in params:
+        row_id = param.get('id')
+        conflict = any(param[column.name] is not None
+                       and owners[column.name].get(param[column.name], row_id) != row_id
+                       for column in columns)
+        if conflict:
+            skipped.append(param)
+            continue
+        kept.append(param)
+        for column in columns:
+            if param[column.name] is not None:
+                owners[column.name][param[column.name]] = row_id
+                seen[column.name][param[column.name]] = row_id
+    return kept, skipped
+
+
+def load_table(table, path, chunk_size=CHUNK_SIZE, pool=None):
+    """CSV 파일 하나를 테이블에 upsert (값이 바뀐 행만 쓰고 변경 피드에 기록)
+
+    청크마다 커밋해 해싱하는 동안 쓰기 잠금을 잡고 있지 않는다 (작업 하트비트가 기다리지 않도록).
+    유일 컬럼 값이 겹치는 행은 넣지 않고 LoadStats.skipped와 경고 로그로 알린다.
+    """
+    from app import changefeed
+    started = time.perf_counter()
+    rows = 0
+    changed = 0
+    stmt = None
+    seen = {}
+    skipped = []
+    fingerprints = None
+    for chunk in _read_chunks(path, chunk_size):
+        params, conflicts = _drop_conflicts(table, _to_params(table, chunk), seen)
+        skipped.extend(param.get('id') for param in conflicts)
+        existing = _existing_rows(table, params)
+        if params and 'password' in params[0]:
+            if fingerprints is None:
+                fingerprints = PasswordFingerprints(table.name)
+            _hash_passwords(params, pool, existing, fingerprints)
+        rows += len(params)
+        params = [param for param in params if _changed(param, existing.get(param.get('id')))]
+        if not params:
+            db.session.rollback()
+            continue
+        if stmt is None:
+            stmt = _upsert_statement(table, params[0].keys())
+        db.session.execute(stmt, params)
+        if table.name in changefeed.FEED_TABLES and 'id' in params[0]:
+            changefeed.record_upserts(db.session, table.name, [param['id'] for param in params])
+        db.session.commit()
+        changed += len(params)
+    if fingerprints is not None:
+        fingerprints.save()
+    if skipped:
+        current_app.logger.warning('%s: 유일 컬럼 값이 겹치는 %d개 행을 건너뜀 (id %s)',
+                                   table.name, len(skipped), ', '.join(map(str, skipped[:20])))
+    return LoadStats(table.name, rows, time.perf_counter() - started, skipped, changed)
+
+
+def load_all(csv_dir=CSV_DIR, chunk_size=CHUNK_SIZE, workers=None, on_table=None, use_threads=False):
+    """CSV_DIR의 모든 CSV를 외래 키 순서대로 적재 (재실행해도 안전)
+
+    on_table(LoadStats)는 테이블 하나를 커밋할 때마다 호출된다 (app.jobs의 진행률 보고).
+    use_threads면 비밀번호를 프로세스 대신 스레드 풀에서 해싱한다 (해시 함수가 GIL을 풀므로
+    병렬로 돌고, 스레드가 있는 웹 워커 안에서 fork하지 않음).
+    Core upsert는 세션 이벤트를 거치지 않으므로 끝나면 캐시/데이터 버전과 검색 색인을 직접 갱신한다.
+    """
+    from app import member_counts, search
+    from app.bulk import invalidate_caches
+    results = []
+    executor = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+    with executor(max_workers=workers) as pool:
+        for table in load_order():
+            path = os.path.join(csv_dir, CSV_FILES[table.name])
+            if not os.path.exists(path):
+                continue
+            results.append(load_table(table, path, chunk_size, pool))
+            if on_table is not None:
+                on_table(results[-1])
+    changed = [stats.table for stats in results if stats.changed]
+    # 멤버를 ORM 없이 넣었으므로 그룹별 멤버 수를 다시 셈
+    if any(table in ('group', 'member') for table in changed):
+        member_counts.recount(db.session)
+        db.session.commit()
+    if changed:
+        invalidate_caches(changed)
+        if search.is_enabled() and any(table in search.KINDS for table in changed):
+            search.rebuild_index()
+    return results
@@ -0,0 +1,138 @@
+# app/member_counts.py
+"""Group.member_count 비정규화 컬럼 유지 (ORM 변경은 같은 트랜잭션에서 증감, 대량 작업은 재계산)
+
+멤버를 ORM으로 추가/삭제/이동하면 flush 직후 같은 연결로 group.member_count를
+증감하므로 커밋/롤백이 멤버 변경과 함께 묶인다. app.bulk, app.loader처럼 ORM을
+거치지 않는 대량 작업은 recount()로 해당 그룹을 다시 센다.
+"""
+from collections import Counter
+
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import event, func, inspect, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.util import identity_key
+
+
+def _counted():
+    """그룹별 실제 멤버 수 상관 서브쿼리"""
+    from app.models import Group, Member
+    return (select(func.count(Member.id))
+            .where(Member.group_id == Group.id)
+            .scalar_subquery())
+
+
+def recount(session, group_ids=None):
+    """member_count를 실제 멤버 수로 다시 계산 (group_ids가 None이면 전체), 커밋은 호출한 쪽에서"""
+    from app.models import Group
+    stmt = update(Group).values(member_count=_counted())
+    if group_ids is not None:
+        group_ids = [group_id for group_id in set(group_ids) if group_id is not None]
+        if not group_ids:
+            return 0
+        stmt = stmt.where(Group.id.in_(group_ids))
+    result = session.execute(stmt, execution_options={'synchronize_session': False})
+    _expire(session, group_ids)
+    return result.rowcount
+
+
+def verify(session):
+    """저장된 값과 실제 멤버 수가 다른 그룹 [(그룹 id, 저장값, 실제값)] (쿼리 1번)"""
+    from app.models import Group
+    counted = _counted().label('counted')
+    return [tuple(row) for row in session.execute(
+        select(Group.id, Group.member_count, counted)
+        .where(Group.member_count != counted)
+        .order_by(Group.id))]
+
+
+def _expire(session, group_ids):
+    """세션에 올라와 있는 그룹 객체의 member_count를 다음 접근 때 다시 읽도록 만료"""
+    from app.models import Group
+    if group_ids is None:
+        targets = [obj for obj in session.identity_map.values() if isinstance(obj, Group)]
+    else:
+        targets = filter(None, (session.identity_map.get(identity_key(Group, group_id))
+                                for group_id in group_ids))
+    for group in targets:
+        session.expire(group, ['member_count'])
+
+
+def _original_group_id(member):
+    history = inspect(member).attrs.group_id.load_history()
+    if history.deleted:
+        return history.deleted[0]
+    return history.unchanged[0] if history.unchanged else None
+
+
+def _collect_deletes(session, flush_context, instances):
+    """삭제될 멤버의 원래 그룹 (flush 후에는 행이 없어 읽을 수 없으므로 미리 기록)"""
+    from app.models import Member
+    for obj in session.deleted:
+        if isinstance(obj, Member):
+            deltas = session.info.setdefault('member_count_deltas', Counter())
+            deltas[_original_group_id(obj)] -= 1
+
+
+def _apply_deltas(session, flush_context):
+    """추가/이동된 멤버를 반영해 같은 트랜잭션에서 member_count 증감"""
+    from app.models import Group, Member
+    deltas = session.info.pop('member_count_deltas', None) or Counter()
+    for obj in session.new:
+        if isinstance(obj, Member):
+            deltas[obj.group_id] += 1
+    for obj in session.dirty:
+        if isinstance(obj, Member):
+            history = inspect(obj).attrs.group_id.history
+            if history.added and history.deleted:
+                deltas[history.deleted[0]] -= 1
+                deltas[history.added[0]] += 1
+
+    changed = {group_id: delta for group_id, delta in deltas.items() if delta and group_id is not None}
+    if not changed:
+        return
+    connection = session.connection()
+    for group_id, delta in changed.items():
+        connection.execute(update(Group.__table__)
+                           .where(Group.__table__.c.id == group_id)
+                           .values(member_count=Group.__table__.c.member_count + delta))
+    _expire(session, changed)
+
+
+def _after_rollback(session, previous_transaction):
+    session.info.pop('member_count_deltas', None)
+
+
+@click.command('backfill-member-counts')
+@with_appcontext
+def backfill_command():
+    """모든 그룹의 member_count를 실제 멤버 수로 다시 채움"""
+    from app.models import db
+    drift = verify(db.session)
+    recount(db.session)
+    db.session.commit()
+    click.echo(f'그룹 {len(drift)}개의 member_count를 고쳤습니다.')
+
+
+@click.command('verify-member-counts')
+@with_appcontext
+def verify_command():
+    """member_count가 실제 멤버 수와 다른 그룹이 있으면 실패 (종료 코드 1)"""
+    from app.models import db
+    drift = verify(db.session)
+    for group_id, stored, actual in drift:
+        click.echo(f'그룹 {group_id}: 저장 {stored}, 실제 {actual}')
+    if drift:
+        raise click.ClickException(f'{len(drift)}개 그룹의 member_count가 어긋났습니다. '
+                                   '`flask backfill-member-counts`로 고칠 수 있습니다.')
+    click.echo('모든 그룹의 member_count가 맞습니다.')
+
+
+def init_app(app):
+    """세션 이벤트와 CLI 명령 등록"""
+    if not event.contains(Session, 'before_flush', _collect_deletes):
+        event.listen(Session, 'before_flush', _collect_deletes)
+        event.listen(Session, 'after_flush', _apply_deltas)
+        event.listen(Session, 'after_soft_rollback', _after_rollback)
+    app.cli.add_command(backfill_command)
+    app.cli.add_command(verify_command)
@@ -0,0 +1,247 @@
+# app/metrics.py
+"""요청별 처리 시간, SQL 횟수/시간, 템플릿 렌더링 시간 계측 (Prometheus 형식 출력)
+
+gunicorn 워커마다 따로 세므로 각 프로세스가 METRICS_DIR(기본 instance/metrics)에 자기 값을
+주기적으로 써 두고, 출력할 때 모든 파일을 합친다. 어느 워커가 스크레이프를 받아도 같은 합계가
+나오고, 끝난 워커의 파일도 남겨 두므로 누적값이 줄지 않는다.
+"""
+import glob
+import json
+import os
+import time
+from threading import Lock
+
+from flask import current_app, g, has_app_context, request, template_rendered, before_render_template
+from sqlalchemy import event
+
+# 시간 히스토그램 구간 (초)
+TIME_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# SQL 횟수 히스토그램 구간
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 500)
+
+
+class Histogram:
+    """라벨(엔드포인트)별 누적 구간 히스토그램"""
+
+    def __init__(self, name, help_text, buckets):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = buckets
+        self._series = {}  # label -> [bucket counts..., sum, count]
+        self._lock = Lock()
+
+    def observe(self, label, value):
+        with self._lock:
+            series = self._series.get(label)
+            if series is None:
+                series = self._series[label] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+                    break
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self, label_name):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            items = sorted((label, list(series)) for label, series in self._series.items())
+        for label, series in items:
+            label = _escape(label)
+            cumulative = 0
+            for bound, value in zip(self.buckets, series):
+                cumulative += value
+                lines.append(f'{self.name}_bucket{{{label_name}="{label}",le="{bound}"}} {cumulative}')
+            lines.append(f'{self.name}_bucket{{{label_name}="{label}",le="+Inf"}} {series[-1]}')
+            lines.append(f'{self.name}_sum{{{label_name}="{label}"}} {series[-2]}')
+            lines.append(f'{self.name}_count{{{label_name}="{label}"}} {series[-1]}')
+        return lines
+
+    def snapshot(self):
+        with self._lock:
+            return {label: list(series) for label, series in self._series.items()}
+
+    def merged(self, others):
+        """이 프로세스의 값에 다른 프로세스가 저장한 {라벨: series}들을 더한 Histogram"""
+        total = Histogram(self.name, self.help_text, self.buckets)
+        for series_by_label in (self.snapshot(), *others):
+            for label, series in series_by_label.items():
+                current = total._series.setdefault(label, [0] * (len(self.buckets) + 2))
+                for i, value in enumerate(series):
+                    current[i] += value
+        return total
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+REQUEST_SECONDS = Histogram('clubsite_request_duration_seconds', '요청 처리 시간', TIME_BUCKETS)
+SQL_QUERIES = Histogram('clubsite_request_sql_queries', '요청당 SQL 실행 횟수', COUNT_BUCKETS)
+SQL_SECONDS = Histogram('clubsite_request_sql_seconds', '요청당 SQL 실행 시간', TIME_BUCKETS)
+TEMPLATE_SECONDS = Histogram('clubsite_request_template_seconds', '요청당 템플릿 렌더링 시간', TIME_BUCKETS)
+
+HISTOGRAMS = (REQUEST_SECONDS, SQL_QUERIES, SQL_SECONDS, TEMPLATE_SECONDS)
+
+
+class ProcessStore:
+    """프로세스별 히스토그램 값을 디렉터리의 JSON 파일로 공유
+
+    파일 이름에 pid와 시작 시각을 넣어 pid가 재사용되어도 끝난 워커의 값을 덮어쓰지 않는다.
+    """
+
+    def __init__(self, directory=None, interval=1.0):
+        self.directory = directory
+        self.interval = interval
+        self._pid = None
+        self._path = None
+        self._written_at = 0.0
+        self._lock = Lock()
+
+    def after_fork(self):
+        """fork된 워커: 부모에서 센 값은 부모 파일에 있으므로 비우고 새 파일에 씀"""
+        for histogram in HISTOGRAMS:
+            histogram.reset()
+        self._pid = None
+        self._written_at = 0.0
+
+    def _own_path(self):
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._path = os.path.join(self.directory, f'{self._pid}-{time.time_ns()}.json')
+        return self._path
+
+    def flush(self, force=False):
+        """마지막 기록 후 interval초가 지났으면 (force면 바로) 이 프로세스의 값을 씀"""
+        if self.directory is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._written_at < self.interval:
+            return
+        with self._lock:
+            self._written_at = now
+            path = self._own_path()
+            temp = path + '.tmp'
+            with open(temp, 'w', encoding='utf-8') as f:
+                json.dump({histogram.name: histogram.snapshot() for histogram in HISTOGRAMS}, f)
+            os.replace(temp, path)
+
+    def others(self):
+        """다른 프로세스가 저장한 {히스토그램 이름: {라벨: series}} 목록"""
+        if self.directory is None:
+            return []
+        own = self._own_path()
+        results = []
+        for path in glob.glob(os.path.join(self.directory, '*.json')):
+            if path == own:
+                continue
+            try:
+                with open(path, encoding='utf-8') as f:
+                    results.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        return results
+
+
+store = ProcessStore()
+
+
+def render_prometheus():
+    """Prometheus 텍스트 형식 (version 0.0.4), 모든 워커 프로세스의 합계"""
+    store.flush(force=True)
+    others = store.others()
+    lines = []
+    for histogram in HISTOGRAMS:
+        merged = histogram.merged(other.get(histogram.name, {}) for other in others)
+        lines.extend(merged.render('endpoint'))
+    return '\n'.join(lines) + '\n'
+
+
+# SQLAlchemy 이벤트 -------------------------------------------------------
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info['query_start'].pop()
+    if has_app_context() and 'metrics_started' in g:
+        g.sql_count += 1
+        g.sql_seconds += time.perf_counter() - started
+
+
+def _handle_error(exception_context):
+    # 실패한 쿼리는 after_cursor_execute가 호출되지 않음
+    conn = exception_context.connection
+    if conn is not None and conn.info.get('query_start'):
+        conn.info['query_start'].pop()
+
+
+# 템플릿 신호 -------------------------------------------------------------
+
+def _before_render(sender, template, context, **extra):
+    if 'metrics_started' in g:
+        g.template_started = time.perf_counter()
+
+
+def _after_render(sender, template, context, **extra):
+    started = g.pop('template_started', None)
+    if started is not None:
+        g.template_seconds += time.perf_counter() - started
+
+
+# 요청 훅 -----------------------------------------------------------------
+
+def _start_request():
+    g.metrics_started = time.perf_counter()
+    g.sql_count = 0
+    g.sql_seconds = 0.0
+    g.template_seconds = 0.0
+
+
+def _finish_request(response):
+    started = g.pop('metrics_started', None)
+    if started is None:
+        return response
+    elapsed = time.perf_counter() - started
+    endpoint = request.endpoint or 'unmatched'
+
+    REQUEST_SECONDS.observe(endpoint, elapsed)
+    SQL_QUERIES.observe(endpoint, g.sql_count)
+    SQL_SECONDS.observe(endpoint, g.sql_seconds)
+    TEMPLATE_SECONDS.observe(endpoint, g.template_seconds)
+    store.flush()
+
+    if current_app.config['SERVER_TIMING_HEADER']:
+        response.headers.add('Server-Timing',
+                             f'app;dur={elapsed * 1000:.2f}, '
+                             f'db;dur={g.sql_seconds * 1000:.2f};desc="{g.sql_count} queries", '
+                             f'tpl;dur={g.template_seconds * 1000:.2f}')
+    return response
+
+
+def init_app(app):
+    """요청 훅, 템플릿 신호, 엔진별 SQL 이벤트 등록"""
+    if not app.config['METRICS_ENABLED']:
+        return
+
+    store.directory = app.config['METRICS_DIR'] or os.path.join(app.instance_path, 'metrics')
+    store.interval = app.config['METRICS_FLUSH_INTERVAL']
+    os.makedirs(store.directory, exist_ok=True)
+
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
+    before_render_template.connect(_before_render, app)
+    template_rendered.connect(_after_render, app)
+
+    from app.models import db
+    with app.app_context():
+        for engine in db.engines.values():
+            if not event.contains(engine, 'before_cursor_execute', _before_cursor_execute):
+                event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+                event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+                event.listen(engine, 'handle_error', _handle_error)
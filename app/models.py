@@ -1,10 +1,11 @@
 # app/models.py
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import UserMixin
-from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime
+from app.engine import RoutingSession
+from app.hashing import password_hasher
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 
 class User(UserMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -13,16 +14,20 @@ class User(UserMixin, db.Model):
     is_admin = db.Column(db.Boolean, default=False)
     email = db.Column(db.String(150), unique=True, nullable=False)
     birthdate = db.Column(db.Date, nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     
     # User와 Member 관계 설정
     member = db.relationship('Member', backref='user', uselist=False)
     
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = password_hasher.hash(password)
     
     def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
+        return password_hasher.verify(self.password_hash, password)
+    
+    def password_needs_rehash(self):
+        """해시 알고리즘/비용 설정이 바뀌었는지 확인"""
+        return password_hasher.needs_rehash(self.password_hash)
     
     def is_admin_user(self):
         """관리자인지 확인"""
@@ -33,14 +38,12 @@ class User(UserMixin, db.Model):
         return Member.query.filter_by(user_id=self.id).first()
     
     def get_accessible_groups(self):
-        """접근 가능한 그룹들 반환"""
+        """접근 가능한 그룹들 반환 (DB 대신 명단 스냅샷에서)"""
+        from app.snapshot import roster_snapshot
+        snapshot = roster_snapshot.get()
         if self.is_admin:
-            return Group.query.all()
-        else:
-            member = self.get_member_info()
-            if member:
-                return [member.group]
-            return []
+            return snapshot.groups
+        return list(snapshot.user_groups(self.id)[:1])
     
     def get_teams(self):
         """사용자가 속한 팀들 반환 (auth.py에서 사용)"""
@@ -56,14 +59,16 @@ class Category(db.Model):
 
 class Group(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(100), nullable=False)
-    category_id = db.Column(db.Integer, db.ForeignKey('category.id'), nullable=False)
+    name = db.Column(db.String(100), nullable=False, index=True)
+    category_id = db.Column(db.Integer, db.ForeignKey('category.id'), nullable=False, index=True)
     members = db.relationship('Member', backref='group', lazy=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # 멤버 추가/삭제/이동 시 app.member_counts가 같은 트랜잭션에서 갱신
+    member_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
     
     def get_member_count(self):
-        """그룹 멤버 수 반환"""
-        return len(self.members)
+        """그룹 멤버 수 반환 (멤버를 읽지 않고 비정규화 컬럼 사용)"""
+        return self.member_count
     
     def has_member(self, user_id):
         """특정 사용자가 이 그룹의 멤버인지 확인"""
@@ -77,5 +82,41 @@ class Member(db.Model):
     name = db.Column(db.String(100), nullable=False)
     department = db.Column(db.String(150))
     blog_url = db.Column(db.String(200))
-    group_id = db.Column(db.Integer, db.ForeignKey('group.id'), nullable=False)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=True)
\ No newline at end of file
+    group_id = db.Column(db.Integer, db.ForeignKey('group.id'), nullable=False, index=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=True, index=True)
+
+class ChangeLog(db.Model):
+    """카테고리/그룹/멤버/사용자 변경 기록 (추가만 함, id가 변경 피드 커서)"""
+    __tablename__ = 'change_log'
+    id = db.Column(db.Integer, primary_key=True)
+    table_name = db.Column(db.String(20), nullable=False)
+    row_id = db.Column(db.Integer, nullable=False)
+    op = db.Column(db.String(10), nullable=False)  # 'upsert' 또는 'delete' (삭제 표시)
+    data = db.Column(db.Text)  # upsert일 때 행의 JSON, delete면 None
+    changed_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return f'<ChangeLog {self.id} {self.op} {self.table_name}:{self.row_id}>'
+
+class Job(db.Model):
+    """백그라운드 작업 (app.jobs가 실행, 재시작 후에도 progress부터 이어서 처리)"""
+    id = db.Column(db.Integer, primary_key=True)
+    kind = db.Column(db.String(50), nullable=False)
+    params = db.Column(db.Text, nullable=False)  # JSON
+    # queued, running, succeeded, failed, cancelled
+    status = db.Column(db.String(20), nullable=False, default='queued', index=True)
+    progress = db.Column(db.Integer, nullable=False, default=0)
+    total = db.Column(db.Integer)
+    result = db.Column(db.Text)  # JSON
+    error = db.Column(db.Text)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    cancel_requested = db.Column(db.Boolean, nullable=False, default=False)
+    created_by = db.Column(db.Integer)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    run_after = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    started_at = db.Column(db.DateTime)
+    heartbeat_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+    
+    def __repr__(self):
+        return f'<Job {self.id} {self.kind} {self.status}>'
\ No newline at end of file
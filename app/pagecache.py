@@ -0,0 +1,107 @@
+# app/pagecache.py
+"""데이터 버전 기반 렌더링 결과 캐시와 조건부 GET (ETag / Last-Modified)"""
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from threading import Lock
+
+
+class DataVersion:
+    """관련 테이블 커밋마다 올라가는 버전
+
+    여러 워커 프로세스가 같은 값을 보도록 instance 폴더의 파일 mtime(ns)에 저장한다.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._lock = Lock()
+
+    def configure(self, path):
+        self.path = path
+        if not os.path.exists(path):
+            with open(path, 'a'):
+                pass
+
+    def current(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except (OSError, TypeError):
+            return 0
+
+    def bump(self):
+        with self._lock:
+            previous = self.current()
+            now = max(time.time_ns(), previous + 1)
+            try:
+                os.utime(self.path, ns=(now, now))
+            except FileNotFoundError:
+                self.configure(self.path)
+                os.utime(self.path, ns=(now, now))
+            return now
+
+
+class PageCache:
+    """(엔드포인트, 인자, 사용자)별 렌더링 결과를 보관하는 LRU 캐시"""
+
+    def __init__(self, maxsize=512):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key, version):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, version, value):
+        with self._lock:
+            self._entries[key] = (version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {'size': len(self._entries), 'maxsize': self.maxsize,
+                    'hits': self.hits, 'misses': self.misses}
+
+
+# Category/Group/Member/User 커밋마다 올라감
+data_version = DataVersion()
+page_cache = PageCache()
+
+# 이 테이블이 바뀌면 캐시된 페이지가 무효화됨
+VERSIONED_TABLES = ('category', 'group', 'member', 'user')
+
+
+def make_etag(key, version):
+    digest = hashlib.sha1(repr((key, version)).encode()).hexdigest()[:20]
+    return f'{version:x}-{digest}'
+
+
+def _after_commit(changes):
+    data_version.bump()
+
+
+def init_app(app):
+    """설정값 적용 및 커밋 알림 구독"""
+    from app import txevents
+    os.makedirs(app.instance_path, exist_ok=True)
+    data_version.configure(os.path.join(app.instance_path, 'data_version'))
+    page_cache.maxsize = app.config['PAGE_CACHE_SIZE']
+    page_cache.clear()
+    txevents.subscribe(VERSIONED_TABLES, _after_commit)
@@ -0,0 +1,142 @@
+# app/pagination.py
+"""OFFSET 없이 마지막 키 기준으로 페이지를 나누는 keyset 페이지네이션"""
+import base64
+import json
+import time
+from datetime import datetime
+from threading import Lock
+
+from sqlalchemy import tuple_
+
+
+class InvalidCursor(ValueError):
+    """해석할 수 없는 커서"""
+
+
+def encode_cursor(values, direction='next'):
+    """키 값들을 URL에 넣을 수 있는 불투명한 문자열로 변환"""
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    raw = json.dumps({'k': payload, 'd': direction}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def _convert_key(column, value):
+    """커서의 JSON 값을 컬럼 타입의 값으로 (타입이 맞지 않으면 TypeError)"""
+    if value is None:
+        return None
+    python_type = column.type.python_type
+    if python_type is datetime:
+        if not isinstance(value, str):
+            raise TypeError(value)
+        return datetime.fromisoformat(value)
+    # bool은 int의 하위 클래스이므로 따로 확인
+    if isinstance(value, bool) != (python_type is bool) or not isinstance(value, python_type):
+        raise TypeError(value)
+    return value
+
+
+def decode_cursor(cursor, columns):
+    """커서 문자열을 (키 값 목록, 방향)으로 변환 (형식이나 값 타입이 맞지 않으면 InvalidCursor)"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values = data['k']
+        direction = data['d']
+        if (direction not in ('next', 'prev') or not isinstance(values, list)
+                or len(values) != len(columns)):
+            raise ValueError(cursor)
+        converted = [_convert_key(column, value) for column, value in zip(columns, values)]
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursor(cursor) from e
+    return converted, direction
+
+
+class KeysetPage:
+    """한 페이지의 결과 (Flask-SQLAlchemy Pagination과 비슷한 속성 이름 사용)"""
+
+    def __init__(self, items, per_page, next_cursor=None, prev_cursor=None, total=None):
+        self.items = items
+        self.per_page = per_page
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+        self.total = total
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    @property
+    def has_prev(self):
+        return self.prev_cursor is not None
+
+    def __iter__(self):
+        return iter(self.items)
+
+
+# 쿼리별 COUNT 캐시 (항목 수가 넘치면 비움)
+_total_cache = {}
+_total_lock = Lock()
+TOTAL_CACHE_SIZE = 256
+
+
+def approximate_total(query, ttl=60):
+    """COUNT 결과를 ttl초 동안 재사용 (그동안의 변경은 반영되지 않음)"""
+    compiled = query.statement.compile()
+    key = (str(compiled), tuple(sorted(compiled.params.items())))
+    now = time.monotonic()
+    with _total_lock:
+        cached = _total_cache.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+    total = query.order_by(None).count()
+    with _total_lock:
+        if len(_total_cache) >= TOTAL_CACHE_SIZE:
+            _total_cache.clear()
+        _total_cache[key] = (now + ttl, total)
+    return total
+
+
+def _key_of(item, columns):
+    return [getattr(item, column.key) for column in columns]
+
+
+def keyset_paginate(query, columns, cursor=None, per_page=20, with_total=False):
+    """columns 순서로 정렬된 query에서 cursor 다음(또는 이전) 페이지를 가져옴
+
+    columns 조합은 유일해야 하므로 마지막에는 기본 키를 넣는다. (예: created_at, id)
+    """
+    direction = 'next'
+    filtered = query
+    key = tuple_(*columns) if len(columns) > 1 else columns[0]
+
+    if cursor:
+        values, direction = decode_cursor(cursor, columns)
+        bound = tuple_(*values) if len(columns) > 1 else values[0]
+        filtered = query.filter(key > bound if direction == 'next' else key < bound)
+
+    if direction == 'next':
+        ordered = filtered.order_by(*[column.asc() for column in columns])
+    else:
+        ordered = filtered.order_by(*[column.desc() for column in columns])
+
+    # 한 개 더 가져와서 다음 페이지가 있는지 확인
+    rows = ordered.limit(per_page + 1).all()
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+    if direction == 'prev':
+        rows.reverse()
+
+    next_cursor = prev_cursor = None
+    if rows:
+        if direction == 'next':
+            if has_more:
+                next_cursor = encode_cursor(_key_of(rows[-1], columns), 'next')
+            if cursor:
+                prev_cursor = encode_cursor(_key_of(rows[0], columns), 'prev')
+        else:
+            next_cursor = encode_cursor(_key_of(rows[-1], columns), 'next')
+            if has_more:
+                prev_cursor = encode_cursor(_key_of(rows[0], columns), 'prev')
+
+    total = approximate_total(query) if with_total else None
+    return KeysetPage(rows, per_page, next_cursor, prev_cursor, total)
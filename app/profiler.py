@@ -0,0 +1,256 @@
+# app/profiler.py
+"""관리자가 켜는 요청 프로파일러 (cProfile 또는 스택 샘플러, 크기 제한 디스크 저장소)
+
+예약은 instance 폴더의 JSON 파일에 두어 어느 gunicorn 워커가 예약 요청을 받아도 모든 워커에
+적용된다. 요청마다 파일 mtime만 확인하고, 바뀌었을 때만 다시 읽는다.
+"""
+import cProfile
+import fcntl
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from threading import Lock
+
+from flask import g, request
+
+MODES = ('cprofile', 'sample')
+
+# 파일 확장자 → 다운로드 형식
+FORMATS = {'.prof': 'pstats', '.collapsed': 'collapsed'}
+
+_SAFE_NAME = re.compile(r'[^A-Za-z0-9_.-]+')
+
+
+class Arm:
+    """엔드포인트 하나에 대한 프로파일링 예약 (count회 또는 rate 비율)"""
+    __slots__ = ('remaining', 'rate', 'mode')
+
+    def __init__(self, remaining=None, rate=None, mode='cprofile'):
+        self.remaining = remaining
+        self.rate = rate
+        self.mode = mode
+
+    def to_dict(self):
+        return {'remaining': self.remaining, 'rate': self.rate, 'mode': self.mode}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get('remaining'), data.get('rate'), data.get('mode', 'cprofile'))
+
+
+class StackSampler:
+    """대상 스레드의 호출 스택을 주기적으로 읽어 collapsed 형식으로 집계"""
+
+    def __init__(self, thread_id, interval=0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f'{os.path.basename(code.co_filename)}:{code.co_name}')
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def collapsed(self):
+        return ''.join(f'{stack} {count}\n' for stack, count in self.stacks.most_common())
+
+
+class ProfileStore:
+    """파일 개수와 총 크기가 제한된 프로파일 저장소 (오래된 것부터 삭제)"""
+
+    def __init__(self, directory=None, max_files=50, max_bytes=50 * 1024 * 1024):
+        self.directory = directory
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self._lock = Lock()
+
+    def _path(self, endpoint, elapsed, ext):
+        name = f'{time.strftime("%Y%m%d-%H%M%S")}-{int(time.time_ns() % 1_000_000):06d}'
+        name += f'-{_SAFE_NAME.sub("_", endpoint)}-{elapsed * 1000:.0f}ms{ext}'
+        return os.path.join(self.directory, name)
+
+    def save_cprofile(self, profile, endpoint, elapsed):
+        path = self._path(endpoint, elapsed, '.prof')
+        profile.dump_stats(path)
+        self._enforce_limits()
+        return os.path.basename(path)
+
+    def save_collapsed(self, text, endpoint, elapsed):
+        path = self._path(endpoint, elapsed, '.collapsed')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        self._enforce_limits()
+        return os.path.basename(path)
+
+    def list(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            ext = os.path.splitext(name)[1]
+            if ext in FORMATS:
+                stat = os.stat(os.path.join(self.directory, name))
+                entries.append({'name': name, 'format': FORMATS[ext],
+                                'bytes': stat.st_size, 'mtime': stat.st_mtime})
+        return sorted(entries, key=lambda e: e['name'], reverse=True)
+
+    def _enforce_limits(self):
+        with self._lock:
+            entries = sorted(self.list(), key=lambda e: e['name'])
+            total = sum(e['bytes'] for e in entries)
+            while entries and (len(entries) > self.max_files or total > self.max_bytes):
+                oldest = entries.pop(0)
+                total -= oldest['bytes']
+                try:
+                    os.remove(os.path.join(self.directory, oldest['name']))
+                except FileNotFoundError:
+                    pass
+
+
+class RequestProfiler:
+    """엔드포인트별 예약이 있을 때만 요청을 프로파일링 (예약이 없으면 파일 mtime 확인 한 번)
+
+    arms_path의 예약 파일은 모든 워커가 공유하고, 고칠 때는 '.lock' 파일을 flock으로 잠근다.
+    """
+
+    def __init__(self, arms_path=None):
+        self.store = ProfileStore()
+        self.arms_path = arms_path
+        self._arms = {}
+        self._arms_mtime = None
+        self._lock = Lock()
+        # cProfile은 동시에 하나만 실행
+        self._cprofile_lock = Lock()
+
+    def _read_arms(self):
+        try:
+            with open(self.arms_path, encoding='utf-8') as f:
+                return {endpoint: Arm.from_dict(data) for endpoint, data in json.load(f).items()}
+        except (OSError, ValueError):
+            return {}
+
+    def _current_arms(self):
+        """예약 파일이 바뀌었으면 다시 읽어 현재 예약 반환"""
+        try:
+            stat = os.stat(self.arms_path)
+            # 파일을 바꿔 끼우므로 inode도 함께 비교 (mtime 해상도가 낮은 파일 시스템 대비)
+            mtime = (stat.st_ino, stat.st_mtime_ns)
+        except (OSError, TypeError):
+            mtime = None
+        if mtime != self._arms_mtime:
+            with self._lock:
+                self._arms = self._read_arms() if mtime is not None else {}
+                self._arms_mtime = mtime
+        return self._arms
+
+    def _update(self, change):
+        """프로세스 간 잠금 안에서 예약을 읽어 change(arms)로 고친 뒤 저장, change의 반환값 반환"""
+        with self._lock, open(self.arms_path + '.lock', 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            arms = self._read_arms()
+            result = change(arms)
+            temp = f'{self.arms_path}.{os.getpid()}.tmp'
+            with open(temp, 'w', encoding='utf-8') as f:
+                json.dump({endpoint: arm.to_dict() for endpoint, arm in arms.items()}, f)
+            os.replace(temp, self.arms_path)
+            return result
+
+    def arm(self, endpoint, count=None, rate=None, mode='cprofile'):
+        """endpoint ('*'은 전체)의 다음 count개 요청 또는 rate 비율의 요청을 프로파일링"""
+        if mode not in MODES:
+            raise ValueError(f'mode must be one of {MODES}')
+        if count is None and rate is None:
+            count = 1
+        self._update(lambda arms: arms.__setitem__(endpoint, Arm(count, rate, mode)))
+
+    def disarm(self, endpoint=None):
+        self._update(lambda arms: arms.clear() if endpoint is None else arms.pop(endpoint, None))
+
+    def status(self):
+        return {endpoint: arm.to_dict() for endpoint, arm in self._current_arms().items()}
+
+    def _claim(self, endpoint):
+        """이번 요청을 프로파일링할지 결정하고 예약 횟수 차감 (횟수 예약은 모든 워커가 함께 씀)"""
+        arms = self._current_arms()
+        key = endpoint if endpoint in arms else '*'
+        arm = arms.get(key)
+        if arm is None:
+            return None
+        if arm.rate is not None and random.random() >= arm.rate:
+            return None
+        if arm.remaining is None:
+            return arm.mode
+
+        def take(arms):
+            # 다른 워커가 먼저 가져갔을 수 있으므로 잠근 뒤 다시 확인
+            current = arms.get(key)
+            if current is None or current.remaining is None or current.remaining <= 0:
+                return None
+            current.remaining -= 1
+            if current.remaining <= 0:
+                del arms[key]
+            return current.mode
+        return self._update(take)
+
+    def before_request(self):
+        if not self._current_arms():
+            return
+        mode = self._claim(request.endpoint)
+        if mode == 'cprofile':
+            if not self._cprofile_lock.acquire(blocking=False):
+                return
+            profile = cProfile.Profile()
+            profile.enable()
+            g.profiling = ('cprofile', profile, time.perf_counter())
+        elif mode == 'sample':
+            sampler = StackSampler(threading.get_ident())
+            sampler.start()
+            g.profiling = ('sample', sampler, time.perf_counter())
+
+    def teardown_request(self, exc):
+        profiling = g.pop('profiling', None)
+        if profiling is None:
+            return
+        mode, profiler, started = profiling
+        elapsed = time.perf_counter() - started
+        endpoint = request.endpoint or 'unmatched'
+        if mode == 'cprofile':
+            profiler.disable()
+            self._cprofile_lock.release()
+            self.store.save_cprofile(profiler, endpoint, elapsed)
+        else:
+            profiler.stop()
+            self.store.save_collapsed(profiler.collapsed(), endpoint, elapsed)
+
+
+request_profiler = RequestProfiler()
+
+
+def init_app(app):
+    store = request_profiler.store
+    store.directory = app.config['PROFILE_DIR'] or os.path.join(app.instance_path, 'profiles')
+    store.max_files = app.config['PROFILE_MAX_FILES']
+    store.max_bytes = app.config['PROFILE_MAX_BYTES']
+    os.makedirs(store.directory, exist_ok=True)
+    request_profiler.arms_path = os.path.join(app.instance_path, 'profiler_arms.json')
+
+    app.before_request(request_profiler.before_request)
+    app.teardown_request(request_profiler.teardown_request)
@@ -0,0 +1,154 @@
+# app/querywatch.py
+"""개발/CI용 N+1 지연 로딩 감지와 엔드포인트별 쿼리 예산 (QUERY_WATCH)
+
+QUERY_WATCH가 'warn', 'log', 'raise' 중 하나면 요청마다 SQL 실행과 관계 지연 로딩을
+기록한다. 같은 관계를 같은 코드 줄에서 QUERY_WATCH_NPLUSONE_THRESHOLD번 이상 지연
+로딩하면 N+1로, decorators.query_budget(n)을 붙인 뷰가 쿼리를 n개보다 많이 실행하면
+예산 초과로 보고한다. 보고에는 쿼리를 일으킨 코드 줄과 템플릿 줄이 함께 나온다.
+운영에서는 꺼 두며 (기본값), 꺼져 있으면 이벤트를 등록하지 않는다.
+"""
+import os
+import sys
+import warnings
+from collections import Counter, deque
+from threading import Lock
+
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+MODES = ('warn', 'log', 'raise')
+
+
+class QueryWatchWarning(UserWarning):
+    """QUERY_WATCH=warn일 때 내는 경고"""
+
+
+class QueryWatchError(RuntimeError):
+    """QUERY_WATCH=raise일 때 N+1이나 예산 초과가 있으면 발생"""
+
+
+def _origin():
+    """(코드 위치, 템플릿 위치): 쿼리를 일으킨 첫 번째 앱 코드 줄과 렌더링 중인 템플릿 줄"""
+    code = template = None
+    frame = sys._getframe(1)
+    while frame is not None and (code is None or template is None):
+        jinja_template = frame.f_globals.get('__jinja_template__')
+        if jinja_template is not None:
+            if template is None:
+                lineno = jinja_template.get_corresponding_lineno(frame.f_lineno)
+                template = f'{jinja_template.name or "<string>"}:{lineno}'
+        elif code is None:
+            module = frame.f_globals.get('__name__', '')
+            if (module == 'app' or module.startswith('app.')) and module != __name__:
+                path = os.path.relpath(frame.f_code.co_filename, os.path.dirname(current_app.root_path))
+                code = f'{path}:{frame.f_lineno} ({frame.f_code.co_name})'
+        frame = frame.f_back
+    return code, template
+
+
+class QueryWatch:
+    """현재 요청의 쿼리/지연 로딩 기록과 최근 보고 보관"""
+
+    def __init__(self):
+        self.mode = None
+        self.threshold = 2
+        self.recent = deque(maxlen=50)
+        self._lock = Lock()
+
+    @property
+    def enabled(self):
+        return self.mode in MODES
+
+    def current(self):
+        """현재 요청의 기록 (꺼져 있거나 요청 밖이면 None)"""
+        if not has_request_context():
+            return None
+        return g.get('query_watch')
+
+    def record_query(self):
+        state = self.current()
+        if state is not None:
+            state['queries'] += 1
+            state['origins'][_origin()] += 1
+
+    def record_lazy_load(self, relationship):
+        state = self.current()
+        if state is not None:
+            state['lazy_loads'][(relationship, *_origin())] += 1
+
+    def findings(self, state):
+        """임계값 이상 반복된 지연 로딩 목록"""
+        return [{'relationship': relationship, 'count': count, 'code': code, 'template': template}
+                for (relationship, code, template), count in state['lazy_loads'].most_common()
+                if count >= self.threshold]
+
+    def report(self, kind, message, details):
+        """설정된 방식으로 보고 (raise면 예외)"""
+        entry = {'kind': kind, 'endpoint': request.endpoint, 'path': request.path,
+                 'message': message, 'details': details}
+        with self._lock:
+            self.recent.append(entry)
+        lines = [message]
+        for detail in details:
+            where = ', '.join(filter(None, (detail.get('code'), detail.get('template'))))
+            lines.append(f'  {detail["count"]}x {detail.get("relationship", "query")} at {where or "?"}')
+        text = '\n'.join(lines)
+        if self.mode == 'raise':
+            raise QueryWatchError(text)
+        if self.mode == 'warn':
+            warnings.warn(text, QueryWatchWarning, stacklevel=2)
+        else:
+            current_app.logger.warning(text)
+
+    def stats(self):
+        with self._lock:
+            return {'mode': self.mode, 'threshold': self.threshold, 'recent': list(self.recent)}
+
+
+query_watch = QueryWatch()
+
+
+# 이벤트와 요청 훅 -------------------------------------------------------
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    query_watch.record_query()
+
+
+def _on_orm_execute(orm_execute_state):
+    if orm_execute_state.is_relationship_load and orm_execute_state.lazy_loaded_from is not None:
+        query_watch.record_lazy_load(str(orm_execute_state.loader_strategy_path.prop))
+
+
+def _start_request():
+    g.query_watch = {'queries': 0, 'origins': Counter(), 'lazy_loads': Counter()}
+
+
+def _finish_request(response):
+    state = g.pop('query_watch', None)
+    if state is not None:
+        findings = query_watch.findings(state)
+        if findings:
+            query_watch.report('n+1', f'{request.endpoint}: 반복된 지연 로딩 {len(findings)}건 '
+                                      f'(쿼리 {state["queries"]}개)', findings)
+    return response
+
+
+def init_app(app):
+    """QUERY_WATCH가 켜져 있을 때만 요청 훅과 SQL/ORM 이벤트 등록"""
+    mode = (app.config['QUERY_WATCH'] or '').lower()
+    query_watch.mode = mode if mode in MODES else None
+    query_watch.threshold = app.config['QUERY_WATCH_NPLUSONE_THRESHOLD']
+    if not query_watch.enabled:
+        return
+
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
+    if not event.contains(Session, 'do_orm_execute', _on_orm_execute):
+        event.listen(Session, 'do_orm_execute', _on_orm_execute)
+
+    from app.models import db
+    with app.app_context():
+        for engine in db.engines.values():
+            if not event.contains(engine, 'after_cursor_execute', _after_cursor_execute):
+                event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
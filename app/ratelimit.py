@@ -0,0 +1,88 @@
+# app/ratelimit.py
+"""메모리 기반 토큰 버킷 요청 제한 (키 해시로 샤드를 나눠 락 경합을 줄임)
+
+버킷은 프로세스 메모리에 있으므로 제한은 gunicorn 워커마다 따로 적용된다
+(워커 N개면 한 클라이언트가 최대 N배까지 통과할 수 있음). 리버스 프록시 뒤에서는
+PROXY_FIX_X_FOR를 프록시 단계 수로 설정해야 클라이언트 주소별로 나뉜다.
+"""
+import time
+from threading import Lock
+
+# 샤드마다 이 횟수만큼 요청이 들어오면 오래된 버킷 정리
+SWEEP_EVERY = 1024
+
+
+class _Shard:
+    __slots__ = ('lock', 'buckets', 'ops')
+
+    def __init__(self):
+        self.lock = Lock()
+        self.buckets = {}  # key -> [tokens, last_refill]
+        self.ops = 0
+
+
+class TokenBucketLimiter:
+    """capacity개까지 쌓이고 초당 rate개씩 채워지는 키별 토큰 버킷"""
+
+    def __init__(self, capacity, rate, shards=16, idle_ttl=None):
+        self.capacity = float(capacity)
+        self.rate = float(rate)
+        # 가득 찰 때까지 걸리는 시간이 지나면 버킷을 지워도 결과가 같음
+        self.idle_ttl = idle_ttl if idle_ttl is not None else self.capacity / self.rate
+        self._shards = [_Shard() for _ in range(shards)]
+
+    def _shard(self, key):
+        return self._shards[hash(key) % len(self._shards)]
+
+    def consume(self, key, tokens=1.0):
+        """토큰을 쓰고 (허용 여부, 다시 시도까지 남은 초)를 반환"""
+        now = time.monotonic()
+        shard = self._shard(key)
+        with shard.lock:
+            shard.ops += 1
+            if shard.ops % SWEEP_EVERY == 0:
+                self._sweep(shard, now)
+
+            bucket = shard.buckets.get(key)
+            if bucket is None:
+                bucket = shard.buckets[key] = [self.capacity, now]
+            else:
+                bucket[0] = min(self.capacity, bucket[0] + (now - bucket[1]) * self.rate)
+                bucket[1] = now
+
+            if bucket[0] >= tokens:
+                bucket[0] -= tokens
+                return True, 0.0
+            return False, (tokens - bucket[0]) / self.rate
+
+    def _sweep(self, shard, now):
+        expired = [key for key, (_, last) in shard.buckets.items() if now - last > self.idle_ttl]
+        for key in expired:
+            del shard.buckets[key]
+
+    def sweep(self):
+        """모든 샤드의 오래된 버킷 정리"""
+        now = time.monotonic()
+        for shard in self._shards:
+            with shard.lock:
+                self._sweep(shard, now)
+
+    def __len__(self):
+        return sum(len(shard.buckets) for shard in self._shards)
+
+
+# 클라이언트 주소 / 사용자명 기준 제한기 (init_app에서 설정값으로 교체)
+limiters = {}
+
+
+def init_app(app):
+    """제한기 생성, 프록시 뒤라면 X-Forwarded-For의 클라이언트 주소를 remote_addr로 사용"""
+    config = app.config
+    if config['PROXY_FIX_X_FOR']:
+        from werkzeug.middleware.proxy_fix import ProxyFix
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=config['PROXY_FIX_X_FOR'])
+    limiters.clear()
+    if not config['AUTH_RATE_LIMIT_ENABLED']:
+        return
+    limiters['address'] = TokenBucketLimiter(*config['AUTH_RATE_LIMIT_PER_ADDRESS'])
+    limiters['username'] = TokenBucketLimiter(*config['AUTH_RATE_LIMIT_PER_USERNAME'])
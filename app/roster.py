@@ -0,0 +1,117 @@
+# app/roster.py
+"""카테고리 → 그룹 → 멤버 → 사용자 트리를 고정된 쿼리 수로 읽어오는 데이터 접근 계층"""
+import csv
+import io
+import json
+from itertools import groupby
+
+from sqlalchemy.orm import configure_mappers, selectinload
+
+from app.models import db, User, Category, Group, Member
+
+# 서버 측 커서에서 한 번에 가져올 행 수
+STREAM_CHUNK_SIZE = 500
+
+# CSV 내보내기 컬럼 (멤버 한 명당 한 행)
+CSV_COLUMNS = ['group_id', 'group_name', 'category', 'member_name',
+               'department', 'blog_url', 'email', 'joined_at']
+
+
+def load_category_tree():
+    """카테고리 → 그룹 → 멤버 → 사용자 트리를 4번의 쿼리로 로드"""
+    # Member.user는 backref라서 매퍼 설정 이후에만 접근 가능
+    configure_mappers()
+    return (Category.query
+            .options(selectinload(Category.groups)
+                     .selectinload(Group.members)
+                     .selectinload(Member.user))
+            .order_by(Category.id)
+            .all())
+
+
+def _roster_query():
+    """그룹/카테고리/멤버/사용자를 한 번에 조인한 projection 쿼리"""
+    return (db.session.query(Group.id.label('group_id'),
+                             Group.name.label('group_name'),
+                             Category.name.label('category'),
+                             Member.id.label('member_id'),
+                             Member.name.label('member_name'),
+                             Member.department,
+                             Member.blog_url,
+                             User.email,
+                             User.created_at)
+            .join(Category, Group.category_id == Category.id)
+            .outerjoin(Member, Member.group_id == Group.id)
+            .outerjoin(User, Member.user_id == User.id)
+            .order_by(Group.id, Member.id))
+
+
+def _member_info(row):
+    """조인 결과 한 행을 템플릿용 멤버 정보로 변환"""
+    member_info = {
+        'name': row.member_name,
+        'department': row.department or '미설정',
+        'blog_url': row.blog_url or '없음'
+    }
+    if row.email is not None:
+        member_info.update({
+            'email': row.email,
+            'joined_at': row.created_at.strftime('%Y-%m-%d') if row.created_at else None
+        })
+    return member_info
+
+
+def iter_groups_data(chunk_size=STREAM_CHUNK_SIZE):
+    """그룹 하나씩 group_data 딕셔너리를 생성 (쿼리 1번, 메모리는 그룹 하나 분량)"""
+    rows = _roster_query().execution_options(stream_results=True,
+                                             yield_per=chunk_size)
+    for _, group_rows in groupby(rows, key=lambda row: row.group_id):
+        first = None
+        members_data = []
+        for row in group_rows:
+            if first is None:
+                first = row
+            if row.member_id is not None:
+                members_data.append(_member_info(row))
+
+        yield {
+            'id': first.group_id,
+            'name': first.group_name,
+            'category': first.category,
+            'member_count': len(members_data),
+            'members': members_data
+        }
+
+
+def load_groups_data():
+    """전체 그룹 데이터를 리스트로 반환"""
+    return list(iter_groups_data())
+
+
+def stream_ndjson(chunk_size=STREAM_CHUNK_SIZE):
+    """그룹 하나당 한 줄의 NDJSON 생성기"""
+    for group in iter_groups_data(chunk_size):
+        yield json.dumps(group, ensure_ascii=False) + '\n'
+
+
+def stream_csv(chunk_size=STREAM_CHUNK_SIZE):
+    """멤버 한 명당 한 행의 CSV 생성기 (엑셀 호환을 위해 BOM 포함)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush():
+        data = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return data
+
+    buffer.write('\ufeff')
+    writer.writerow(CSV_COLUMNS)
+    yield flush()
+
+    for group in iter_groups_data(chunk_size):
+        for member in group['members']:
+            writer.writerow([group['id'], group['name'], group['category'],
+                             member['name'], member['department'], member['blog_url'],
+                             member.get('email', ''), member.get('joined_at') or ''])
+        yield flush()
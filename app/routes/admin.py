@@ -1,7 +1,10 @@
 # app/routes/admin.py
-from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
+import math
+import os
+from flask import (Blueprint, render_template, request, redirect, url_for, flash, jsonify,
+                   Response, abort, current_app, send_from_directory, stream_template, stream_with_context)
 from flask_login import current_user
-from sqlalchemy import func
+from app.decorators import query_budget
 
 admin_bp = Blueprint('admin', __name__)
 
@@ -9,50 +12,53 @@ admin_bp = Blueprint('admin', __name__)
 def dashboard():
     """관리자 대시보드"""
     # 함수 내부에서 import하여 순환 import 방지
-    from app.models import db, User, Group, Member, Category
-    from app.decorators import admin_required
+    from app.stats import dashboard_stats
     
     # 데코레이터 수동 적용
     if not current_user.is_authenticated or not current_user.is_admin_user():
         flash('관리자 권한이 필요합니다.', 'error')
         return redirect(url_for('auth.login'))
     
-    # 통계 정보 수집
-    total_users = User.query.count()
-    total_groups = Group.query.count()
-    total_members = Member.query.count()
-    
-    # 카테고리별 그룹 수
-    group_stats = (db.session.query(Category.name, func.count(Group.id).label('count'))
-                   .join(Group, Category.id == Group.category_id)
-                   .group_by(Category.name).all())
-    
-    # 최근 가입한 사용자들
-    recent_users = User.query.order_by(User.created_at.desc()).limit(5).all()
-    
+    # 통계 정보는 미리 계산된 스냅샷 사용
     return render_template('admin/dashboard.html',
                          title='관리자 대시보드',
-                         total_users=total_users,
-                         total_groups=total_groups,
-                         total_members=total_members,
-                         group_stats=group_stats,
-                         recent_users=recent_users)
+                         **dashboard_stats.snapshot())
+
+@admin_bp.route('/dashboard/stats-check')
+def dashboard_stats_check():
+    """대시보드 통계 카운터를 DB와 비교하고 다시 계산"""
+    from app.stats import dashboard_stats
+    
+    if not current_user.is_authenticated or not current_user.is_admin_user():
+        flash('관리자 권한이 필요합니다.', 'error')
+        return redirect(url_for('auth.login'))
+    
+    drift = dashboard_stats.check_consistency(repair=True)
+    return jsonify({
+        'consistent': not drift,
+        'drift': {name: {'counter': cached, 'db': actual}
+                  for name, (cached, actual) in drift.items()}
+    })
 
 @admin_bp.route('/users')
+@query_budget(3)
 def manage_users():
     """사용자 관리 페이지"""
     from app.models import User
+    from app.pagination import keyset_paginate, InvalidCursor
     
     if not current_user.is_authenticated or not current_user.is_admin_user():
         flash('관리자 권한이 필요합니다.', 'error')
         return redirect(url_for('auth.login'))
     
-    page = request.args.get('page', 1, type=int)
+    cursor = request.args.get('cursor')
     per_page = 20
     
-    users = User.query.paginate(
-        page=page, per_page=per_page, error_out=False
-    )
+    # OFFSET 대신 마지막 id 기준으로 조회 (전체 수는 캐시된 근사값)
+    try:
+        users = keyset_paginate(User.query, [User.id], cursor, per_page, with_total=True)
+    except InvalidCursor:
+        abort(400)
     
     return render_template('admin/users.html',
                          title='사용자 관리',
@@ -62,6 +68,7 @@ def manage_users():
 def toggle_user_admin(user_id):
     """사용자 관리자 권한 토글"""
     from app.models import db, User
+    from app.identity import identity_cache
     
     if not current_user.is_authenticated or not current_user.is_admin_user():
         flash('관리자 권한이 필요합니다.', 'error')
@@ -79,6 +86,7 @@ def toggle_user_admin(user_id):
     new_status = '관리자' if user.is_admin else '일반사용자'
     
     db.session.commit()
+    identity_cache.invalidate(user.id)
     
     flash(f'{user.name}의 권한이 {old_status}에서 {new_status}로 변경되었습니다.', 'success')
     return redirect(url_for('admin.manage_users'))
@@ -87,6 +95,7 @@ def toggle_user_admin(user_id):
 def delete_user(user_id):
     """사용자 삭제"""
     from app.models import db, User
+    from app.identity import identity_cache
     
     if not current_user.is_authenticated or not current_user.is_admin_user():
         flash('관리자 권한이 필요합니다.', 'error')
@@ -103,36 +112,49 @@ def delete_user(user_id):
     
     db.session.delete(user)
     db.session.commit()
+    identity_cache.invalidate(user_id)
     
     flash(f'{username} 사용자가 삭제되었습니다.', 'info')
     return redirect(url_for('admin.manage_users'))
 
 @admin_bp.route('/groups')
+@query_budget(3)
 def manage_groups():
     """그룹 관리 페이지"""
     from app.models import Group
+    from app.pagination import keyset_paginate, InvalidCursor
     
     if not current_user.is_authenticated or not current_user.is_admin_user():
         flash('관리자 권한이 필요합니다.', 'error')
         return redirect(url_for('auth.login'))
     
-    groups = Group.query.all()
+    try:
+        groups = keyset_paginate(Group.query, [Group.id], request.args.get('cursor'),
+                                 per_page=20, with_total=True)
+    except InvalidCursor:
+        abort(400)
     
     return render_template('admin/groups.html',
                          title='그룹 관리',
                          groups=groups)
 
 @admin_bp.route('/groups/<int:group_id>')
+@query_budget(3)
 def group_admin_detail(group_id):
     """관리자용 그룹 상세 정보"""
     from app.models import Group, Member
+    from app.pagination import keyset_paginate, InvalidCursor
     
     if not current_user.is_authenticated or not current_user.is_admin_user():
         flash('관리자 권한이 필요합니다.', 'error')
         return redirect(url_for('auth.login'))
     
     group = Group.query.get_or_404(group_id)
-    members = Member.query.filter_by(group_id=group_id).all()
+    try:
+        members = keyset_paginate(Member.query.filter_by(group_id=group_id), [Member.id],
+                                  request.args.get('cursor'), per_page=50)
+    except InvalidCursor:
+        abort(400)
     
     return render_template('admin/group_detail.html',
                          title=f'{group.name} 그룹 관리',
@@ -181,57 +203,413 @@ def create_group():
 
 @admin_bp.route('/groups/<int:group_id>/delete', methods=['POST'])
 def delete_group(group_id):
-    """그룹 삭제"""
-    from app.models import db, Group
+    """그룹 삭제 (소속 멤버까지 백그라운드 작업으로 삭제)"""
+    from app.models import Group
+    from app.jobs import enqueue
     
     if not current_user.is_authenticated or not current_user.is_admin_user():
         flash('관리자 권한이 필요합니다.', 'error')
         return redirect(url_for('auth.login'))
     
     group = Group.query.get_or_404(group_id)
-    group_name = group.name
+    job = enqueue('delete-groups', {'ids': [group.id]}, current_user.id)
     
-    db.session.delete(group)
-    db.session.commit()
-    
-    flash(f'{group_name} 그룹이 삭제되었습니다.', 'info')
+    flash(f'{group.name} 그룹 삭제를 시작했습니다. (작업 #{job.id})', 'info')
     return redirect(url_for('admin.manage_groups'))
 
+@admin_bp.route('/export/<table>.<fmt>')
+def export_table(table, fmt):
+    """사용자/멤버/그룹/카테고리 스트리밍 내보내기 (CSV / JSONL / XLSX, seed.py로 다시 적재 가능)"""
+    from app.export import layouts, STREAMS, FORMATS
+    
+    if not current_user.is_authenticated or not current_user.is_admin_user():
+        flash('관리자 권한이 필요합니다.', 'error')
+        return redirect(url_for('auth.login'))
+    
+    if table not in layouts() or fmt not in STREAMS:
+        abort(404)
+    
+    return Response(stream_with_context(STREAMS[fmt](table)),
+                    mimetype=FORMATS[fmt],
+                    headers={'Content-Disposition': f'attachment; filename={table}.{fmt}'})
+
+@admin_bp.route('/users/bulk-delete', methods=['POST'])
+def bulk_delete_users():
+    """사용자 일괄 삭제 (JSON {"ids": [...]} 또는 폼 ids)"""
+    from app.bulk import parse_ids, delete_users, summarize, BatchTooLarge
+    
+    if not current_user.is_authenticated or not current_user.is_admin_user():
+        flash('관리자 권한이 필요합니다.', 'error')
+        return redirect(url_for('auth.login'))
+    
+    try:
+        ids = parse_ids(request)
+    except BatchTooLarge as e:
+        return jsonify({'error': str(e)}), 413
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    return jsonify(summarize(delete_users(ids, current_user.id)))
+
+@admin_bp.route('/users/bulk-admin-toggle', methods=['POST'])
+def bulk_toggle_user_admin():
+    """관리자 권한 일괄 변경 (is_admin을 주면 그 값으로, 안 주면 각자 반전)"""
+    from app.bulk import parse_ids, toggle_admin, summarize, BatchTooLarge
+    
+    if not current_user.is_authenticated or not current_user.is_admin_user():
+        flash('관리자 권한이 필요합니다.', 'error')
+        return redirect(url_for('auth.login'))
+    
+    try:
+        ids = parse_ids(request)
+    except BatchTooLarge as e:
+        return jsonify({'error': str(e)}), 413
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    payload = request.get_json(silent=True) or {}
+    value = payload.get('is_admin') if isinstance(payload, dict) else None
+    if value is None and request.form.get('is_admin') is not None:
+        value = request.form.get('is_admin').lower() in ('1', 'true', 'yes')
+    
+    return jsonify(summarize(toggle_admin(ids, current_user.id, value)))
+
+@admin_bp.route('/members/bulk-move', methods=['POST'])
+def bulk_move_members():
+    """멤버들을 group_id 그룹으로 일괄 이동"""
+    from app.bulk import parse_ids, move_members, summarize, BatchTooLarge
+    
+    if not current_user.is_authenticated or not current_user.is_admin_user():
+        flash('관리자 권한이 필요합니다.', 'error')
+        return redirect(url_for('auth.login'))
+    
+    try:
+        ids = parse_ids(request)
+    except BatchTooLarge as e:
+        return jsonify({'error': str(e)}), 413
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    payload = request.get_json(silent=True)
+    group_id = payload.get('group_id') if isinstance(payload, dict) else request.form.get('group_id')
+    try:
+        results = move_members(ids, int(group_id))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'group_id는 정수여야 합니다.'}), 400
+    except LookupError as e:
+        return jsonify({'error': str(e)}), 404
+    
+    return jsonify(summarize(results))
+
+@admin_bp.route('/groups/bulk-delete', methods=['POST'])
+def bulk_delete_groups():
+    """그룹과 소속 멤버 일괄 삭제"""
+    from app.bulk import parse_ids, delete_groups, summarize, BatchTooLarge
+    
+    if not current_user.is_authenticated or not current_user.is_admin_user():
+        flash('관리자 권한이 필요합니다.', 'error')
+        return redirect(url_for('auth.login'))
+    
+    try:
+        ids = parse_ids(request)
+    except BatchTooLarge as e:
+        return jsonify({'error': str(e)}), 413
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    results, deleted_members = delete_groups(ids)
+    return jsonify({**summarize(results), 'deleted_members': deleted_members})
+
+@admin_bp.route('/identity-cache')
+def identity_cache_stats():
+    """사용자 캐시 적중률 (관리자 전용)"""
+    from app.identity import identity_cache
+    
+    if not current_user.is_authenticated or not current_user.is_admin_user():
+        flash('관리자 권한이 필요합니다.', 'error')
+        return redirect(url_for('auth.login'))
+    
+    return jsonify(identity_cache.stats())
+
+@admin_bp.route('/roster-snapshot')
+def roster_snapshot_stats():
+    """명단 스냅샷 크기와 재생성 시간 (관리자 전용)"""
+    from app.snapshot import roster_snapshot
+    
+    if not current_user.is_authenticated or not current_user.is_admin_user():
+        flash('관리자 권한이 필요합니다.', 'error')
+        return redirect(url_for('auth.login'))
+    
+    return jsonify(roster_snapshot.stats())
+
+@admin_bp.route('/changes')
+def changes():
+    """since 커서 이후의 변경 목록 (wait초까지 새 변경을 기다리는 long-poll, 관리자 전용)"""
+    from app.changefeed import InvalidSince, change_feed, parse_since, serialize
+    
+    if not current_user.is_authenticated or not current_user.is_admin_user():
+        flash('관리자 권한이 필요합니다.', 'error')
+        return redirect(url_for('auth.login'))
+    
+    try:
+        since = parse_since(request.args.get('since'))
+    except InvalidSince:
+        return jsonify({'error': '잘못된 since 커서입니다.'}), 400
+    limit = min(max(request.args.get('limit', current_app.config['CHANGES_BATCH_SIZE'], type=int), 1),
+                current_app.config['CHANGES_MAX_BATCH_SIZE'])
+    wait = request.args.get('wait', 0, type=float)
+    if not math.isfinite(wait):
+        return jsonify({'error': '잘못된 wait 값입니다.'}), 400
+    wait = min(max(wait, 0), current_app.config['CHANGES_MAX_WAIT'])
+    
+    # 보관 기간이 지나 지워진 변경이 있으면 이어 받을 수 없으므로, 먼저 현재 커서를 받아 두고
+    # 전체를 다시 읽은 뒤 그 커서부터 이어 받도록 안내 (410)
+    if since < change_feed.oldest_cursor():
+        return jsonify({
+            'error': '커서가 너무 오래되어 그 뒤의 변경 기록이 정리되었습니다. 전체를 다시 읽어 주세요.',
+            'resync': True,
+            'cursor': str(change_feed.latest_cursor()),
+        }), 410
+    
+    rows, has_more = change_feed.poll(since, limit, wait)
+    return jsonify({
+        'changes': [serialize(row) for row in rows],
+        'next_cursor': str(rows[-1].id if rows else since),
+        'has_more': has_more,
+    })
+
+@admin_bp.route('/jobs')
+@query_budget(2)
+def jobs():
+    """최근 백그라운드 작업 목록 (status로 거를 수 있음, 관리자 전용)"""
+    from app.models import Job
+    from app.jobs import to_dict
+    
+    if not current_user.is_authenticated or not current_user.is_admin_user():
+        flash('관리자 권한이 필요합니다.', 'error')
+        return redirect(url_for('auth.login'))
+    
+    query = Job.query.order_by(Job.id.desc())
+    status = request.args.get('status')
+    if status:
+        query = query.filter_by(status=status)
+    return jsonify({'jobs': [to_dict(job) for job in query.limit(50)]})
+
+@admin_bp.route('/jobs/<kind>', methods=['POST'])
+def start_job(kind):
+    """백그라운드 작업 시작 (delete-users, delete-groups, move-members, import-roster)"""
+    from app.bulk import BatchTooLarge
+    from app.jobs import KINDS, enqueue, to_dict
+    
+    if not current_user.is_authenticated or not current_user.is_admin_user():
+        flash('관리자 권한이 필요합니다.', 'error')
+        return redirect(url_for('auth.login'))
+    
+    if kind not in KINDS:
+        return jsonify({'error': f'알 수 없는 작업입니다. (사용 가능: {", ".join(KINDS)})'}), 404
+    try:
+        params = KINDS[kind].parse(request, current_user.id)
+    except BatchTooLarge as e:
+        return jsonify({'error': str(e)}), 413
+    except LookupError as e:
+        return jsonify({'error': str(e)}), 404
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    job = enqueue(kind, params, current_user.id)
+    return jsonify({'job': to_dict(job)}), 202, {'Location': url_for('admin.job_status', job_id=job.id)}
+
+@admin_bp.route('/jobs/<int:job_id>')
+def job_status(job_id):
+    """작업 상태와 진행률"""
+    from app.models import Job
+    from app.jobs import to_dict
+    
+    if not current_user.is_authenticated or not current_user.is_admin_user():
+        flash('관리자 권한이 필요합니다.', 'error')
+        return redirect(url_for('auth.login'))
+    
+    return jsonify({'job': to_dict(Job.query.get_or_404(job_id))})
+
+@admin_bp.route('/jobs/<int:job_id>/cancel', methods=['POST'])
+def cancel_job(job_id):
+    """대기 중인 작업은 바로, 실행 중인 작업은 다음 묶음 전에 취소"""
+    from app.models import Job
+    from app.jobs import cancel, to_dict
+    
+    if not current_user.is_authenticated or not current_user.is_admin_user():
+        flash('관리자 권한이 필요합니다.', 'error')
+        return redirect(url_for('auth.login'))
+    
+    job = Job.query.get_or_404(job_id)
+    if not cancel(job):
+        return jsonify({'error': '이미 끝난 작업입니다.', 'job': to_dict(job)}), 409
+    return jsonify({'job': to_dict(job)})
+
+@admin_bp.route('/jobs/<int:job_id>/retry', methods=['POST'])
+def retry_job(job_id):
+    """실패하거나 취소된 작업을 남은 부분부터 다시 실행"""
+    from app.models import Job
+    from app.jobs import retry, to_dict
+    
+    if not current_user.is_authenticated or not current_user.is_admin_user():
+        flash('관리자 권한이 필요합니다.', 'error')
+        return redirect(url_for('auth.login'))
+    
+    job = Job.query.get_or_404(job_id)
+    if not retry(job):
+        return jsonify({'error': '실패하거나 취소된 작업만 다시 실행할 수 있습니다.', 'job': to_dict(job)}), 409
+    return jsonify({'job': to_dict(job)}), 202
+
+@admin_bp.route('/query-watch')
+def query_watch_status():
+    """최근 N+1 / 쿼리 예산 초과 보고 (QUERY_WATCH가 켜져 있을 때, 관리자 전용)"""
+    from app.querywatch import query_watch
+    
+    if not current_user.is_authenticated or not current_user.is_admin_user():
+        flash('관리자 권한이 필요합니다.', 'error')
+        return redirect(url_for('auth.login'))
+    
+    return jsonify(query_watch.stats())
+
+@admin_bp.route('/password-hashing')
+def password_hashing_stats():
+    """비밀번호 해싱 지연 시간과 대기열 상태 (관리자 전용)"""
+    from app.hashing import password_hasher
+    
+    if not current_user.is_authenticated or not current_user.is_admin_user():
+        flash('관리자 권한이 필요합니다.', 'error')
+        return redirect(url_for('auth.login'))
+    
+    return jsonify(password_hasher.stats())
+
+@admin_bp.route('/metrics')
+def metrics():
+    """엔드포인트별 처리 시간/SQL/템플릿 히스토그램 (Prometheus 형식, 관리자 전용)"""
+    from app.metrics import render_prometheus
+    
+    if not current_user.is_authenticated or not current_user.is_admin_user():
+        flash('관리자 권한이 필요합니다.', 'error')
+        return redirect(url_for('auth.login'))
+    
+    return Response(render_prometheus(), mimetype='text/plain; version=0.0.4')
+
+@admin_bp.route('/profiler')
+def profiler_status():
+    """프로파일링 예약 상태와 저장된 프로파일 목록 (관리자 전용)"""
+    from app.profiler import request_profiler
+    
+    if not current_user.is_authenticated or not current_user.is_admin_user():
+        flash('관리자 권한이 필요합니다.', 'error')
+        return redirect(url_for('auth.login'))
+    
+    return jsonify({'armed': request_profiler.status(),
+                    'profiles': request_profiler.store.list()})
+
+@admin_bp.route('/profiler/arm', methods=['POST'])
+def profiler_arm():
+    """엔드포인트의 다음 N개 요청 또는 일정 비율의 요청을 프로파일링"""
+    from app.profiler import request_profiler
+    
+    if not current_user.is_authenticated or not current_user.is_admin_user():
+        flash('관리자 권한이 필요합니다.', 'error')
+        return redirect(url_for('auth.login'))
+    
+    endpoint = request.form.get('endpoint', '*')
+    count = request.form.get('count', type=int)
+    rate = request.form.get('rate', type=float)
+    mode = request.form.get('mode', 'cprofile')
+    
+    if rate is not None and not 0 < rate <= 1:
+        return jsonify({'error': 'rate는 0보다 크고 1 이하여야 합니다.'}), 400
+    try:
+        request_profiler.arm(endpoint, count=count, rate=rate, mode=mode)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    return jsonify({'armed': request_profiler.status()})
+
+@admin_bp.route('/profiler/disarm', methods=['POST'])
+def profiler_disarm():
+    """프로파일링 예약 해제 (endpoint를 안 주면 전체)"""
+    from app.profiler import request_profiler
+    
+    if not current_user.is_authenticated or not current_user.is_admin_user():
+        flash('관리자 권한이 필요합니다.', 'error')
+        return redirect(url_for('auth.login'))
+    
+    request_profiler.disarm(request.form.get('endpoint'))
+    return jsonify({'armed': request_profiler.status()})
+
+@admin_bp.route('/profiler/<path:name>')
+def profiler_download(name):
+    """저장된 프로파일 다운로드 (.prof는 pstats, .collapsed는 flamegraph 입력)"""
+    from app.profiler import request_profiler, FORMATS
+    
+    if not current_user.is_authenticated or not current_user.is_admin_user():
+        flash('관리자 권한이 필요합니다.', 'error')
+        return redirect(url_for('auth.login'))
+    
+    if os.path.splitext(name)[1] not in FORMATS:
+        abort(404)
+    mimetype = 'text/plain' if name.endswith('.collapsed') else 'application/octet-stream'
+    return send_from_directory(request_profiler.store.directory, name,
+                               mimetype=mimetype, as_attachment=True)
+
+@admin_bp.route('/search')
+@query_budget(2)
+def search():
+    """멤버/사용자 이름, 학과, 이메일 검색 (관련도 순, 관리자 전용)"""
+    from app.search import search as search_index, is_enabled, KINDS
+    
+    if not current_user.is_authenticated or not current_user.is_admin_user():
+        flash('관리자 권한이 필요합니다.', 'error')
+        return redirect(url_for('auth.login'))
+    
+    if not is_enabled():
+        abort(404)
+    
+    query = request.args.get('q', '').strip()
+    kind = request.args.get('kind') or None
+    page = max(request.args.get('page', 1, type=int), 1)
+    if kind is not None and kind not in KINDS:
+        return jsonify({'error': f'kind는 {", ".join(KINDS)} 중 하나여야 합니다.'}), 400
+    
+    results, has_next = search_index(query, kind=kind, page=page,
+                                     per_page=current_app.config['SEARCH_PER_PAGE'])
+    return jsonify({'query': query, 'page': page, 'has_next': has_next, 'results': results})
+
 @admin_bp.route('/all-groups-data')
+@query_budget(2)
 def all_groups_data():
     """모든 그룹의 상세 정보 (관리자 전용)"""
-    from app.models import Group
+    from app.roster import iter_groups_data
     
     if not current_user.is_authenticated or not current_user.is_admin_user():
         flash('관리자 권한이 필요합니다.', 'error')
         return redirect(url_for('login'))
     
-    groups = Group.query.all()
-    group_data = []
-    
-    for group in groups:
-        members_data = []
-        for member in group.members:
-            member_info = {
-                'name': member.name,
-                'department': member.department or '미설정',
-                'blog_url': member.blog_url or '없음'
-            }
-            if member.user:
-                member_info.update({
-                    'email': member.user.email,
-                    'joined_at': member.user.created_at.strftime('%Y-%m-%d')
-                })
-            members_data.append(member_info)
-        
-        group_data.append({
-            'id': group.id,
-            'name': group.name,
-            'category': group.category.name,
-            'member_count': len(group.members),
-            'members': members_data
-        })
-    
-    return render_template('admin/all_groups_data.html',
-                         title='전체 그룹 데이터',
-                         groups_data=group_data)
\ No newline at end of file
+    # 조인 쿼리 1번으로 그룹을 하나씩 렌더링
+    return stream_template('admin/all_groups_data.html',
+                           title='전체 그룹 데이터',
+                           groups_data=iter_groups_data())
+
+@admin_bp.route('/all-groups-data/export.<fmt>')
+def export_all_groups_data(fmt):
+    """모든 그룹 데이터 스트리밍 내보내기 (NDJSON / CSV)"""
+    from app.roster import stream_ndjson, stream_csv
+    
+    if not current_user.is_authenticated or not current_user.is_admin_user():
+        flash('관리자 권한이 필요합니다.', 'error')
+        return redirect(url_for('auth.login'))
+    
+    if fmt == 'ndjson':
+        body, mimetype = stream_ndjson(), 'application/x-ndjson'
+    elif fmt == 'csv':
+        body, mimetype = stream_csv(), 'text/csv'
+    else:
+        abort(404)
+    
+    return Response(stream_with_context(body),
+                    mimetype=mimetype,
+                    headers={'Content-Disposition': f'attachment; filename=all_groups_data.{fmt}'})
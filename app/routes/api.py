@@ -0,0 +1,200 @@
+# app/routes/api.py
+"""버전 있는 JSON 읽기 API (필요한 컬럼만 조회, fields= 선택, 커서 페이지네이션)"""
+from datetime import date, datetime
+
+from flask import Blueprint, current_app, jsonify, request
+from flask_login import current_user
+from werkzeug.exceptions import HTTPException
+
+from app.decorators import gzip_compressed, page_cached, query_budget
+from app.pagination import InvalidCursor, keyset_paginate
+
+api_bp = Blueprint('api', __name__)
+
+
+class InvalidFields(ValueError):
+    """fields=에 없는 필드 이름"""
+
+
+def _resources():
+    """리소스 이름 -> {필드 이름: 컬럼} (첫 번째 필드는 커서 키로 쓰는 기본 키)"""
+    from app.models import User, Category, Group, Member
+    return {
+        'categories': {'id': Category.id, 'name': Category.name},
+        'groups': {'id': Group.id, 'name': Group.name, 'category_id': Group.category_id,
+                   'created_at': Group.created_at, 'member_count': Group.member_count},
+        'members': {'id': Member.id, 'name': Member.name, 'department': Member.department,
+                    'blog_url': Member.blog_url, 'group_id': Member.group_id,
+                    'user_id': Member.user_id},
+        'me': {'id': User.id, 'name': User.name, 'email': User.email, 'is_admin': User.is_admin,
+               'birthdate': User.birthdate, 'created_at': User.created_at},
+    }
+
+
+def _projection(resource, extra=()):
+    """fields= 값에 해당하는 컬럼 목록과 요청된 extra 필드 (id는 항상 포함)"""
+    available = _resources()[resource]
+    requested = request.args.get('fields')
+    if not requested:
+        return dict(available), list(extra)
+    names = [name.strip() for name in requested.split(',') if name.strip()]
+    unknown = [name for name in names if name not in available and name not in extra]
+    if unknown:
+        choices = ', '.join([*available, *extra])
+        raise InvalidFields(f'알 수 없는 필드: {", ".join(unknown)} (사용 가능: {choices})')
+    columns = {name: available[name] for name in ['id', *names] if name in available}
+    return columns, [name for name in extra if name in names]
+
+
+def _serialize(row, names):
+    item = {}
+    for name in names:
+        value = getattr(row, name)
+        item[name] = value.isoformat() if isinstance(value, (date, datetime)) else value
+    return item
+
+
+def _page(resource, *criteria):
+    """리소스 목록 한 페이지 (id 기준 keyset)"""
+    from app.models import db
+
+    columns, _ = _projection(resource)
+    query = db.session.query(*(column.label(name) for name, column in columns.items()))
+    if criteria:
+        query = query.filter(*criteria)
+
+    id_column = _resources()[resource]['id']
+    limit = min(max(request.args.get('limit', current_app.config['API_PER_PAGE'], type=int), 1),
+                current_app.config['API_MAX_PER_PAGE'])
+    page = keyset_paginate(query, [id_column], request.args.get('cursor'), per_page=limit)
+    return jsonify({
+        'data': [_serialize(row, columns) for row in page.items],
+        'next_cursor': page.next_cursor,
+        'prev_cursor': page.prev_cursor,
+    })
+
+
+def _single(resource, ident, *criteria, extra=()):
+    """리소스 하나를 dict로 (없으면 None), extra 필드는 요청된 이름 목록으로 함께 반환"""
+    from app.models import db
+
+    columns, extras = _projection(resource, extra)
+    id_column = _resources()[resource]['id']
+    row = (db.session.query(*(column.label(name) for name, column in columns.items()))
+           .filter(id_column == ident, *criteria)
+           .first())
+    return (_serialize(row, columns) if row is not None else None), extras
+
+
+def _error(message, status):
+    return jsonify({'error': message}), status
+
+
+def _visible_groups():
+    """일반 사용자가 멤버 정보를 볼 수 있는 그룹 (관리자는 None = 전체)"""
+    from app.acl import access_index
+    if current_user.is_admin_user():
+        return None
+    return access_index.user_groups(current_user.id)
+
+
+@api_bp.before_request
+def require_login():
+    if not current_user.is_authenticated:
+        return _error('로그인이 필요합니다.', 401)
+
+
+@api_bp.errorhandler(HTTPException)
+def http_error(error):
+    return _error(error.description, error.code)
+
+
+@api_bp.errorhandler(InvalidFields)
+def invalid_fields(error):
+    return _error(str(error), 400)
+
+
+@api_bp.errorhandler(InvalidCursor)
+def invalid_cursor(error):
+    return _error('잘못된 cursor입니다.', 400)
+
+
+@api_bp.route('/me')
+@gzip_compressed
+@page_cached
+@query_budget(2)
+def me():
+    """로그인한 사용자 정보와 소속 멤버/그룹 (member_id, group_id는 세션 사용자 캐시에서)"""
+    item, extras = _single('me', current_user.id, extra=('member_id', 'group_id'))
+    if item is None:
+        return _error('찾을 수 없습니다.', 404)
+    for name in extras:
+        item[name] = getattr(current_user, name)
+    return jsonify({'data': item})
+
+
+@api_bp.route('/categories')
+@gzip_compressed
+@page_cached
+@query_budget(2)
+def categories():
+    """카테고리 목록"""
+    return _page('categories')
+
+
+@api_bp.route('/groups')
+@gzip_compressed
+@page_cached
+@query_budget(2)
+def groups():
+    """그룹 목록 (category_id로 거를 수 있음)"""
+    from app.models import Group
+    category_id = request.args.get('category_id', type=int)
+    criteria = [Group.category_id == category_id] if category_id is not None else []
+    return _page('groups', *criteria)
+
+
+@api_bp.route('/groups/<int:group_id>')
+@gzip_compressed
+@page_cached
+@query_budget(2)
+def group(group_id):
+    """그룹 하나"""
+    item, _ = _single('groups', group_id)
+    if item is None:
+        return _error('찾을 수 없습니다.', 404)
+    return jsonify({'data': item})
+
+
+@api_bp.route('/members')
+@gzip_compressed
+@page_cached
+@query_budget(3)  # 권한 인덱스를 다시 만들 때 2개 추가
+def members():
+    """멤버 목록 (group_id로 거를 수 있음, 일반 사용자는 자기 그룹만)"""
+    from app.models import Member
+    criteria = []
+    group_id = request.args.get('group_id', type=int)
+    if group_id is not None:
+        criteria.append(Member.group_id == group_id)
+    visible = _visible_groups()
+    if visible is not None:
+        if group_id is not None and group_id not in visible:
+            return _error('해당 그룹의 정보에 접근할 권한이 없습니다.', 403)
+        criteria.append(Member.group_id.in_(visible))
+    return _page('members', *criteria)
+
+
+@api_bp.route('/members/<int:member_id>')
+@gzip_compressed
+@page_cached
+@query_budget(3)  # 권한 인덱스를 다시 만들 때 2개 추가
+def member(member_id):
+    """멤버 하나 (일반 사용자는 같은 그룹 멤버만)"""
+    from app.models import Member
+    visible = _visible_groups()
+    criteria = [Member.group_id.in_(visible)] if visible is not None else []
+    item, _ = _single('members', member_id, *criteria)
+    if item is None:
+        return _error('찾을 수 없습니다.', 404)
+    return jsonify({'data': item})
@@ -2,11 +2,14 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash
 from flask_login import login_user, logout_user, login_required, current_user
 from app.models import db, User
+from app.identity import identity_cache
+from app.decorators import auth_rate_limited
 from datetime import datetime
 
 auth_bp = Blueprint('auth', __name__)
 
 @auth_bp.route('/login', methods=['GET', 'POST'])
+@auth_rate_limited
 def login():
     """로그인"""
     if current_user.is_authenticated:
@@ -20,6 +23,11 @@ def login():
         user = User.query.filter_by(name=username).first()  # 수정: name 필드 사용
         
         if user and user.check_password(password):
+            # 해시 설정이 바뀌었으면 로그인 성공 시 새 설정으로 다시 저장
+            if user.password_needs_rehash():
+                user.set_password(password)
+                db.session.commit()
+            
             login_user(user, remember=remember)
             
             # 관리자라면 관리자 대시보드로, 일반 사용자라면 일반 대시보드로
@@ -35,6 +43,7 @@ def login():
     return render_template('auth/login.html', title='로그인')
 
 @auth_bp.route('/register', methods=['GET', 'POST'])
+@auth_rate_limited
 def register():
     """회원가입"""
     if current_user.is_authenticated:
@@ -82,6 +91,8 @@ def register():
         
         db.session.add(user)
         db.session.commit()
+        # 삭제된 사용자의 id가 재사용될 수 있으므로 무효화
+        identity_cache.invalidate(user.id)
         
         flash('회원가입이 완료되었습니다. 로그인해주세요.', 'success')
         return redirect(url_for('auth.login'))
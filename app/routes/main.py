@@ -1,24 +1,54 @@
-from flask import Blueprint, render_template
-from flask_login import login_required
-from app.models import Category, Group, Member
+from flask import Blueprint, abort, render_template
+from flask_login import current_user, login_required
+from app.decorators import page_cached, group_access_required, member_access_required
+from app.snapshot import roster_snapshot
 
 main_bp = Blueprint('main', __name__)
 
+# 카테고리 이름 → 그룹 목록 템플릿
+CATEGORY_TEMPLATES = {
+    '비기너': 'category/beginner.html',
+    '챌린저': 'category/challenger.html',
+}
+
+@main_bp.route('/')
+@page_cached
+def index():
+    return render_template('index0.html', title='동아리 홈페이지')
+
 @main_bp.route('/dashboard')
 @login_required
+@page_cached
 def dashboard():
-    categories = Category.query.all()
-    return render_template('index.html', categories=categories, title = 'main page')
+    user_teams = current_user.get_teams()
+    return render_template('index.html',
+                         title='대시보드',
+                         teams=user_teams)
 
 
 @main_bp.route('/category/<int:cat_id>')
 @login_required
+@page_cached
 def view_groups(cat_id):
-    groups = Group.query.filter_by(category_id=cat_id).all()
-    return render_template('groups.html', groups=groups)
+    category = roster_snapshot.get().categories_by_id.get(cat_id)
+    if category is None or category.name not in CATEGORY_TEMPLATES:
+        abort(404)
+    return render_template(CATEGORY_TEMPLATES[category.name], groups=category.groups)
 
 @main_bp.route('/group/<int:group_id>')
-@login_required
+@group_access_required
+@page_cached
 def view_members(group_id):
-    members = Member.query.filter_by(group_id=group_id).all()
-    return render_template('members.html', members=members)
\ No newline at end of file
+    group = roster_snapshot.get().groups_by_id.get(group_id)
+    if group is None:
+        abort(404)
+    return render_template('team/group.html', group=group, members=group.members)
+
+@main_bp.route('/member/<int:member_id>')
+@member_access_required
+@page_cached
+def view_member(member_id):
+    member = roster_snapshot.get().members_by_id.get(member_id)
+    if member is None:
+        abort(404)
+    return render_template('team/member.html', member=member)
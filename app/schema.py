@@ -0,0 +1,132 @@
+# app/schema.py
+"""스키마 마이그레이션 적용과 핫 쿼리 실행 계획 검사"""
+import click
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from flask.cli import with_appcontext
+from flask_migrate import stamp, upgrade
+from sqlalchemy import inspect, text
+
+# create_all()로 만든 기존 DB와 같은 스키마의 리비전
+BASELINE_REVISION = '3f9d1c2a7b10'
+
+# app.search가 직접 관리하는 FTS5 가상 테이블과 그림자 테이블은 마이그레이션 비교에서 제외
+UNMANAGED_TABLE_PREFIXES = ('search_index',)
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """alembic autogenerate 비교 대상 필터 (migrations/env.py에서도 사용)"""
+    if type_ == 'table' and reflected and compare_to is None:
+        return not name.startswith(UNMANAGED_TABLE_PREFIXES)
+    return True
+
+
+def _matches_models(db):
+    """DB 스키마가 현재 모델과 같은지 (create_all로 만든 최신 DB인지)"""
+    with db.engine.connect() as conn:
+        context = MigrationContext.configure(conn, opts={'include_object': include_object})
+        return not compare_metadata(context, db.metadata)
+
+
+def upgrade_schema():
+    """최신 리비전까지 적용 (alembic_version 없이 create_all로 만든 기존 DB는 먼저 리비전을 표시)"""
+    from app.models import db
+    tables = set(inspect(db.engine).get_table_names())
+    if 'alembic_version' not in tables and 'user' in tables:
+        stamp(revision='head' if _matches_models(db) else BASELINE_REVISION)
+    upgrade()
+
+
+def _hot_queries():
+    """(이름, 쿼리) 목록: 요청마다 실행되거나 목록 화면에서 쓰는 조회"""
+    from app.models import db, User, Group, Member
+    return [
+        ('login: User by name', User.query.filter_by(name='admin')),
+        ('register: User by email', User.query.filter_by(email='admin@club.com')),
+        ('identity: User + Member snapshot',
+         db.session.query(User.id, Member.id, Member.group_id)
+         .outerjoin(Member, Member.user_id == User.id).filter(User.id == 1)),
+        ('get_member_info: Member by user_id', Member.query.filter_by(user_id=1)),
+        ('view_members: Member by group_id', Member.query.filter_by(group_id=1)),
+        ('group_admin_detail: Member page by group_id',
+         Member.query.filter_by(group_id=1).filter(Member.id > 0).order_by(Member.id).limit(21)),
+        ('view_groups: Group by category_id', Group.query.filter_by(category_id=1)),
+        ('create_group: Group by name', Group.query.filter_by(name='그룹')),
+        ('dashboard: recent users',
+         User.query.order_by(User.created_at.desc()).limit(5)),
+    ]
+
+
+def _full_scans(plan_rows):
+    """EXPLAIN QUERY PLAN 결과에서 인덱스 없이 테이블 전체를 읽는 단계"""
+    return [detail for detail in (row[-1] for row in plan_rows)
+            if detail.startswith('SCAN ') and ' USING ' not in detail]
+
+
+def check_query_plans():
+    """핫 쿼리별 (이름, 실행 계획, 전체 스캔 단계) 목록"""
+    from app.models import db
+    dialect = db.engine.dialect
+    if dialect.name != 'sqlite':
+        raise RuntimeError('EXPLAIN QUERY PLAN 검사는 SQLite에서만 지원합니다.')
+
+    results = []
+    for name, query in _hot_queries():
+        sql = str(query.statement.compile(dialect=dialect, compile_kwargs={'literal_binds': True}))
+        plan = db.session.execute(text('EXPLAIN QUERY PLAN ' + sql)).all()
+        results.append((name, [row[-1] for row in plan], _full_scans(plan)))
+    return results
+
+
+@click.command('check-query-plans')
+@with_appcontext
+def check_query_plans_command():
+    """핫 쿼리 중 하나라도 전체 테이블 스캔이면 실패 (종료 코드 1)"""
+    failed = 0
+    for name, plan, scans in check_query_plans():
+        click.echo(f'{"FAIL" if scans else "ok  "} {name}')
+        for detail in plan:
+            click.echo(f'       {detail}')
+        failed += bool(scans)
+    if failed:
+        raise click.ClickException(f'{failed}개 쿼리가 전체 테이블 스캔을 합니다. `flask db upgrade`를 확인하세요.')
+
+
+def bootstrap(admin_password='admin123'):
+    """스키마 적용 후 기본 카테고리와 관리자 계정 생성 (이미 있으면 건너뜀), 만든 항목 목록 반환"""
+    from datetime import date
+    from app.models import db, User, Category
+
+    upgrade_schema()
+    created = []
+    if not Category.query.first():
+        db.session.add_all([Category(name='비기너'), Category(name='챌린저')])
+        db.session.commit()
+        created.append('기본 카테고리')
+
+    if not User.query.filter_by(is_admin=True).first():
+        admin_user = User(name='admin', email='admin@club.com', is_admin=True,
+                          birthdate=date(1990, 1, 1))
+        admin_user.set_password(admin_password)
+        db.session.add(admin_user)
+        db.session.commit()
+        created.append('관리자 계정 (admin)')
+    return created
+
+
+@click.command('init-db')
+@click.option('--admin-password', default='admin123', show_default=True,
+              help='관리자 계정이 없을 때 만들 admin 계정의 비밀번호')
+@with_appcontext
+def init_db_command(admin_password):
+    """마이그레이션 적용, 기본 카테고리/관리자 계정 생성 (배포 시 한 번 실행)"""
+    created = bootstrap(admin_password)
+    for item in created:
+        click.echo(f'생성됨: {item}')
+    if not created:
+        click.echo('스키마가 최신이고 기본 데이터가 이미 있습니다.')
+
+
+def init_app(app):
+    app.cli.add_command(check_query_plans_command)
+    app.cli.add_command(init_db_command)
@@ -0,0 +1,196 @@
+# app/search.py
+"""SQLite FTS5 기반 멤버/사용자 검색 (접두어 + 한글 bigram 매칭)"""
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from sqlalchemy import event, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+INDEX_TABLE = 'search_index'
+
+# grams 컬럼에는 단어별 2글자 조각을 넣어 두 글자 이상의 부분 문자열도 찾을 수 있게 함
+CREATE_INDEX = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS {INDEX_TABLE} USING fts5(
+    kind UNINDEXED,
+    ref_id UNINDEXED,
+    name,
+    department,
+    email,
+    grams,
+    tokenize = 'unicode61'
+)
+"""
+
+KINDS = ('member', 'user')
+
+
+def index_rowid(kind, ref_id):
+    """색인 행의 rowid (종류와 id에서 계산하므로 UNINDEXED 컬럼을 훑지 않고 rowid로 바로 지움)"""
+    return ref_id * len(KINDS) + KINDS.index(kind)
+
+
+def _bigrams(word):
+    if len(word) < 2:
+        return [word] if word else []
+    return [word[i:i + 2] for i in range(len(word) - 1)]
+
+
+def make_grams(*values):
+    """값들의 단어별 bigram을 공백으로 이어붙인 문자열"""
+    grams = []
+    for value in values:
+        for word in (value or '').lower().split():
+            grams.extend(_bigrams(word))
+    return ' '.join(grams)
+
+
+def _quote(term):
+    return '"' + term.replace('"', '""') + '"'
+
+
+def build_match(query):
+    """검색어를 FTS5 MATCH 식으로 변환 (단어마다 접두어 또는 부분 문자열 매칭, 단어끼리는 AND)"""
+    clauses = []
+    for word in query.lower().split():
+        options = [_quote(word) + '*']
+        grams = _bigrams(word)
+        if len(word) >= 2:
+            options.append(_quote(' '.join(grams)))
+        else:
+            options.append('grams:' + _quote(word) + '*')
+        clauses.append('(' + ' OR '.join(options) + ')')
+    return ' AND '.join(clauses)
+
+
+def _index_rows(kind, rows):
+    for row in rows:
+        if kind == 'member':
+            ref_id, name, department = row
+            yield {'rowid': index_rowid(kind, ref_id), 'kind': kind, 'ref_id': ref_id, 'name': name,
+                   'department': department or '', 'email': '', 'grams': make_grams(name, department)}
+        else:
+            ref_id, name, email = row
+            yield {'rowid': index_rowid(kind, ref_id), 'kind': kind, 'ref_id': ref_id, 'name': name,
+                   'department': '', 'email': email or '', 'grams': make_grams(name)}
+
+
+_INSERT = text(f'INSERT INTO {INDEX_TABLE} (rowid, kind, ref_id, name, department, email, grams) '
+               'VALUES (:rowid, :kind, :ref_id, :name, :department, :email, :grams)')
+_DELETE = text(f'DELETE FROM {INDEX_TABLE} WHERE rowid = :rowid')
+
+
+def is_enabled():
+    return current_app.extensions.get('search_enabled', False)
+
+
+def rebuild_index(chunk_size=5000):
+    """기존 테이블 전체를 다시 색인"""
+    from app.models import db, User, Member
+    conn = db.session.connection()
+    conn.execute(text(f'DELETE FROM {INDEX_TABLE}'))
+    counts = {}
+    for kind, query in (('member', db.session.query(Member.id, Member.name, Member.department)),
+                        ('user', db.session.query(User.id, User.name, User.email))):
+        batch = []
+        counts[kind] = 0
+        for row in _index_rows(kind, query.yield_per(chunk_size)):
+            batch.append(row)
+            if len(batch) >= chunk_size:
+                conn.execute(_INSERT, batch)
+                counts[kind] += len(batch)
+                batch = []
+        if batch:
+            conn.execute(_INSERT, batch)
+            counts[kind] += len(batch)
+    conn.execute(text(f"INSERT INTO {INDEX_TABLE}({INDEX_TABLE}) VALUES ('optimize')"))
+    db.session.commit()
+    return counts
+
+
+def search(query, kind=None, page=1, per_page=20):
+    """bm25 순으로 정렬된 검색 결과 한 페이지와 다음 페이지 존재 여부"""
+    match = build_match(query)
+    if not match:
+        return [], False
+    from app.models import db
+    sql = (f'SELECT kind, ref_id, name, department, email, bm25({INDEX_TABLE}) AS score '
+           f'FROM {INDEX_TABLE} WHERE {INDEX_TABLE} MATCH :match')
+    params = {'match': match, 'limit': per_page + 1, 'offset': (page - 1) * per_page}
+    if kind:
+        sql += ' AND kind = :kind'
+        params['kind'] = kind
+    sql += ' ORDER BY score LIMIT :limit OFFSET :offset'
+
+    rows = db.session.execute(text(sql), params).mappings().all()
+    results = [dict(row) for row in rows[:per_page]]
+    return results, len(rows) > per_page
+
+
+def discard(session, kind, ref_ids):
+    """ORM을 거치지 않는 일괄 삭제에서 색인 항목을 같은 트랜잭션 안에서 제거"""
+    if ref_ids and is_enabled():
+        session.connection().execute(_DELETE, [{'rowid': index_rowid(kind, ref_id)} for ref_id in ref_ids])
+
+
+def _sync_index(session, flush_context):
+    """flush된 Member/User 변경을 같은 트랜잭션 안에서 색인에 반영"""
+    from app.models import User, Member
+    deletes, inserts = [], []
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Member):
+            kind, row = 'member', (obj.id, obj.name, obj.department)
+        elif isinstance(obj, User):
+            kind, row = 'user', (obj.id, obj.name, obj.email)
+        else:
+            continue
+        deletes.append({'rowid': index_rowid(kind, obj.id)})
+        if obj not in session.deleted:
+            inserts.extend(_index_rows(kind, [row]))
+
+    if not deletes:
+        return
+    conn = session.connection()
+    conn.execute(_DELETE, deletes)
+    if inserts:
+        conn.execute(_INSERT, inserts)
+
+
+@click.command('search-rebuild')
+@with_appcontext
+def search_rebuild_command():
+    """멤버/사용자 검색 색인을 처음부터 다시 만듦"""
+    if not is_enabled():
+        click.echo('이 DB에서는 FTS5 검색을 사용할 수 없습니다.')
+        return
+    counts = rebuild_index()
+    click.echo(', '.join(f'{kind} {n}건' for kind, n in counts.items()) + ' 색인 완료')
+
+
+def init_app(app):
+    """FTS5 테이블 생성, 세션 이벤트와 CLI 명령 등록"""
+    from app.models import db
+    app.cli.add_command(search_rebuild_command)
+    app.extensions['search_enabled'] = False
+    if not app.config['SEARCH_ENABLED']:
+        return
+
+    with app.app_context():
+        if db.engine.dialect.name != 'sqlite':
+            return
+        try:
+            with db.engine.begin() as conn:
+                conn.execute(text(CREATE_INDEX))
+                sample = conn.execute(text(f'SELECT rowid, kind, ref_id FROM {INDEX_TABLE} LIMIT 1')).first()
+        except OperationalError as e:
+            app.logger.warning('FTS5 검색 색인을 만들 수 없습니다: %s', e)
+            return
+
+        app.extensions['search_enabled'] = True
+        # rowid를 index_rowid()로 정하기 전에 만든 색인이면 다시 만듦
+        if sample is not None and sample.rowid != index_rowid(sample.kind, sample.ref_id):
+            app.logger.info('검색 색인의 rowid 형식이 달라 다시 만듭니다.')
+            rebuild_index()
+
+    if not event.contains(Session, 'after_flush', _sync_index):
+        event.listen(Session, 'after_flush', _sync_index)
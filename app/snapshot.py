@@ -0,0 +1,261 @@
+# app/snapshot.py
+"""카테고리 → 그룹 → 멤버 트리의 불변 메모리 스냅샷 (읽기 전용 화면용)
+
+커밋 후 백그라운드 스레드에서 새 스냅샷을 만들어 참조만 바꿔 끼우므로
+읽는 쪽은 잠금이나 DB 조회 없이 현재 스냅샷을 그대로 쓴다. 다른 프로세스의
+변경은 명단 테이블 커밋 때만 올라가는 roster_version으로 감지한다.
+"""
+import os
+import sys
+import threading
+import time
+from threading import Lock
+
+from app.pagecache import DataVersion
+
+# 이 테이블이 바뀌면 스냅샷을 다시 만듦
+ROSTER_TABLES = ('category', 'group', 'member')
+
+# ROSTER_TABLES 커밋마다 올라가는 버전 (사용자 테이블 변경으로는 다시 만들지 않음)
+roster_version = DataVersion()
+
+
+class CategoryRecord:
+    __slots__ = ('id', 'name', 'groups')
+
+    def __init__(self, id, name, groups=()):
+        self.id = id
+        self.name = name
+        self.groups = groups
+
+    def __repr__(self):
+        return f'<CategoryRecord {self.name}>'
+
+
+class GroupRecord:
+    __slots__ = ('id', 'name', 'category_id', 'created_at', 'members')
+
+    def __init__(self, id, name, category_id, created_at, members=()):
+        self.id = id
+        self.name = name
+        self.category_id = category_id
+        self.created_at = created_at
+        self.members = members
+
+    def get_member_count(self):
+        """그룹 멤버 수 반환"""
+        return len(self.members)
+
+    def has_member(self, user_id):
+        """특정 사용자가 이 그룹의 멤버인지 확인"""
+        return any(member.user_id == user_id for member in self.members if member.user_id)
+
+    def __repr__(self):
+        return f'<GroupRecord {self.name}>'
+
+
+class MemberRecord:
+    __slots__ = ('id', 'name', 'department', 'blog_url', 'group_id', 'user_id')
+
+    def __init__(self, id, name, department, blog_url, group_id, user_id):
+        self.id = id
+        self.name = name
+        self.department = department
+        self.blog_url = blog_url
+        self.group_id = group_id
+        self.user_id = user_id
+
+    def __repr__(self):
+        return f'<MemberRecord {self.name}>'
+
+
+class RosterSnapshot:
+    """한 시점의 트리와 id별 인덱스 (만든 뒤에는 바꾸지 않음)"""
+    __slots__ = ('version', 'categories', 'categories_by_id', 'groups_by_id', 'members_by_id',
+                 'groups_by_user', 'build_seconds', 'built_at', 'bytes')
+
+    def __init__(self, version, categories, build_seconds):
+        self.version = version
+        self.categories = categories
+        self.categories_by_id = {category.id: category for category in categories}
+        self.groups_by_id = {group.id: group for category in categories for group in category.groups}
+        self.members_by_id = {member.id: member for group in self.groups_by_id.values()
+                              for member in group.members}
+        groups_by_user = {}
+        for member in self.members_by_id.values():
+            if member.user_id is not None:
+                groups_by_user.setdefault(member.user_id, []).append(self.groups_by_id[member.group_id])
+        self.groups_by_user = {user_id: tuple(groups) for user_id, groups in groups_by_user.items()}
+        self.build_seconds = build_seconds
+        self.built_at = time.time()
+        # 만든 뒤에는 바뀌지 않으므로 메모리 사용량은 한 번만 계산 (stats 조회마다 트리를 돌지 않음)
+        self.bytes = 0
+        self.bytes = self.footprint()
+
+    # 조회 -----------------------------------------------------------
+
+    @property
+    def groups(self):
+        """모든 그룹 (id 순)"""
+        return [group for category in self.categories for group in category.groups]
+
+    def groups_in(self, category_id):
+        category = self.categories_by_id.get(category_id)
+        return category.groups if category else ()
+
+    def members_of(self, group_id):
+        group = self.groups_by_id.get(group_id)
+        return group.members if group else ()
+
+    def user_groups(self, user_id):
+        return self.groups_by_user.get(user_id, ())
+
+    def footprint(self):
+        """레코드, 인덱스, 문자열을 모두 합친 대략적인 메모리 사용량 (바이트)"""
+        seen = set()
+        total = 0
+        stack = [self]
+        while stack:
+            obj = stack.pop()
+            if id(obj) in seen:
+                continue
+            seen.add(id(obj))
+            total += sys.getsizeof(obj)
+            if isinstance(obj, dict):
+                stack.extend(obj.keys())
+                stack.extend(obj.values())
+            elif isinstance(obj, (list, tuple)):
+                stack.extend(obj)
+            elif hasattr(obj, '__slots__'):
+                stack.extend(getattr(obj, name) for name in obj.__slots__)
+        return total
+
+    def stats(self):
+        return {
+            'version': self.version,
+            'categories': len(self.categories),
+            'groups': len(self.groups_by_id),
+            'members': len(self.members_by_id),
+            'bytes': self.bytes,
+            'build_ms': round(self.build_seconds * 1000, 3),
+            'built_at': self.built_at,
+        }
+
+
+def build_snapshot(version):
+    """쿼리 3번으로 전체 트리를 읽어 스냅샷 생성"""
+    from app.models import db, Category, Group, Member
+    started = time.perf_counter()
+
+    members_by_group = {}
+    for row in db.session.query(Member.id, Member.name, Member.department, Member.blog_url,
+                                Member.group_id, Member.user_id).order_by(Member.id):
+        members_by_group.setdefault(row.group_id, []).append(MemberRecord(*row))
+
+    groups_by_category = {}
+    for row in db.session.query(Group.id, Group.name, Group.category_id,
+                                Group.created_at).order_by(Group.id):
+        members = tuple(members_by_group.get(row.id, ()))
+        groups_by_category.setdefault(row.category_id, []).append(GroupRecord(*row, members))
+
+    categories = tuple(CategoryRecord(id, name, tuple(groups_by_category.get(id, ())))
+                       for id, name in db.session.query(Category.id, Category.name).order_by(Category.id))
+    return RosterSnapshot(version, categories, time.perf_counter() - started)
+
+
+class SnapshotHolder:
+    """현재 스냅샷 참조와 백그라운드 재생성 (한 번에 한 스레드만 만들고 요청은 합침)"""
+
+    def __init__(self):
+        self.app = None
+        self.rebuilds = 0
+        self._current = None
+        self._build_lock = Lock()
+        self._state_lock = Lock()
+        self._worker_running = False
+        self._dirty = False
+
+    def get(self):
+        """현재 스냅샷 (낡았으면 그대로 반환하며 재생성을 예약)
+
+        첫 스냅샷은 fork 전 startup.warm_snapshot이나 after_fork에서 만들어 두므로, 예열 없이
+        띄운 개발 서버에서만 첫 요청이 직접 만든다.
+        """
+        snapshot = self._current
+        if snapshot is None:
+            return self.refresh()
+        if snapshot.version != roster_version.current():
+            # 다른 프로세스의 커밋: 이 요청은 기다리지 않고 백그라운드에서 다시 만듦
+            self.schedule_rebuild()
+        return snapshot
+
+    def after_fork(self):
+        """fork된 워커: 부모의 재생성 스레드는 따라오지 않으므로 상태를 비우고, 물려받은 스냅샷이
+        없거나 낡았으면 첫 요청 전에 백그라운드에서 만듦"""
+        self._build_lock = Lock()
+        self._state_lock = Lock()
+        self._worker_running = False
+        self._dirty = False
+        if self._current is None or not self.is_current():
+            self.schedule_rebuild()
+
+    def is_current(self):
+        """스냅샷이 최신 명단 버전으로 만들어졌는지 (아직 없으면 get()이 만들므로 True)"""
+        snapshot = self._current
+        return snapshot is None or snapshot.version == roster_version.current()
+
+    def refresh(self):
+        """버전이 다를 때만 다시 만들어 참조를 교체 (이미 다른 스레드가 만들었으면 그대로 사용)"""
+        with self._build_lock:
+            # 만드는 도중의 커밋은 다음 비교에서 잡히도록 버전을 먼저 읽음
+            version = roster_version.current()
+            snapshot = self._current
+            if snapshot is None or snapshot.version != version:
+                snapshot = build_snapshot(version)
+                self._current = snapshot
+                self.rebuilds += 1
+            return snapshot
+
+    def schedule_rebuild(self):
+        """커밋 후 호출: 백그라운드 스레드에서 다시 만듦"""
+        if self.app is None:
+            return
+        with self._state_lock:
+            if self._worker_running:
+                self._dirty = True
+                return
+            self._worker_running = True
+        threading.Thread(target=self._worker, name='roster-snapshot', daemon=True).start()
+
+    def _worker(self):
+        while True:
+            try:
+                with self.app.app_context():
+                    self.refresh()
+            except Exception:
+                self.app.logger.exception('명단 스냅샷을 다시 만들지 못했습니다.')
+            with self._state_lock:
+                if not self._dirty:
+                    self._worker_running = False
+                    return
+                self._dirty = False
+
+    def stats(self):
+        snapshot = self._current
+        return {'rebuilds': self.rebuilds, 'snapshot': snapshot.stats() if snapshot else None}
+
+
+roster_snapshot = SnapshotHolder()
+
+
+def _after_commit(changes):
+    roster_version.bump()
+    roster_snapshot.schedule_rebuild()
+
+
+def init_app(app):
+    """명단 버전 파일 설정과 커밋 알림 구독 (pagecache.init_app 다음에 호출해야 데이터 버전이 먼저 올라감)"""
+    from app import txevents
+    roster_snapshot.app = app
+    roster_version.configure(os.path.join(app.instance_path, 'roster_version'))
+    txevents.subscribe(ROSTER_TABLES, _after_commit)
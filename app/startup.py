@@ -0,0 +1,82 @@
+# app/startup.py
+"""운영 서버 시작 준비: Jinja 바이트코드 캐시, 템플릿/명단 스냅샷 예열, 모듈 미리 import, fork 후 정리"""
+import importlib
+import os
+import pkgutil
+import time
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from jinja2 import FileSystemBytecodeCache
+
+
+def configure_template_cache(app):
+    """컴파일된 템플릿을 instance 폴더(또는 JINJA_BYTECODE_CACHE_DIR)에 저장해 워커 간에 재사용"""
+    if not app.config['JINJA_BYTECODE_CACHE']:
+        return
+    directory = app.config['JINJA_BYTECODE_CACHE_DIR'] or os.path.join(app.instance_path, 'jinja_cache')
+    os.makedirs(directory, exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory)
+
+
+def warm_templates(app):
+    """모든 템플릿을 컴파일해 환경 캐시(와 바이트코드 캐시)에 올림, (템플릿 수, 초) 반환"""
+    started = time.perf_counter()
+    names = app.jinja_env.list_templates(filter_func=lambda name: name.endswith('.html'))
+    # 환경 캐시가 작으면 예열한 템플릿이 밀려나므로 템플릿 수 이상으로 유지
+    if app.jinja_env.cache is not None and app.jinja_env.cache.capacity < len(names):
+        app.jinja_env.cache.capacity = len(names)
+    for name in names:
+        app.jinja_env.get_template(name)
+    return len(names), time.perf_counter() - started
+
+
+def preload_modules():
+    """뷰 함수 안에서 늦게 import하는 app.* 모듈을 미리 불러옴 (fork 전에 한 번만)"""
+    import app as package
+    loaded = []
+    for module in pkgutil.walk_packages(package.__path__, package.__name__ + '.'):
+        importlib.import_module(module.name)
+        loaded.append(module.name)
+    return loaded
+
+
+def warm_snapshot(app):
+    """fork 전에 첫 명단 스냅샷을 만들어 워커들이 물려받게 함 (DB가 아직 없으면 건너뜀)"""
+    from sqlalchemy.exc import SQLAlchemyError
+    from app.snapshot import roster_snapshot
+    with app.app_context():
+        try:
+            roster_snapshot.refresh()
+        except SQLAlchemyError:
+            app.logger.warning('명단 스냅샷을 미리 만들지 못했습니다. 워커에서 다시 시도합니다.', exc_info=True)
+
+
+def after_fork(app):
+    """fork된 워커 준비: 부모의 DB 연결 풀과 계측 값을 버리고 작업 스레드와 스냅샷 재생성 시작"""
+    from app.models import db
+    from app.jobs import job_runner
+    from app.metrics import store
+    from app.snapshot import roster_snapshot
+    store.after_fork()
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+    job_runner.start()
+    roster_snapshot.after_fork()
+
+
+@click.command('warm-templates')
+@with_appcontext
+def warm_templates_command():
+    """모든 Jinja 템플릿을 미리 컴파일해 바이트코드 캐시에 저장"""
+    count, seconds = warm_templates(current_app)
+    cache = current_app.jinja_env.bytecode_cache
+    where = cache.directory if cache is not None else '메모리 (JINJA_BYTECODE_CACHE 꺼짐)'
+    click.echo(f'템플릿 {count}개 컴파일 ({seconds * 1000:.1f}ms) -> {where}')
+
+
+def init_app(app):
+    configure_template_cache(app)
+    app.cli.add_command(warm_templates_command)
@@ -0,0 +1,200 @@
+# app/stats.py
+"""관리자 대시보드 통계를 세션 이벤트로 증분 갱신하는 모듈"""
+import time
+from collections import deque, namedtuple
+from threading import Lock
+
+from sqlalchemy import func
+
+# 최근 가입자 표시용 요약 정보
+RecentUser = namedtuple('RecentUser', 'id name email is_admin created_at')
+
+RECENT_USERS = 5
+
+
+class DashboardStats:
+    """사용자/그룹/멤버 수, 카테고리별 그룹 수, 최근 가입자 링 버퍼
+
+    다른 프로세스에서 일어난 변경은 알 수 없으므로 ttl마다 DB에서 다시 센다.
+    """
+
+    def __init__(self, ttl=300):
+        self.ttl = ttl
+        self._lock = Lock()
+        self._loaded_at = None
+        self._counts = {'users': 0, 'groups': 0, 'members': 0}
+        self._category_names = {}    # category_id -> name
+        self._category_groups = {}   # category_id -> 그룹 수
+        self._group_category = {}    # group_id -> category_id
+        self._recent = deque(maxlen=RECENT_USERS)
+        self._recent_stale = False
+
+    @staticmethod
+    def _count_from_db():
+        """DB에서 모든 카운터를 새로 계산"""
+        from app.models import db, User, Group, Member, Category
+        counts = {
+            'users': db.session.query(func.count(User.id)).scalar(),
+            'groups': db.session.query(func.count(Group.id)).scalar(),
+            'members': db.session.query(func.count(Member.id)).scalar(),
+        }
+        category_names = dict(db.session.query(Category.id, Category.name))
+        group_category = dict(db.session.query(Group.id, Group.category_id))
+        category_groups = {}
+        for category_id in group_category.values():
+            category_groups[category_id] = category_groups.get(category_id, 0) + 1
+        return counts, category_names, category_groups, group_category
+
+    @staticmethod
+    def _recent_from_db():
+        from app.models import User
+        users = User.query.order_by(User.created_at.desc()).limit(RECENT_USERS).all()
+        return [RecentUser(u.id, u.name, u.email, u.is_admin, u.created_at) for u in users]
+
+    def rebuild(self):
+        counts, category_names, category_groups, group_category = self._count_from_db()
+        recent = self._recent_from_db()
+        with self._lock:
+            self._counts = counts
+            self._category_names = category_names
+            self._category_groups = category_groups
+            self._group_category = group_category
+            self._recent = deque(recent, maxlen=RECENT_USERS)
+            self._recent_stale = False
+            self._loaded_at = time.monotonic()
+
+    def invalidate(self):
+        with self._lock:
+            self._loaded_at = None
+
+    def _ensure_loaded(self):
+        loaded_at = self._loaded_at
+        if loaded_at is None or time.monotonic() - loaded_at > self.ttl:
+            self.rebuild()
+            return True
+        return False
+
+    def snapshot(self):
+        """대시보드 템플릿에 넘길 값 (admin.dashboard와 같은 이름)"""
+        if not self._ensure_loaded() and self._recent_stale:
+            recent = self._recent_from_db()
+            with self._lock:
+                self._recent = deque(recent, maxlen=RECENT_USERS)
+                self._recent_stale = False
+
+        with self._lock:
+            group_stats = sorted((self._category_names.get(category_id, ''), count)
+                                 for category_id, count in self._category_groups.items()
+                                 if count > 0)
+            return {
+                'total_users': self._counts['users'],
+                'total_groups': self._counts['groups'],
+                'total_members': self._counts['members'],
+                'group_stats': group_stats,
+                'recent_users': list(self._recent),
+            }
+
+    def apply(self, changes):
+        """커밋된 변경 내역 반영 ((kind, op, values) 목록)"""
+        with self._lock:
+            if self._loaded_at is None:
+                return
+            for kind, op, values in changes:
+                if kind == 'user':
+                    self._apply_user(op, values)
+                elif kind == 'group':
+                    self._apply_group(op, *values)
+                elif kind == 'member':
+                    self._counts['members'] += 1 if op == 'insert' else -1
+                elif kind == 'category':
+                    if op == 'delete':
+                        self._category_names.pop(values[0], None)
+                    else:
+                        self._category_names[values[0]] = values[1]
+
+    def _apply_user(self, op, user):
+        if op == 'insert':
+            self._counts['users'] += 1
+            # 최근 가입자는 맨 앞에 추가
+            self._recent.appendleft(user)
+        elif op == 'delete':
+            self._counts['users'] -= 1
+            if any(recent.id == user.id for recent in self._recent):
+                self._recent_stale = True
+        elif any(recent.id == user.id for recent in self._recent):
+            self._recent = deque((user if recent.id == user.id else recent for recent in self._recent),
+                                 maxlen=RECENT_USERS)
+
+    def _apply_group(self, op, group_id, category_id):
+        old_category = self._group_category.pop(group_id, None)
+        if old_category is not None:
+            self._category_groups[old_category] -= 1
+        if op == 'delete':
+            self._counts['groups'] -= 1
+            return
+        if op == 'insert':
+            self._counts['groups'] += 1
+        self._group_category[group_id] = category_id
+        self._category_groups[category_id] = self._category_groups.get(category_id, 0) + 1
+
+    def check_consistency(self, repair=True):
+        """카운터를 처음부터 다시 계산해 차이를 반환 (repair면 다시 만듦)
+
+        TTL이 지났어도 다시 읽기 전에 비교하므로 주기적으로 돌려도 어긋남이 보고된다.
+        아직 한 번도 불러오지 않았거나 무효화된 직후에는 비교할 값이 없으므로 불러오기만 한다.
+        """
+        if self._loaded_at is None:
+            self.rebuild()
+            return {}
+        counts, category_names, category_groups, _ = self._count_from_db()
+        with self._lock:
+            current_counts = dict(self._counts)
+            current_groups = {k: v for k, v in self._category_groups.items() if v}
+        drift = {}
+        for name, value in counts.items():
+            if current_counts.get(name) != value:
+                drift[name] = (current_counts.get(name), value)
+        for category_id in current_groups.keys() | category_groups.keys():
+            if current_groups.get(category_id) != category_groups.get(category_id):
+                key = f'groups[{category_names.get(category_id, category_id)}]'
+                drift[key] = (current_groups.get(category_id), category_groups.get(category_id))
+        if repair:
+            self.rebuild()
+        return drift
+
+
+dashboard_stats = DashboardStats()
+
+
+def _collect_changes(session):
+    """flush된 변경 목록"""
+    from app.models import User, Group, Member, Category
+    changes = []
+    for op, objects in (('insert', session.new), ('update', session.dirty), ('delete', session.deleted)):
+        for obj in objects:
+            if isinstance(obj, User):
+                changes.append(('user', op, RecentUser(obj.id, obj.name, obj.email,
+                                                       obj.is_admin, obj.created_at)))
+            elif isinstance(obj, Group):
+                changes.append(('group', op, (obj.id, obj.category_id)))
+            elif isinstance(obj, Member) and op != 'update':
+                changes.append(('member', op, (obj.id,)))
+            elif isinstance(obj, Category):
+                changes.append(('category', op, (obj.id, obj.name)))
+    return changes
+
+
+def _after_commit(changes):
+    if changes is None:
+        # 일괄 작업처럼 무엇이 바뀌었는지 모르면 다음 조회 때 다시 셈
+        dashboard_stats.invalidate()
+    elif changes:
+        dashboard_stats.apply(changes)
+
+
+def init_app(app):
+    """설정값 적용 및 커밋 알림 구독"""
+    from app import txevents
+    dashboard_stats.ttl = app.config['STATS_TTL']
+    dashboard_stats.invalidate()
+    txevents.subscribe(('category', 'group', 'member', 'user'), _after_commit, collect=_collect_changes)
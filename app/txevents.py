@@ -0,0 +1,71 @@
+# app/txevents.py
+"""트랜잭션에서 바뀐 테이블을 모아 커밋 후 구독자에게 알리는 세션 이벤트
+
+캐시/인덱스/버전을 커밋된 변경에만 맞춰 갱신하는 모듈들(pagecache, snapshot, identity,
+changefeed, acl, stats)이 after_flush → after_commit / after_soft_rollback 처리를 함께 쓴다.
+ORM을 거치지 않는 일괄 작업(app.bulk, app.loader)은 커밋 후 committed()로 같은 구독자를 부른다.
+"""
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+class Subscriber:
+    __slots__ = ('tables', 'on_commit', 'collect')
+
+    def __init__(self, tables, on_commit, collect):
+        self.tables = frozenset(tables)
+        self.on_commit = on_commit
+        self.collect = collect
+
+
+# 등록 순서대로 호출 (pagecache가 먼저 데이터 버전을 올려야 깨어난 쪽이 새 버전을 봄)
+_subscribers = []
+
+
+def subscribe(tables, on_commit, collect=None):
+    """tables 중 하나라도 바뀐 트랜잭션이 커밋되면 on_commit(changes) 호출
+
+    collect(session)가 있으면 flush마다 불러 돌려준 변경 목록을 모아 changes로 넘긴다.
+    collect가 없거나 committed()로 불린 경우 changes는 None (무엇이 바뀌었는지 모름).
+    """
+    if any(subscriber.on_commit is on_commit for subscriber in _subscribers):
+        return
+    _subscribers.append(Subscriber(tables, on_commit, collect))
+    if not event.contains(Session, 'after_flush', _after_flush):
+        event.listen(Session, 'after_flush', _after_flush)
+        event.listen(Session, 'after_commit', _after_commit)
+        event.listen(Session, 'after_soft_rollback', _after_rollback)
+
+
+def committed(tables):
+    """ORM을 거치지 않고 커밋한 변경을 구독자에게 알림"""
+    _notify(set(tables), {})
+
+
+def _notify(tables, changes):
+    for subscriber in _subscribers:
+        if subscriber.tables & tables:
+            subscriber.on_commit(changes.get(subscriber))
+
+
+def _after_flush(session, flush_context):
+    touched = {getattr(obj, '__tablename__', None)
+               for obj in (*session.new, *session.dirty, *session.deleted)}
+    touched.discard(None)
+    if not touched:
+        return
+    state = session.info.setdefault('txevents', {'tables': set(), 'changes': {}})
+    state['tables'] |= touched
+    for subscriber in _subscribers:
+        if subscriber.collect is not None and subscriber.tables & touched:
+            state['changes'].setdefault(subscriber, []).extend(subscriber.collect(session))
+
+
+def _after_commit(session):
+    state = session.info.pop('txevents', None)
+    if state:
+        _notify(state['tables'], state['changes'])
+
+
+def _after_rollback(session, previous_transaction):
+    session.info.pop('txevents', None)
@@ -0,0 +1,324 @@
+# benchmarks/routes.py
+"""합성 데이터로 auth/admin/main 블루프린트의 모든 라우트를 측정하는 벤치마크
+
+    python benchmarks/routes.py --size 1k --concurrency 4 --requests 200 --output result.json
+
+결과 JSON에는 엔드포인트별 p50/p95/p99 지연 시간, 초당 요청 수, 요청당 쿼리 수가 들어간다.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from datetime import date, datetime
+from itertools import count
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+SIZES = {'1k': 1_000, '100k': 100_000, '1m': 1_000_000}
+
+BLUEPRINTS = ('auth', 'admin', 'main')
+
+CATEGORIES = 2
+GROUP_SIZE = 20
+BENCH_PASSWORD = 'bench-password'
+INSERT_CHUNK = 50_000
+
+# 삭제 라우트에 쓸 여분 사용자/그룹 수
+VICTIMS = 5_000
+
+# 엔드포인트별 URL 인자 값 (id가 아닌 인자)
+URL_VALUES = {
+    ('admin.export_table', 'table'): 'users',
+    ('admin.export_table', 'fmt'): 'csv',
+    ('admin.export_all_groups_data', 'fmt'): 'ndjson',
+}
+
+
+def _chunks(rows, size=INSERT_CHUNK):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def generate_roster(app, members):
+    """members명 규모의 카테고리/그룹/멤버/사용자 데이터를 생성"""
+    from app.models import db, User, Category, Group, Member, Job
+    from app.hashing import password_hasher
+
+    groups = max(1, members // GROUP_SIZE)
+    now = datetime.utcnow()
+    password_hash = password_hasher.hash(BENCH_PASSWORD)
+
+    with app.app_context():
+        db.create_all()
+        conn = db.session.connection()
+        conn.execute(Category.__table__.insert(),
+                     [{'id': i + 1, 'name': f'카테고리{i + 1}'} for i in range(CATEGORIES)])
+        conn.execute(Group.__table__.insert(),
+                     [{'id': i + 1, 'name': f'그룹{i + 1}', 'category_id': i % CATEGORIES + 1,
+                       'created_at': now} for i in range(groups + VICTIMS)])
+
+        # 사용자 id 1은 관리자, 2 ~ members+1은 멤버와 연결, 그 뒤는 삭제용
+        users = ({'id': i, 'name': f'user{i}', 'email': f'user{i}@bench.local',
+                  'password_hash': password_hash, 'is_admin': i == 1,
+                  'birthdate': date(2000, 1, 1), 'created_at': now}
+                 for i in range(1, members + VICTIMS + 2))
+        for chunk in _chunks(users):
+            conn.execute(User.__table__.insert(), chunk)
+
+        member_rows = ({'id': i, 'name': f'멤버{i}', 'department': '컴퓨터공학과',
+                        'blog_url': f'https://blog.example/{i}', 'group_id': (i - 1) % groups + 1,
+                        'user_id': i + 1}
+                       for i in range(1, members + 1))
+        for chunk in _chunks(member_rows):
+            conn.execute(Member.__table__.insert(), chunk)
+        # 작업 상세/취소/재시도 라우트용으로 끝난 작업 하나
+        conn.execute(Job.__table__.insert(), [{'id': 1, 'kind': 'move-members', 'params': '{}',
+                                                'status': 'succeeded', 'created_at': now}])
+        db.session.commit()
+
+    return {
+        'admin_id': 1,
+        'user_id': 2,
+        'member_id': 1,
+        'group_id': 1,
+        'cat_id': 1,
+        'job_id': 1,
+        'victim_users': list(range(members + 2, members + VICTIMS + 2)),
+        'victim_groups': list(range(groups + 1, groups + VICTIMS + 1)),
+    }
+
+
+class QueryCounter:
+    """스레드별 SQL 실행 횟수"""
+
+    def __init__(self, engine):
+        from sqlalchemy import event
+        self._local = threading.local()
+        event.listen(engine, 'before_cursor_execute', self._on_execute)
+
+    def _on_execute(self, *args):
+        self._local.count = getattr(self._local, 'count', 0) + 1
+
+    @property
+    def count(self):
+        return getattr(self._local, 'count', 0)
+
+
+class RoutePlan:
+    """엔드포인트 하나를 호출하기 위한 URL/메서드/폼 데이터 생성기"""
+
+    def __init__(self, app, rule, ids, unique):
+        self.app = app
+        self.rule = rule
+        self.endpoint = rule.endpoint
+        self.method = 'POST' if 'POST' in rule.methods and 'GET' not in rule.methods else 'GET'
+        self.ids = ids
+        self.unique = unique
+        if self.endpoint in ('auth.login', 'auth.register', 'admin.create_group'):
+            self.method = 'POST'
+        self.anonymous = self.endpoint in ('auth.login', 'auth.register')
+        # 값을 만들 수 없는 URL 인자 (예: 작업 종류, 프로파일 파일 이름) - 있으면 측정하지 않음
+        self.missing = sorted(arg for arg in rule.arguments
+                              if (self.endpoint, arg) not in URL_VALUES and arg not in ids)
+        self._lock = threading.Lock()
+
+    def _pop(self, key):
+        with self._lock:
+            pool = self.ids[key]
+            return pool.pop() if pool else None
+
+    def request_args(self):
+        """(url, data) 또는 더 보낼 수 없으면 None"""
+        from flask import url_for
+        values = {}
+        for arg in self.rule.arguments:
+            if (self.endpoint, arg) in URL_VALUES:
+                values[arg] = URL_VALUES[self.endpoint, arg]
+            elif arg == 'user_id' and self.endpoint == 'admin.delete_user':
+                values[arg] = self._pop('victim_users')
+            elif arg == 'group_id' and self.endpoint == 'admin.delete_group':
+                values[arg] = self._pop('victim_groups')
+            else:
+                values[arg] = self.ids[arg]
+            if values[arg] is None:
+                return None
+
+        n = next(self.unique)
+        data = None
+        if self.endpoint == 'auth.login':
+            data = {'username': f'user{self.ids["user_id"]}', 'password': BENCH_PASSWORD}
+        elif self.endpoint == 'auth.register':
+            data = {'username': f'new{n}', 'email': f'new{n}@bench.local', 'password': 'pw',
+                    'confirm_password': 'pw', 'birthdate': '2000-01-01'}
+        elif self.endpoint == 'admin.create_group':
+            data = {'name': f'bench-group-{n}', 'category_id': self.ids['cat_id']}
+        # 요청마다 새 앱 컨텍스트를 쓰도록 URL 생성에만 임시 컨텍스트 사용
+        with self.app.test_request_context():
+            url = url_for(self.endpoint, **values)
+        return url, data
+
+
+def _percentile(sorted_values, q):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _client(app, user_id=None):
+    client = app.test_client()
+    if user_id is not None:
+        # 로그인 해싱 비용을 빼기 위해 세션에 직접 사용자 id를 넣음
+        with client.session_transaction() as session:
+            session['_user_id'] = str(user_id)
+            session['_fresh'] = True
+    return client
+
+
+def run_endpoint(app, plan, counter, concurrency, total):
+    latencies = []
+    queries = []
+    statuses = Counter()
+    lock = threading.Lock()
+    remaining = count()
+
+    def worker():
+        client = None if plan.anonymous else _client(app, plan.ids['admin_id'])
+        while next(remaining) < total:
+            args = plan.request_args()
+            if args is None:
+                return
+            url, data = args
+            active = _client(app) if plan.anonymous else client
+            before = counter.count
+            started = time.perf_counter()
+            response = active.open(url, method=plan.method, data=data)
+            response.get_data()
+            elapsed = time.perf_counter() - started
+            response.close()
+            if plan.endpoint == 'auth.logout':
+                client = _client(app, plan.ids['admin_id'])
+            with lock:
+                latencies.append(elapsed)
+                queries.append(counter.count - before)
+                statuses[response.status_code] += 1
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'method': plan.method,
+        'requests': len(latencies),
+        'rps': len(latencies) / wall if wall else None,
+        'p50_ms': _ms(_percentile(latencies, 0.50)),
+        'p95_ms': _ms(_percentile(latencies, 0.95)),
+        'p99_ms': _ms(_percentile(latencies, 0.99)),
+        'queries_per_request': sum(queries) / len(queries) if queries else None,
+        'max_queries': max(queries) if queries else None,
+        'status': {str(code): n for code, n in sorted(statuses.items())},
+    }
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 3) if seconds is not None else None
+
+
+def _git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', choices=sorted(SIZES), default='1k')
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--requests', type=int, default=200, help='엔드포인트당 요청 수')
+    parser.add_argument('--endpoint', action='append', help='측정할 엔드포인트 (기본: 전부)')
+    parser.add_argument('--db', help='합성 데이터 DB 경로 (기본: 임시 파일)')
+    parser.add_argument('--output', default='bench_output.json')
+    parser.add_argument('--verbose', action='store_true', help='500 응답의 traceback 출력')
+    args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp(prefix='clubsite-bench-')
+    db_path = args.db or os.path.join(tmpdir, 'bench.db')
+    if os.path.exists(db_path):
+        os.remove(db_path)
+
+    # Config는 import 시점에 환경 변수를 읽음
+    os.environ['DATABASE_URL'] = f'sqlite:///{db_path}'
+    os.environ.setdefault('AUTH_RATE_LIMIT_ENABLED', '0')
+
+    from app import create_app
+    from app.models import db
+    app = create_app()
+    # 템플릿 오류 등 500 응답의 traceback 출력은 끔 (상태 코드로 집계됨)
+    app.logger.disabled = not args.verbose
+
+    members = SIZES[args.size]
+    started = time.perf_counter()
+    ids = generate_roster(app, members)
+    generate_seconds = time.perf_counter() - started
+
+    with app.app_context():
+        counter = QueryCounter(db.engine)
+
+    unique = count()
+    rules = sorted((rule for rule in app.url_map.iter_rules()
+                    if rule.endpoint.split('.')[0] in BLUEPRINTS),
+                   key=lambda rule: rule.endpoint)
+
+    results = {}
+    for rule in rules:
+        if args.endpoint and rule.endpoint not in args.endpoint:
+            continue
+        plan = RoutePlan(app, rule, ids, unique)
+        if plan.missing:
+            results[rule.endpoint] = {'skipped': f'URL 인자 값 없음: {", ".join(plan.missing)}'}
+            print(f'{rule.endpoint:<36} 건너뜀 ({results[rule.endpoint]["skipped"]})')
+            continue
+        results[rule.endpoint] = run_endpoint(app, plan, counter, args.concurrency, args.requests)
+        r = results[rule.endpoint]
+        print(f'{rule.endpoint:<36} {r["rps"] or 0:>9.1f} req/s  p50 {r["p50_ms"]}ms  '
+              f'p99 {r["p99_ms"]}ms  {r["queries_per_request"]} q/req  {r["status"]}')
+
+    report = {
+        'meta': {
+            'size': args.size,
+            'members': members,
+            'concurrency': args.concurrency,
+            'requests_per_endpoint': args.requests,
+            'generate_seconds': round(generate_seconds, 3),
+            'git_revision': _git_revision(),
+            'python': platform.python_version(),
+            'timestamp': datetime.utcnow().isoformat() + 'Z',
+        },
+        'endpoints': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2, sort_keys=True)
+    print(f'결과: {args.output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+# benchmarks/sqlite_concurrency.py
+"""여러 워커 프로세스가 동시에 읽기/쓰기를 할 때 SQLite 엔진 프로필별 처리량 비교
+
+    python benchmarks/sqlite_concurrency.py --workers 8 --seconds 10 --write-ratio 0.2
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date
+from multiprocessing import Process, Queue
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PROFILES = {
+    'default': {'SQLITE_PROFILE': 'default', 'SQLITE_READONLY_POOL': '0'},
+    'production': {'SQLITE_PROFILE': 'production', 'SQLITE_READONLY_POOL': '0'},
+    'production+readonly': {'SQLITE_PROFILE': 'production', 'SQLITE_READONLY_POOL': '1'},
+}
+
+
+def _make_app(db_path, env):
+    os.environ.update(env)
+    os.environ['DATABASE_URL'] = f'sqlite:///{db_path}'
+    # Config는 import 시점에 환경 변수를 읽으므로 워커마다 새로 import
+    from app import create_app
+    return create_app()
+
+
+def _prepare(db_path, env, users):
+    app = _make_app(db_path, env)
+    with app.app_context():
+        from app.models import db, User
+        db.create_all()
+        db.session.add_all(User(name=f'seed{i}', email=f'seed{i}@bench', password_hash='x',
+                                birthdate=date(2000, 1, 1)) for i in range(users))
+        db.session.commit()
+
+
+def _worker(worker_id, db_path, env, seconds, write_ratio, results):
+    from sqlalchemy.exc import OperationalError
+    app = _make_app(db_path, env)
+    from app.models import db, User
+
+    reads = writes = errors = 0
+    rng = random.Random(worker_id)
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        is_write = rng.random() < write_ratio
+        method = 'POST' if is_write else 'GET'
+        with app.test_request_context('/', method=method):
+            try:
+                if is_write:
+                    name = f'w{worker_id}-{writes}-{errors}'
+                    db.session.add(User(name=name, email=f'{name}@bench', password_hash='x',
+                                        birthdate=date(2000, 1, 1)))
+                    db.session.commit()
+                    writes += 1
+                else:
+                    User.query.filter_by(name=f'seed{rng.randrange(100)}').first()
+                    db.session.query(User.id).order_by(User.id.desc()).limit(20).all()
+                    reads += 1
+            except OperationalError:
+                # database is locked 등
+                db.session.rollback()
+                errors += 1
+            finally:
+                db.session.remove()
+    results.put((reads, writes, errors))
+
+
+def run_profile(name, env, workers, seconds, write_ratio):
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'bench.db')
+        setup = Process(target=_prepare, args=(db_path, env, 100))
+        setup.start()
+        setup.join()
+
+        results = Queue()
+        procs = [Process(target=_worker, args=(i, db_path, env, seconds, write_ratio, results))
+                 for i in range(workers)]
+        for proc in procs:
+            proc.start()
+        totals = [results.get() for _ in procs]
+        for proc in procs:
+            proc.join()
+
+    reads = sum(r for r, _, _ in totals)
+    writes = sum(w for _, w, _ in totals)
+    errors = sum(e for _, _, e in totals)
+    print(f'{name:<22} {reads / seconds:>10,.0f} reads/s {writes / seconds:>10,.0f} writes/s '
+          f'{errors:>8} locked errors')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 4)
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--write-ratio', type=float, default=0.2)
+    parser.add_argument('--profile', choices=sorted(PROFILES), action='append',
+                        help='비교할 프로필 (기본: 전부)')
+    args = parser.parse_args()
+
+    for name in args.profile or PROFILES:
+        run_profile(name, PROFILES[name], args.workers, args.seconds, args.write_ratio)
+
+
+if __name__ == '__main__':
+    main()
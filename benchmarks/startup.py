@@ -0,0 +1,121 @@
+# benchmarks/startup.py
+"""새 프로세스의 import 시간, create_app 시간, 첫 요청 지연을 측정하는 벤치마크
+
+    python benchmarks/startup.py --runs 5 --output startup.json
+
+cold는 빈 Jinja 바이트코드 캐시, warm은 `flask warm-templates`와 같은 예열 후의 캐시로 측정한다.
+각 측정은 모듈 캐시가 없는 새 파이썬 프로세스에서 한다.
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 로그인 없이 템플릿을 렌더링하는 페이지
+PATHS = ('/', '/auth/login', '/auth/register')
+
+
+def child(paths):
+    """자식 프로세스: 측정값을 JSON으로 출력"""
+    started = time.perf_counter()
+    sys.path.insert(0, ROOT)
+    from app import create_app
+    imported = time.perf_counter()
+    app = create_app()
+    created = time.perf_counter()
+
+    client = app.test_client()
+    first, second = {}, {}
+    for path in paths:
+        t = time.perf_counter()
+        status = client.get(path).status_code
+        first[path] = (time.perf_counter() - t, status)
+    for path in paths:
+        t = time.perf_counter()
+        client.get(path)
+        second[path] = time.perf_counter() - t
+
+    json.dump({
+        'import_seconds': imported - started,
+        'create_app_seconds': created - imported,
+        'first_request_seconds': {path: value[0] for path, value in first.items()},
+        'second_request_seconds': second,
+        'status': {path: value[1] for path, value in first.items()},
+    }, sys.stdout)
+
+
+def _run_child(env, paths):
+    output = subprocess.check_output([sys.executable, os.path.abspath(__file__), '--child', *paths],
+                                     env=env, cwd=ROOT)
+    return json.loads(output)
+
+
+def _warm(env):
+    code = ('import sys; sys.path.insert(0, %r)\n'
+            'from app import create_app\n'
+            'from app.startup import warm_templates\n'
+            'warm_templates(create_app())' % ROOT)
+    subprocess.check_call([sys.executable, '-c', code], env=env, cwd=ROOT)
+
+
+def _summary(samples):
+    def median(key, path=None):
+        values = [s[key][path] if path else s[key] for s in samples]
+        return round(statistics.median(values) * 1000, 3)
+
+    paths = list(samples[0]['first_request_seconds'])
+    return {
+        'import_ms': median('import_seconds'),
+        'create_app_ms': median('create_app_seconds'),
+        'first_request_ms': {path: median('first_request_seconds', path) for path in paths},
+        'second_request_ms': {path: median('second_request_seconds', path) for path in paths},
+        'status': samples[0]['status'],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5, help='모드별 프로세스 실행 횟수')
+    parser.add_argument('--output', default='startup_output.json')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('paths', nargs='*', default=list(PATHS))
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.paths)
+        return
+
+    tmpdir = tempfile.mkdtemp(prefix='clubsite-startup-')
+    env = dict(os.environ, DATABASE_URL=f'sqlite:///{os.path.join(tmpdir, "startup.db")}')
+    cache_dir = os.path.join(tmpdir, 'jinja_cache')
+
+    results = {}
+    for mode in ('cold', 'warm'):
+        samples = []
+        for _ in range(args.runs):
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            mode_env = dict(env, JINJA_BYTECODE_CACHE_DIR=cache_dir)
+            if mode == 'warm':
+                _warm(mode_env)
+            samples.append(_run_child(mode_env, args.paths))
+        results[mode] = _summary(samples)
+        r = results[mode]
+        print(f'{mode:<5} import {r["import_ms"]}ms  create_app {r["create_app_ms"]}ms  '
+              f'first request {r["first_request_ms"]}')
+
+    shutil.rmtree(tmpdir, ignore_errors=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({'runs': args.runs, 'python': sys.version.split()[0], 'results': results},
+                  f, ensure_ascii=False, indent=2)
+    print(f'결과: {args.output}')
+
+
+if __name__ == '__main__':
+    main()
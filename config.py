@@ -2,5 +2,103 @@ import os
 
 class Config:
     SECRET_KEY = os.getenv('SECRET_KEY', 'devkey')
-    SQLALCHEMY_DATABASE_URI = 'sqlite:///club.db'
-    SQLALCHEMY_TRACK_MODIFICATIONS = False
\ No newline at end of file
+    SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL', 'sqlite:///club.db')
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    
+    # SQLite 엔진 프로필: 'production' (WAL, pragma, 풀 조정) 또는 'default' (SQLAlchemy 기본값)
+    SQLITE_PROFILE = os.getenv('SQLITE_PROFILE', 'production')
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'mmap_size': 256 * 1024 * 1024,
+        'cache_size': -64 * 1024,  # 음수는 KiB 단위 (64MB)
+        'temp_store': 'MEMORY',
+    }
+    SQLITE_BUSY_TIMEOUT = int(os.getenv('SQLITE_BUSY_TIMEOUT', 5000))  # ms
+    SQLITE_POOL_SIZE = int(os.getenv('SQLITE_POOL_SIZE', 5))
+    SQLITE_MAX_OVERFLOW = int(os.getenv('SQLITE_MAX_OVERFLOW', 10))
+    SQLITE_POOL_TIMEOUT = int(os.getenv('SQLITE_POOL_TIMEOUT', 10))
+    
+    # GET/HEAD 요청의 조회를 별도의 읽기 전용 연결 풀로 보냄
+    SQLITE_READONLY_POOL = os.getenv('SQLITE_READONLY_POOL', '0').lower() in ('1', 'true', 'yes')
+    SQLITE_READONLY_POOL_SIZE = int(os.getenv('SQLITE_READONLY_POOL_SIZE', 10))
+    
+    # 비밀번호 해싱 (werkzeug 형식의 전체 method 문자열, 바꾸면 로그인 시 다시 해싱)
+    PASSWORD_HASH_METHOD = os.getenv('PASSWORD_HASH_METHOD', 'pbkdf2:sha256:600000')
+    PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', os.cpu_count() or 2))
+    PASSWORD_HASH_QUEUE_SIZE = int(os.getenv('PASSWORD_HASH_QUEUE_SIZE', 32))
+    PASSWORD_HASH_TIMEOUT = int(os.getenv('PASSWORD_HASH_TIMEOUT', 10))
+    
+    # 로그인/회원가입 요청 제한 (버킷 크기, 초당 충전량)
+    AUTH_RATE_LIMIT_ENABLED = os.getenv('AUTH_RATE_LIMIT_ENABLED', '1').lower() in ('1', 'true', 'yes')
+    AUTH_RATE_LIMIT_PER_ADDRESS = (20, 0.5)
+    AUTH_RATE_LIMIT_PER_USERNAME = (5, 0.1)
+    # 앞에 있는 리버스 프록시 수 (0이면 X-Forwarded-For를 믿지 않음), 버킷은 워커 프로세스마다 따로 있음
+    PROXY_FIX_X_FOR = int(os.getenv('PROXY_FIX_X_FOR', 0))
+    
+    # 빌드된 정적 파일 사용 여부 (manifest가 없으면 원본 파일 사용)
+    ASSET_PIPELINE = os.getenv('ASSET_PIPELINE', '1').lower() in ('1', 'true', 'yes')
+    
+    # 데이터 버전 기반 페이지 캐시
+    PAGE_CACHE_ENABLED = os.getenv('PAGE_CACHE_ENABLED', '1').lower() in ('1', 'true', 'yes')
+    PAGE_CACHE_SIZE = int(os.getenv('PAGE_CACHE_SIZE', 512))
+    
+    # 요청별 계측 (/admin/metrics, Server-Timing 헤더)
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', '1').lower() in ('1', 'true', 'yes')
+    # 워커별 히스토그램을 모아 합치는 디렉터리 (비어 있으면 instance/metrics), 기록 주기 (초)
+    METRICS_DIR = os.getenv('METRICS_DIR', '')
+    METRICS_FLUSH_INTERVAL = float(os.getenv('METRICS_FLUSH_INTERVAL', 1.0))
+    SERVER_TIMING_HEADER = os.getenv('SERVER_TIMING_HEADER', '1').lower() in ('1', 'true', 'yes')
+    
+    # 요청 프로파일러 저장소 (비어 있으면 instance/profiles)
+    PROFILE_DIR = os.getenv('PROFILE_DIR', '')
+    PROFILE_MAX_FILES = int(os.getenv('PROFILE_MAX_FILES', 50))
+    PROFILE_MAX_BYTES = int(os.getenv('PROFILE_MAX_BYTES', 50 * 1024 * 1024))
+    
+    # 멤버/사용자 검색 (SQLite FTS5, 사용할 수 없으면 자동으로 꺼짐)
+    SEARCH_ENABLED = os.getenv('SEARCH_ENABLED', '1').lower() in ('1', 'true', 'yes')
+    SEARCH_PER_PAGE = int(os.getenv('SEARCH_PER_PAGE', 20))
+    
+    # 관리자 일괄 작업 한 번에 처리할 최대 id 수
+    BULK_MAX_BATCH_SIZE = int(os.getenv('BULK_MAX_BATCH_SIZE', 500))
+    
+    # JSON API (/api/v1) 페이지 크기와 gzip 압축 기준 (바이트)
+    API_PER_PAGE = int(os.getenv('API_PER_PAGE', 50))
+    API_MAX_PER_PAGE = int(os.getenv('API_MAX_PER_PAGE', 200))
+    API_GZIP_MIN_SIZE = int(os.getenv('API_GZIP_MIN_SIZE', 1024))
+    
+    # 변경 피드 (/admin/changes) 한 번에 보낼 변경 수, long-poll 최대 대기와 확인 간격 (초)
+    CHANGES_BATCH_SIZE = int(os.getenv('CHANGES_BATCH_SIZE', 100))
+    CHANGES_MAX_BATCH_SIZE = int(os.getenv('CHANGES_MAX_BATCH_SIZE', 1000))
+    CHANGES_MAX_WAIT = int(os.getenv('CHANGES_MAX_WAIT', 25))
+    CHANGES_POLL_INTERVAL = float(os.getenv('CHANGES_POLL_INTERVAL', 1.0))
+    # flask prune-changes가 남기는 변경 기록 보관 일수 (0이면 지우지 않음)
+    CHANGES_RETENTION_DAYS = int(os.getenv('CHANGES_RETENTION_DAYS', 30))
+    
+    # 백그라운드 작업 (/admin/jobs): 프로세스당 작업 스레드 수 (0이면 flask run-jobs로만 실행),
+    # 한 작업의 최대 id 수, 실패 시 재시도 횟수/간격, 하트비트가 끊겼다고 보는 시간 (초)
+    JOBS_WORKERS = int(os.getenv('JOBS_WORKERS', 1))
+    JOBS_POLL_INTERVAL = float(os.getenv('JOBS_POLL_INTERVAL', 2.0))
+    JOBS_MAX_IDS = int(os.getenv('JOBS_MAX_IDS', 100000))
+    JOBS_MAX_ATTEMPTS = int(os.getenv('JOBS_MAX_ATTEMPTS', 3))
+    JOBS_RETRY_DELAY = int(os.getenv('JOBS_RETRY_DELAY', 30))
+    JOBS_STALE_AFTER = int(os.getenv('JOBS_STALE_AFTER', 300))
+    
+    # N+1 지연 로딩 감지와 뷰별 쿼리 예산 (개발/CI용): 'warn', 'log', 'raise' 또는 빈 값 (끔)
+    QUERY_WATCH = os.getenv('QUERY_WATCH', '')
+    QUERY_WATCH_NPLUSONE_THRESHOLD = int(os.getenv('QUERY_WATCH_NPLUSONE_THRESHOLD', 3))
+    
+    # Jinja 바이트코드 캐시 (flask warm-templates, 비어 있으면 instance/jinja_cache)
+    JINJA_BYTECODE_CACHE = os.getenv('JINJA_BYTECODE_CACHE', '1').lower() in ('1', 'true', 'yes')
+    JINJA_BYTECODE_CACHE_DIR = os.getenv('JINJA_BYTECODE_CACHE_DIR', '')
+    
+    # 사용자 캐시 (0이면 캐시 사용 안 함), TTL은 상한이고 사용자/멤버 커밋마다 모든 워커에서 무효화됨
+    IDENTITY_CACHE_SIZE = int(os.getenv('IDENTITY_CACHE_SIZE', 1024))
+    IDENTITY_CACHE_TTL = int(os.getenv('IDENTITY_CACHE_TTL', 300))
+    
+    # 권한 인덱스: 'index' (메모리 인덱스), 'db' (기존 방식), 'shadow' (비교용)
+    # 그룹/멤버 커밋마다 instance/acl_version이 올라가 모든 워커의 인덱스가 다시 만들어짐
+    ACL_INDEX_MODE = os.getenv('ACL_INDEX_MODE', 'index')
+    
+    # 관리자 대시보드 통계를 DB에서 다시 세는 주기 (초)
+    STATS_TTL = int(os.getenv('STATS_TTL', 300))
\ No newline at end of file
@@ -0,0 +1,30 @@
+# gunicorn.conf.py
+"""gunicorn 설정: 앱을 미리 만든 뒤 fork하는 prefork 워커"""
+import multiprocessing
+import os
+
+# 리버스 프록시 뒤에 둘 때는 PROXY_FIX_X_FOR=1 (프록시 단계 수)로 클라이언트 주소를 넘겨받음
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+# 비밀번호 해싱 등은 스레드 풀에서 돌리므로 워커당 스레드 몇 개로 대기 시간을 숨김
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+worker_class = 'gthread'
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 30))
+graceful_timeout = 30
+keepalive = 5
+
+# wsgi.py를 마스터에서 한 번 import (앱 생성, 모듈 import, 템플릿 예열)
+preload_app = True
+
+# 메모리 누수나 캐시 팽창 대비로 일정 요청마다 워커 교체
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', 10000))
+max_requests_jitter = max_requests // 10
+
+accesslog = os.getenv('GUNICORN_ACCESS_LOG', '-')
+
+
+def post_fork(server, worker):
+    # 마스터에서 열린 SQLite 연결을 워커가 함께 쓰지 않도록 버림
+    from app.startup import after_fork
+    from wsgi import app
+    after_fork(app)
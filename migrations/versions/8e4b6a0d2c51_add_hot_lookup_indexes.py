@@ -0,0 +1,46 @@
+"""add indexes for hot lookups
+
+Member.user_id (get_member_info, 로그인 사용자 조회), Member.group_id
+(view_members, 그룹 상세), Group.category_id (view_groups), Group.name
+(create_group 중복 확인), User.created_at (대시보드 최근 가입자).
+
+Revision ID: 8e4b6a0d2c51
+Revises: 3f9d1c2a7b10
+Create Date: 2026-10-18 09:05:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8e4b6a0d2c51'
+down_revision = '3f9d1c2a7b10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('member', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_member_user_id'), ['user_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_member_group_id'), ['group_id'], unique=False)
+
+    with op.batch_alter_table('group', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_group_category_id'), ['category_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_group_name'), ['name'], unique=False)
+
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_user_created_at'), ['created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_user_created_at'))
+
+    with op.batch_alter_table('group', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_group_name'))
+        batch_op.drop_index(batch_op.f('ix_group_category_id'))
+
+    with op.batch_alter_table('member', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_member_group_id'))
+        batch_op.drop_index(batch_op.f('ix_member_user_id'))
@@ -0,0 +1,32 @@
+"""add denormalized group.member_count
+
+그룹 목록에서 그룹마다 멤버를 모두 읽어 세던 것을 컬럼 하나로 대체.
+기존 행은 member 테이블을 세어 채운다 (이후 어긋나면 `flask backfill-member-counts`).
+
+Revision ID: c27a5e91f4d3
+Revises: 8e4b6a0d2c51
+Create Date: 2026-10-18 14:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c27a5e91f4d3'
+down_revision = '8e4b6a0d2c51'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('group', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('member_count', sa.Integer(), server_default='0', nullable=False))
+
+    op.execute('UPDATE "group" SET member_count = '
+               '(SELECT count(member.id) FROM member WHERE member.group_id = "group".id)')
+
+
+def downgrade():
+    with op.batch_alter_table('group', schema=None) as batch_op:
+        batch_op.drop_column('member_count')
@@ -0,0 +1,67 @@
+"""add change_log for the incremental change feed
+
+기존 행은 upsert 기록으로 미리 채워 since=0부터 읽으면 전체 명단을 받을 수 있게 한다.
+
+Revision ID: d5b8f3a16e02
+Revises: c27a5e91f4d3
+Create Date: 2026-10-18 16:40:00.000000
+
+"""
+import json
+from datetime import date, datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5b8f3a16e02'
+down_revision = 'c27a5e91f4d3'
+branch_labels = None
+depends_on = None
+
+# 이 리비전 시점의 피드 컬럼 (app.changefeed.feed_fields와 같음)
+FEED_COLUMNS = {
+    'category': (('id', sa.Integer), ('name', sa.String)),
+    'group': (('id', sa.Integer), ('name', sa.String), ('category_id', sa.Integer),
+              ('created_at', sa.DateTime)),
+    'member': (('id', sa.Integer), ('name', sa.String), ('department', sa.String),
+               ('blog_url', sa.String), ('group_id', sa.Integer), ('user_id', sa.Integer)),
+    'user': (('id', sa.Integer), ('name', sa.String), ('email', sa.String),
+             ('is_admin', sa.Boolean), ('created_at', sa.DateTime)),
+}
+
+
+def _json_value(value):
+    return value.isoformat() if isinstance(value, (date, datetime)) else value
+
+
+def upgrade():
+    change_log = op.create_table('change_log',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('table_name', sa.String(length=20), nullable=False),
+    sa.Column('row_id', sa.Integer(), nullable=False),
+    sa.Column('op', sa.String(length=10), nullable=False),
+    sa.Column('data', sa.Text(), nullable=True),
+    sa.Column('changed_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+    bind = op.get_bind()
+    now = datetime.utcnow()
+    for table_name, columns in FEED_COLUMNS.items():
+        table = sa.table(table_name, *(sa.column(name, type_()) for name, type_ in columns))
+        names = [name for name, _ in columns]
+        rows = bind.execute(sa.select(table).order_by(table.c.id)).mappings().all()
+        if rows:
+            op.bulk_insert(change_log, [{
+                'table_name': table_name,
+                'row_id': row['id'],
+                'op': 'upsert',
+                'data': json.dumps({name: _json_value(row[name]) for name in names}, ensure_ascii=False),
+                'changed_at': now,
+            } for row in rows])
+
+
+def downgrade():
+    op.drop_table('change_log')
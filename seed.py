@@ -1,55 +1,24 @@
-import csv
-import os
-from app import db
-from app.models import User, Category, Group, Member
-from werkzeug.security import generate_password_hash
+import argparse
+from app import create_app
+from app.loader import CSV_DIR, CHUNK_SIZE, load_all
 
-# CSV 파일 경로 설정
-CSV_DIR = os.path.join('app', 'static', 'data')
-
-def load_users():
-    with open(os.path.join(CSV_DIR, 'users.csv'), encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            user = User(
-                id=row['id'],
-                name=row['name'],
-                password_hash=generate_password_hash(row['password']),
-                is_admin=row['is_admin'].strip().lower() in ['1', 'true', 'yes']
-            )
-            db.session.add(user)
-
-def load_categories():
-    with open(os.path.join(CSV_DIR, 'categories.csv'), encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            db.session.add(Category(id=row['id'], name=row['name']))
-
-def load_groups():
-    with open(os.path.join(CSV_DIR, 'groups.csv'), encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            db.session.add(Group(id=row['id'], name=row['name'], category_id=row['category_id']))
+def main():
+    parser = argparse.ArgumentParser(description='CSV 데이터를 DB에 적재합니다. (여러 번 실행해도 안전)')
+    parser.add_argument('--csv-dir', default=CSV_DIR, help='CSV 파일 경로')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='한 번에 넣을 행 수')
+    parser.add_argument('--workers', type=int, default=None, help='비밀번호 해싱 프로세스 수')
+    args = parser.parse_args()
 
-def load_members():
-    with open(os.path.join(CSV_DIR, 'members.csv'), encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            db.session.add(Member(
-                id=row['id'],
-                name=row['name'],
-                department=row['department'],
-                blog_url=row['blog_url'],
-                group_id=row['group_id']
-            ))
+    app = create_app()
+    with app.app_context():
+        from app.models import db
+        db.create_all()
 
-def main():
-    load_categories()
-    load_groups()
-    load_members()
-    load_users()
-    db.session.commit()
+        results = load_all(args.csv_dir, args.chunk_size, args.workers)
+        for stats in results:
+            print(f'{stats.table:<10} {stats.rows:>8} rows  {stats.changed:>8} changed  '
+                  f'{stats.seconds:8.2f}s  {stats.rows_per_sec:>12,.0f} rows/s'
+                  + (f'  (유일 값이 겹쳐 {len(stats.skipped)}개 행 건너뜀)' if stats.skipped else ''))
 
 if __name__ == '__main__':
     main()
-    db.create_all()
\ No newline at end of file
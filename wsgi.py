@@ -0,0 +1,13 @@
+# wsgi.py
+"""운영용 WSGI 진입점 (gunicorn -c gunicorn.conf.py wsgi:app)
+
+gunicorn.conf.py의 preload_app으로 마스터 프로세스에서 한 번만 앱을 만들고
+모듈 import, 템플릿 컴파일, 첫 명단 스냅샷까지 끝낸 뒤 워커를 fork한다.
+"""
+from app import create_app
+from app.startup import preload_modules, warm_snapshot, warm_templates
+
+app = create_app()
+preload_modules()
+warm_templates(app)
+warm_snapshot(app)